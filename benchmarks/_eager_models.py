@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import requests
+
+from holybooks import QuranTranslation
+
+# The Quran models as they were before they became slotted and lazy, trimmed to what bench_models.py
+# touches. Every Surah.ayats access rebuilds its ayahs, and every Ayah opens a requests.Session.
+
+
+class Quran:
+    def __init__(self, **kwargs) -> None:
+        self.data = kwargs.pop("data")
+        self.__session = kwargs.get("session", requests.Session())
+        self._surahs = [Surah(data=d, session=self.__session) for d in self.data.get("surahs")]
+        self.name = "Quran"
+        self.translation = QuranTranslation(**self.data.pop("translation"))
+
+    @property
+    def surahs(self) -> list:
+        return self._surahs
+
+
+class Surah:
+    def __init__(self, **kwargs) -> None:
+        self.raw_data = kwargs.pop("data")
+        self.data = self.raw_data.pop("data", None) or self.raw_data
+        self.translation = QuranTranslation(**self.data.get("translation"))
+        self.__session = kwargs.get("session", None)
+        self.number = self.data.get("number")
+
+    @property
+    def ayats(self) -> list:
+        return [Ayah(data=data, surah=self, session=self.__session) for data in self.data.get("ayahs")]
+
+
+class Ayah:
+    def __init__(self, **kwargs) -> None:
+        self.raw_data = kwargs.pop("data")
+        self.data = self.raw_data.get("data") or self.raw_data
+        self.translation = QuranTranslation(**self.data.get("translation"))
+        self.__session = kwargs.get("session", requests.Session())
+        self._surah = kwargs.pop("surah", None) or Surah(data=self.raw_data.get("surah") or self.data.get("surah"), session=self.__session)
+        self.text = self.data.get("text")
+        self.number = self.data.get("number")
+
+    @property
+    def surah(self) -> Surah:
+        return self._surah
+
+
+def parse_book(payload: dict) -> dict:
+    # The old Surah.ayats needed a translation on every ayah, the /quran payload only has it on the edition.
+    data = payload["data"]
+    edition = data["edition"]
+    data["translation"] = edition
+    for surah in data["surahs"]:
+        surah["translation"] = edition
+        for ayah in surah["ayahs"]:
+            ayah["translation"] = edition
+    return data
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import os
+
+from typing import TYPE_CHECKING
+from _payloads import AYAH_COUNTS, edition, quran_payload
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Tuple
+
+
+__all__ = (
+    "FIXTURES_DIR",
+    "QURAN_HOST",
+    "BIBLE_HOST",
+    "FIXTURES",
+    "fixture_file",
+    "synthetic",
+    "load",
+    "routes",
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+QURAN_HOST = "http://api.alquran.cloud"
+BIBLE_HOST = "https://bible-api.com"
+
+# name -> (host, path and query), the paths are the ones Client requests with the default translations.
+FIXTURES: Dict[str, Tuple[str, str]] = {
+    "quran": (QURAN_HOST, "/v1/quran/en.asad"),
+    "surah": (QURAN_HOST, "/v1/surah/2/en.asad"),
+    "ayah": (QURAN_HOST, "/v1/ayah/2:255/en.asad"),
+    "juz": (QURAN_HOST, "/v1/juz/30/en.asad"),
+    "manzil": (QURAN_HOST, "/v1/manzil/7/en.asad"),
+    "ruku": (QURAN_HOST, "/v1/ruku/7/en.asad"),
+    "page": (QURAN_HOST, "/v1/page/50/en.asad"),
+    "hizb_quarter": (QURAN_HOST, "/v1/hizbQuarter/20/en.asad"),
+    "sajda": (QURAN_HOST, "/v1/sajda/en.asad"),
+    "search": (QURAN_HOST, "/v1/search/grace/all/en.asad"),
+    "bible_chapter": (BIBLE_HOST, "/john3?translation=kjv"),
+    "bible_verse": (BIBLE_HOST, "/john3:16?translation=kjv"),
+    "bible_verses": (BIBLE_HOST, "/john3:16-21?translation=kjv"),
+}
+
+_SURAH_FIELDS = ("number", "name", "englishName", "englishNameTranslation", "revelationType")
+
+
+def fixture_file(name: str) -> str:
+    return os.path.join(FIXTURES_DIR, name + ".json")
+
+
+def _surah_meta(surah: dict) -> dict:
+    meta = {key: surah[key] for key in _SURAH_FIELDS}
+    meta["numberOfAyahs"] = AYAH_COUNTS[surah["number"] - 1]
+    return meta
+
+
+def _flat(quran: dict) -> List[dict]:
+    return [
+        {**ayah, "surah": _surah_meta(surah)}
+        for surah in quran["data"]["surahs"]
+        for ayah in surah["ayahs"]
+    ]
+
+
+def _ok(data) -> dict:
+    return {"code": 200, "status": "OK", "data": data}
+
+
+def _bible(reference: str, chapter: int, verses: range) -> dict:
+    verses = [
+        {
+            "book_id": "JHN",
+            "book_name": "John",
+            "chapter": chapter,
+            "verse": verse,
+            "text": f"And this is the text of John {chapter}:{verse}, as it reads in the King James Version.\n",
+        }
+        for verse in verses
+    ]
+    return {
+        "reference": reference,
+        "verses": verses,
+        "text": "".join(verse["text"] for verse in verses),
+        "translation_id": "kjv",
+        "translation_name": "King James Version",
+        "translation_note": "Public Domain",
+    }
+
+
+def synthetic(name: str) -> dict:
+    # Same shapes as the live APIs, built from the made up edition in _payloads.
+    quran = quran_payload()
+    ayahs = _flat(quran)
+    edition_ = edition()
+
+    def division(field: str, value: int) -> dict:
+        return _ok({"number": value, "ayahs": [a for a in ayahs if a[field] == value], "edition": edition_})
+
+    if name == "quran":
+        return quran
+    if name == "surah":
+        surah = quran["data"]["surahs"][1]
+        return _ok({**_surah_meta(surah), "ayahs": surah["ayahs"], "edition": edition_})
+    if name == "ayah":
+        return _ok({**ayahs[261], "edition": edition_})
+    if name == "juz":
+        return division("juz", 30)
+    if name == "manzil":
+        return division("manzil", 7)
+    if name == "ruku":
+        return division("ruku", 7)
+    if name == "page":
+        return division("page", 50)
+    if name == "hizb_quarter":
+        return division("hizbQuarter", 20)
+    if name == "sajda":
+        sajdas = [a for a in ayahs if a["number"] % 400 == 0]
+        return _ok({
+            "ayahs": [{**a, "sajda": {"id": i, "recommended": True, "obligatory": False}} for i, a in enumerate(sajdas, 1)],
+            "edition": edition_
+        })
+    if name == "search":
+        matches = [{**a, "edition": edition_} for a in ayahs if "grace" in a["text"].split()]
+        return _ok({"count": len(matches), "matches": matches})
+    if name == "bible_chapter":
+        return _bible("John 3", 3, range(1, 37))
+    if name == "bible_verse":
+        return _bible("John 3:16", 3, range(16, 17))
+    if name == "bible_verses":
+        return _bible("John 3:16-21", 3, range(16, 22))
+    raise KeyError(name)
+
+
+def load(name: str) -> Tuple[bytes, bool]:
+    # Returns the body and whether it was recorded from the live API.
+    path = fixture_file(name)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read(), True
+    return json.dumps(synthetic(name), ensure_ascii=False).encode("utf-8"), False
+
+
+def routes(names: Optional[List[str]] = None) -> Tuple[Dict[str, Tuple[int, bytes]], List[str]]:
+    table, recorded = {}, []
+    for name in names or FIXTURES:
+        body, real = load(name)
+        table[FIXTURES[name][1]] = (200, body)
+        if real:
+            recorded.append(name)
+    return table, recorded
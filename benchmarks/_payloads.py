@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List
+
+
+__all__ = (
+    "AYAH_COUNTS",
+    "edition",
+    "quran_payload",
+)
+
+AYAH_COUNTS: List[int] = [
+    7, 286, 200, 176, 120, 165, 206, 75, 129, 109, 123, 111, 43, 52, 99, 128, 111, 110, 98, 135,
+    112, 78, 118, 64, 77, 227, 93, 88, 69, 60, 34, 30, 73, 54, 45, 83, 182, 88, 75, 85,
+    54, 53, 89, 59, 37, 35, 38, 29, 18, 45, 60, 49, 62, 55, 78, 96, 29, 22, 24, 13,
+    14, 11, 11, 18, 12, 12, 30, 52, 52, 44, 28, 28, 20, 56, 40, 31, 50, 40, 46, 42,
+    29, 19, 36, 25, 22, 17, 19, 26, 30, 20, 15, 21, 11, 8, 8, 19, 5, 8, 8, 11,
+    11, 8, 3, 9, 5, 4, 7, 3, 6, 3, 5, 4, 5, 6,
+]
+
+_WORDS = (
+    "in the name of god the most gracious the dispenser of grace all praise is due to "
+    "sustainer worlds day judgment thee alone do we worship and unto thee we turn for aid"
+).split()
+
+
+def edition(identifier: str = "en.asad") -> dict:
+    return {
+        "identifier": identifier,
+        "language": identifier.split(".")[0],
+        "name": identifier,
+        "englishName": identifier,
+        "format": "text",
+        "type": "translation",
+        "direction": "ltr",
+    }
+
+
+def _text(number: int) -> str:
+    return " ".join(_WORDS[(number * 7 + i * 3) % len(_WORDS)] for i in range(12 + number % 24))
+
+
+def quran_payload(identifier: str = "en.asad") -> dict:
+    # Same shape as http://api.alquran.cloud/v1/quran/{edition}, with made up text and divisions.
+    surahs = []
+    number = 0
+    for surah, count in enumerate(AYAH_COUNTS, 1):
+        ayahs = []
+        for in_surah in range(1, count + 1):
+            number += 1
+            ayahs.append({
+                "number": number,
+                "text": _text(number),
+                "numberInSurah": in_surah,
+                "juz": min(30, 1 + number // 208),
+                "manzil": min(7, 1 + number // 891),
+                "page": min(604, 1 + number // 11),
+                "ruku": min(556, 1 + number // 12),
+                "hizbQuarter": min(240, 1 + number // 26),
+                "sajda": False,
+            })
+        surahs.append({
+            "number": surah,
+            "name": f"Surah {surah}",
+            "englishName": f"Surah {surah}",
+            "englishNameTranslation": f"Surah {surah}",
+            "revelationType": "Meccan" if surah % 2 else "Medinan",
+            "ayahs": ayahs,
+        })
+    return {"code": 200, "status": "OK", "data": {"surahs": surahs, "edition": edition(identifier)}}
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Dict, Optional, Tuple
+
+
+__all__ = (
+    "StandInServer",
+)
+
+
+class StandInServer:
+    # Serves canned JSON bodies on 127.0.0.1 so the real HTTPClient code runs without network.
+    def __init__(self, routes: Callable[[str], Optional[Tuple[int, bytes]]]) -> None:
+        self.routes = routes
+        self.hits = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                server.hits += 1
+                found = server.routes(self.path)
+                status, body = found if found is not None else (404, b'{"code": 404, "status": "NOT FOUND", "data": "Not found."}')
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def __enter__(self) -> StandInServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
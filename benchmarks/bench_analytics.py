@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from holybooks import QuranCorpus, term_stats, concordance, corpus_documents
+from _payloads import quran_payload
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time n-gram statistics and concordances over synthetic editions.")
+    parser.add_argument("--editions", type=int, default=4)
+    parser.add_argument("--processes", type=int, nargs="*", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    corpus = QuranCorpus()
+    for i in range(args.editions):
+        payload = quran_payload()
+        payload["data"]["edition"]["identifier"] = f"en.synthetic{i}"
+        corpus.store(payload)
+    documents = list(corpus_documents(corpus))
+    print(f"{args.editions} editions, {len(documents):,} ayahs, {os.cpu_count()} CPU(s)")
+
+    for processes in dict.fromkeys(args.processes):
+        start = time.perf_counter()
+        stats = term_stats(documents, ngrams=(1, 2, 3), processes=processes)
+        counted = time.perf_counter() - start
+
+        start = time.perf_counter()
+        lines = concordance(documents, "grace", processes=processes)
+        searched = time.perf_counter() - start
+        tokens = sum(s.tokens for s in stats.values())
+        print(f"processes={processes}: term_stats {counted:.2f} s ({tokens / counted:,.0f} tokens/s), concordance {searched:.2f} s ({len(lines):,} lines)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from holybooks import Client
+from _fixtures import routes
+from _server import StandInServer
+
+# name -> (fixture, call). Every call goes through HTTPClient, the parsers and the models.
+SCENARIOS = {
+    "fetch_quran": ("quran", lambda c: [a for s in c.fetch_quran().surahs for a in s.ayats]),
+    "stream_quran": ("quran", lambda c: [len(s.ayats) for s in c.stream_quran()]),
+    "fetch_surah": ("surah", lambda c: c.fetch_surah(2).ayats),
+    "fetch_ayah": ("ayah", lambda c: c.fetch_ayah("2:255").surah),
+    "fetch_ayah(juz)": ("juz", lambda c: c.fetch_ayah(juz=30)),
+    "fetch_ayah(manzil)": ("manzil", lambda c: c.fetch_ayah(manzil=7)),
+    "fetch_ayah(ruku)": ("ruku", lambda c: c.fetch_ayah(ruku=7)),
+    "fetch_ayah(page)": ("page", lambda c: c.fetch_ayah(page=50)),
+    "fetch_ayah(hizb_quarter)": ("hizb_quarter", lambda c: c.fetch_ayah(hizb_quarter=20)),
+    "fetch_ayah(sajda)": ("sajda", lambda c: c.fetch_ayah(sajda=True)),
+    "search": ("search", lambda c: c.search("grace")),
+    "fetch_chapter": ("bible_chapter", lambda c: c.fetch_chapter("john", 3).verses),
+    "fetch_verse": ("bible_verse", lambda c: c.fetch_verse("john", "3:16")),
+    "fetch_verse(range)": ("bible_verses", lambda c: c.fetch_verse("john", "3:16-21")),
+}
+
+
+def percentile(values: list, q: float) -> float:
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(q * (len(values) - 1))))
+    return values[index]
+
+
+def measure(client: Client, call, rounds: int, min_time: float) -> dict:
+    call(client)
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < rounds or time.perf_counter() - started < min_time:
+        start = time.perf_counter()
+        call(client)
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    call(client)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "calls": len(timings),
+        "ops": len(timings) / sum(timings),
+        "p50": percentile(timings, 0.5),
+        "p90": percentile(timings, 0.9),
+        "p99": percentile(timings, 0.99),
+        "peak": peak,
+    }
+
+
+def report(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    print(f"{'scenario':<26}{'ops/s':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'peak MiB':>10}")
+    for name, r in results.items():
+        line = (f"{name:<26}{r['ops']:>10.1f}{r['p50'] * 1000:>10.2f}{r['p90'] * 1000:>10.2f}"
+                f"{r['p99'] * 1000:>10.2f}{r['peak'] / 1024 / 1024:>10.2f}")
+        old = baseline.get(name)
+        if old is not None:
+            slower = r["p50"] / old["p50"] - 1
+            heavier = r["peak"] / old["peak"] - 1 if old["peak"] else 0.0
+            line += f"  p50 {slower:+.0%} peak {heavier:+.0%}"
+            if slower > tolerance or heavier > tolerance:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay recorded API payloads through Client on a local stand-in server.")
+    parser.add_argument("scenarios", nargs="*", help="scenario names or regular expressions, all by default")
+    parser.add_argument("--rounds", type=int, default=30, help="minimum timed calls per scenario")
+    parser.add_argument("--min-time", type=float, default=1.0, help="minimum seconds per scenario")
+    parser.add_argument("--json", metavar="FILE", help="write the results to FILE")
+    parser.add_argument("--baseline", metavar="FILE", help="compare with results written by --json")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50/peak increase over the baseline")
+    args = parser.parse_args()
+
+    names = [
+        name for name in SCENARIOS
+        if not args.scenarios or any(re.fullmatch(p, name) or p == name for p in args.scenarios)
+    ]
+    table, recorded = routes(sorted({SCENARIOS[name][0] for name in names}))
+    print(f"fixtures: {', '.join(recorded) or 'none'} recorded, the rest synthetic (run record.py with network to record)")
+
+    def route(path: str):
+        return table.get(re.sub("/{2,}", "/", path).replace("%20", " "))
+
+    results = {}
+    with StandInServer(route) as server:
+        client = Client(coalesce=False)
+        client.http_client.base_quran_url = server.url + "/v1"
+        client.http_client.base_bible_url = server.url
+        for name in names:
+            results[name] = measure(client, SCENARIOS[name][1], args.rounds, args.min_time)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+    regressions = report(results, baseline, args.tolerance)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"python": sys.version.split()[0], "recorded": recorded, "results": results}, f, indent=2)
+
+    if regressions:
+        sys.exit(f"{len(regressions)} scenario(s) regressed by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from holybooks import Client
+from holybooks.decoder import get_decoder
+from _payloads import quran_payload
+from _server import StandInServer
+
+
+def _response_json(body: bytes) -> dict:
+    # The decoding before the decoder option: requests' Response.json() on the raw body, then a copy of
+    # the result with the session spliced in.
+    import requests
+
+    res = requests.Response()
+    res._content = body
+    return {**res.json(), "session": None}
+
+
+def run(server: StandInServer, decoder: str, rounds: int) -> str:
+    client = Client(decoder=_response_json if decoder == "before" else get_decoder(decoder))
+    client.http_client.base_quran_url = server.url + "/v1"
+    client.fetch_quran()
+
+    timings = []
+    cpu = []
+    for _ in range(rounds):
+        start, start_cpu = time.perf_counter(), time.process_time()
+        client.fetch_quran()
+        timings.append(time.perf_counter() - start)
+        cpu.append(time.process_time() - start_cpu)
+
+    tracemalloc.start()
+    client.fetch_quran()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return f"{decoder:>8}: best {min(timings) * 1000:.1f} ms, cpu {min(cpu) * 1000:.1f} ms, peak {peak / 1024 / 1024:.2f} MiB"
+
+
+def main(rounds: int = 20) -> None:
+    body = json.dumps(quran_payload(), ensure_ascii=False).encode("utf-8")
+    print(f"fetch_quran full edition ({len(body) / 1024 / 1024:.1f} MiB body), before is the baseline")
+    with StandInServer(lambda path: (200, body) if path.startswith("/v1/quran/") else None) as server:
+        for decoder in ("before", "json", "orjson", "msgspec"):
+            try:
+                print(run(server, decoder, rounds))
+            except ImportError:
+                print(f"{decoder:>8}: not installed")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time fetch_quran with each JSON decoder against the old res.json() path.")
+    parser.add_argument("--rounds", type=int, default=20)
+    main(parser.parse_args().rounds)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from holybooks import Client, ResponseCache, Hooks, MetricsCollector
+from _payloads import edition
+from _server import StandInServer
+
+AYAH = json.dumps({
+    "code": 200,
+    "status": "OK",
+    "data": {
+        "number": 262,
+        "text": "God - there is no deity save Him, the Ever-Living, the Self-Subsistent Fount of All Being.",
+        "edition": edition("en.asad"),
+        "surah": {"number": 2, "name": "البقرة", "englishName": "Al-Baqara", "englishNameTranslation": "The Cow", "numberOfAyahs": 286, "revelationType": "Medinan"},
+        "numberInSurah": 255, "juz": 3, "manzil": 1, "page": 42, "ruku": 35, "hizbQuarter": 17, "sajda": False,
+    },
+}).encode("utf-8")
+
+
+def run(server: StandInServer, name: str, hooks, cached: bool, rounds: int) -> str:
+    client = Client(hooks=hooks, cache=ResponseCache() if cached else None, coalesce=False)
+    client.http_client.base_quran_url = server.url + "/v1"
+    client.fetch_ayah("2:255")
+
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            client.fetch_ayah("2:255")
+        best = min(best, (time.perf_counter() - start) / rounds)
+    return f"{name:>10}: {best * 1e6:.1f} us per fetch_ayah"
+
+
+def main() -> None:
+    with StandInServer(lambda path: (200, AYAH) if path.startswith("/v1/ayah/") else None) as server:
+        for cached, rounds in ((True, 20000), (False, 2000)):
+            print("cache hits" if cached else "local requests")
+            print(run(server, "no hooks", None, cached, rounds))
+            print(run(server, "empty", Hooks(), cached, rounds))
+            print(run(server, "collector", MetricsCollector().hooks, cached, rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> (statement, budget in ms). Each runs in a fresh interpreter and only the statement is timed.
+# A statement with a budget also fails if it loads any of DEPENDENCIES.
+STATEMENTS = {
+    "import holybooks": ("import holybooks", 15.0),
+    "holybooks.NotFound": ("import holybooks; holybooks.NotFound", 15.0),
+    "holybooks.cli": ("import holybooks.cli", 25.0),
+    "holybooks.models": ("import holybooks.models", 40.0),
+    "holybooks.export": ("import holybooks.export", 40.0),
+    "holybooks.Client": ("from holybooks import Client", 150.0),
+    "Client()": ("from holybooks import Client; Client()", None),
+}
+
+DEPENDENCIES = ("requests", "urllib3", "httpx", "aiohttp", "numpy", "pyarrow")
+HEAVY = (*DEPENDENCIES, "holybooks.client", "holybooks.models")
+
+
+def measure(statement: str, runs: int) -> float:
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout))
+    return statistics.median(samples)
+
+
+def loaded(statement: str) -> list:
+    code = f"import sys; {statement}; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return out.stdout.split()
+
+
+def main(runs: int = 20) -> int:
+    over = 0
+    for name, (statement, budget) in STATEMENTS.items():
+        median = measure(statement, runs)
+        modules = loaded(statement)
+        verdict = ""
+        if budget is not None:
+            verdict = "OVER BUDGET" if median > budget else "LOADS DEPS" if set(modules) & set(DEPENDENCIES) else "ok"
+            over += verdict != "ok"
+        limit = "-" if budget is None else f"{budget:.0f} ms"
+        print(f"{name:>20}: {median:7.1f} ms (budget {limit:>6}) {verdict:<12} loads: {', '.join(modules) or 'nothing heavy'}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import time of holybooks, fails if a budget is exceeded.")
+    parser.add_argument("--runs", type=int, default=20)
+    sys.exit(main(parser.parse_args().runs))
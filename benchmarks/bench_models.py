@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from holybooks import HTTPClient, Quran
+from _payloads import quran_payload
+import _eager_models
+
+
+def build(payload: dict, baseline: bool = False) -> tuple:
+    if baseline:
+        quran = _eager_models.Quran(data=_eager_models.parse_book(payload))
+    else:
+        quran = Quran(**HTTPClient()._parse_book(payload))
+    ayahs = [ayah for surah in quran.surahs for ayah in surah.ayats]
+    # A reader revisits surahs, every access used to rebuild all of its ayahs.
+    for surah in quran.surahs:
+        for ayah in surah.ayats:
+            ayah.surah.number
+    return quran, ayahs
+
+
+def main(rounds: int = 5, baseline: bool = False) -> None:
+    timings = []
+    for _ in range(rounds):
+        payload = quran_payload()
+        start = time.perf_counter()
+        build(payload, baseline)
+        timings.append(time.perf_counter() - start)
+
+    payload = quran_payload()
+    tracemalloc.start()
+    result = build(payload, baseline)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    print(f"{'before' if baseline else 'after'}: fetch_quran model build ({len(payload['data']['surahs'])} surahs, all ayahs visited twice): "
+          f"best {min(timings) * 1000:.1f} ms, mean {sum(timings) / len(timings) * 1000:.1f} ms, "
+          f"retained {current / 1024 / 1024:.2f} MiB, peak {peak / 1024 / 1024:.2f} MiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a full edition into models and visit every ayah twice.")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--baseline", action="store_true", help="also run the old eager models for comparison")
+    args = parser.parse_args()
+    if args.baseline:
+        main(args.rounds, baseline=True)
+    main(args.rounds)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from holybooks.references import BIBLE_BOOKS, parse_references
+from holybooks.references import _parse_item
+
+FORMS = (
+    "{name} {c}:{v}",
+    "{alias} {c}:{v}-{w}",
+    "{id} {c}:{v}-{w},{x}",
+    "{alias} {c}",
+    "{name} {c}:{v}; {c}:{w}",
+    "{alias}. {c}:{v}–{w}; {other} {c2}:{v2}",
+)
+
+
+def references(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    result = []
+    for _ in range(count):
+        book, other = rng.choice(BIBLE_BOOKS), rng.choice(BIBLE_BOOKS)
+        c, c2 = rng.randint(1, book.chapters), rng.randint(1, other.chapters)
+        last = book.verse_count(c)
+        v = rng.randint(1, last)
+        w = rng.randint(v, last)
+        result.append(rng.choice(FORMS).format(
+            name=book.name,
+            alias=rng.choice(book.aliases or (book.name,)),
+            id=book.id,
+            other=other.name,
+            c=c,
+            c2=c2,
+            v=v,
+            w=w,
+            x=rng.randint(w, last),
+            v2=rng.randint(1, other.verse_count(c2)),
+        ))
+    return result
+
+
+def run(label: str, texts: list) -> None:
+    start = time.perf_counter()
+    for text in texts:
+        parse_references(text)
+    elapsed = time.perf_counter() - start
+    print(f"{label:>24}: {len(texts):,} in {elapsed:.2f} s, {len(texts) / elapsed:,.0f} references/s, {elapsed / len(texts) * 1e6:.2f} us each")
+
+
+def main(count: int = 1_000_000) -> None:
+    # Distinct strings defeat the parse cache, the repeated set is what a busy server mostly sees.
+    distinct = references(count)
+    _parse_item.cache_clear()
+    run("distinct", distinct)
+    repeated = references(5_000, seed=1) * (count // 5_000)
+    _parse_item.cache_clear()
+    run("repeated (5,000 unique)", repeated)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from holybooks import QURAN_STRUCTURE
+
+
+def main(number: int = 200_000) -> None:
+    rng = random.Random(0)
+    citations = [QURAN_STRUCTURE.citation(rng.randint(1, QURAN_STRUCTURE.ayahs)) for _ in range(1024)]
+    cases = {
+        "parse": lambda c: QURAN_STRUCTURE.parse(c),
+        "division(juz)": lambda c: QURAN_STRUCTURE.division("juz", c),
+        "locate": lambda c: QURAN_STRUCTURE.locate(c),
+    }
+    for name, case in cases.items():
+        items = iter(citations * (number // len(citations) + 1))
+        elapsed = timeit.timeit(lambda: case(next(items)), number=number)
+        print(f"{name:>16}: {elapsed / number * 1e6:.2f} us per citation")
+
+    elapsed = timeit.timeit(lambda: QURAN_STRUCTURE.citations("juz", 30), number=1000)
+    print(f"{'citations(juz)':>16}: {elapsed:.2f} ms per juz")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from holybooks import Client, Urllib3Transport
+from _fixtures import routes
+from _server import StandInServer
+
+# name -> client factory. Coalescing and caching are off so every call reaches the transport.
+MODES = {
+    "shared session": lambda: Client(coalesce=False),
+    "session per thread": lambda: Client(coalesce=False, session_per_thread=True),
+    "urllib3 pool": lambda: Client(coalesce=False, transport=Urllib3Transport()),
+}
+
+
+def _point(client: Client, url: str) -> Client:
+    client.http_client.base_quran_url = url + "/v1"
+    client.http_client.base_bible_url = url
+    return client
+
+
+def _hammer(client: Client, threads: int, calls: int) -> tuple:
+    errors = []
+    barrier = threading.Barrier(threads)
+
+    def work() -> None:
+        barrier.wait()
+        for _ in range(calls):
+            try:
+                client.fetch_ayah("2:255").surah
+            except Exception as e:
+                errors.append(e)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start, errors
+
+
+def _inherited(client: Client) -> int:
+    # Connections the transport still holds, counted in the child right after the fork.
+    transport = client.http_client.transport
+    pools = getattr(transport, "_pools", None)
+    if pools is not None:
+        return sum(len(manager.pools) for manager in pools.values())
+    sessions = list(getattr(transport, "_sessions", ())) + ([] if transport.per_thread else [transport.session])
+    return sum(len(adapter.poolmanager.pools) for session in sessions for adapter in session.adapters.values())
+
+
+def fork_check(client: Client, threads: int, calls: int) -> str:
+    # The parent keeps calling while a child forked mid-traffic reuses the same client from several threads.
+    if not hasattr(os, "fork"):
+        return "skipped (no fork)"
+
+    background = threading.Thread(target=_hammer, args=(client, threads, calls), daemon=True)
+    background.start()
+    pid = os.fork()
+    if pid == 0:
+        # A lock or in-flight call inherited from the parent shows up as a hang, so the child gives up after a while.
+        inherited = _inherited(client)
+        result = []
+        worker = threading.Thread(target=lambda: result.append(_hammer(client, threads, calls)), daemon=True)
+        worker.start()
+        worker.join(30)
+        if not result:
+            os._exit(102)
+        os._exit(min(inherited, 100) if inherited else (101 if result[0][1] else 0))
+
+    # A socket shared with the child can hand one process the other's response, leaving the parent waiting.
+    background.join(30)
+    if background.is_alive():
+        os.kill(pid, 9)
+        os.waitpid(pid, 0)
+        return "parent hung"
+    _, status = os.waitpid(pid, 0)
+    code = os.waitstatus_to_exitcode(status)
+    if code == 0:
+        return "ok"
+    if code == 101:
+        return "child failed"
+    if code == 102:
+        return "child hung"
+    return f"child inherited {code} pools"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Hammer one Client from many threads, then fork it mid-traffic.")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--calls", type=int, default=100, help="calls per thread")
+    args = parser.parse_args()
+
+    table, _ = routes(["ayah"])
+
+    def route(path: str):
+        return table.get(re.sub("/{2,}", "/", path))
+
+    failed = 0
+    with StandInServer(route) as server:
+        print(f"{'mode':<22}{'calls/s':>10}{'errors':>8}  fork")
+        for name, factory in MODES.items():
+            client = _point(factory(), server.url)
+            _hammer(client, 2, 5)
+            elapsed, errors = _hammer(client, args.threads, args.calls)
+            fork = fork_check(client, min(args.threads, 8), 20)
+            client.http_client.close()
+            failed += bool(errors) or fork not in ("ok", "skipped (no fork)")
+            print(f"{name:<22}{args.threads * args.calls / elapsed:>10.0f}{len(errors):>8}  {fork}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+import requests
+
+from _fixtures import FIXTURES, FIXTURES_DIR, fixture_file
+
+
+def main(names: list) -> None:
+    # Needs network once, bench_client.py replays whatever is saved in fixtures/.
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    session = requests.Session()
+    for name in names or FIXTURES:
+        host, path = FIXTURES[name]
+        res = session.get(host + path, timeout=60)
+        res.raise_for_status()
+        with open(fixture_file(name), "wb") as f:
+            f.write(res.content)
+        print(f"{name:>14}: {len(res.content) / 1024:.1f} KiB from {host + path}")
+        # bible-api.com allows 15 requests every 30 seconds.
+        time.sleep(2.0 if host.endswith("bible-api.com") else 0.2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,9 +1,61 @@
-from .client import *
-from .http import *
-from .models import *
+from importlib import import_module
+from typing import TYPE_CHECKING, NamedTuple, Literal
+
 from .errors import *
 from .constants import *
-from typing import NamedTuple, Literal
+
+if TYPE_CHECKING:
+    from .client import *
+    from .http import *
+    from .cache import *
+    from .ratelimit import *
+    from .coalesce import *
+    from .metrics import *
+    from .transport import *
+    from .references import *
+    from .structure import *
+    from .corpus import *
+    from .search import *
+    from .analytics import *
+    from .export import *
+    from .prefetch import *
+    from .models import *
+
+# Everything else is imported on first access, so `import holybooks` does not pull in requests, aiohttp or the models.
+# BibleBook is the model, references.BibleBook is reached through holybooks.references.
+_LAZY_MODULES = {
+    "client": ("Client", "AsyncClient"),
+    "http": ("HTTPClient", "AsyncHTTPClient"),
+    "cache": ("ResponseCache",),
+    "ratelimit": ("TokenBucket", "RateLimiter"),
+    "coalesce": ("SingleFlight",),
+    "metrics": ("EVENTS", "Hooks", "RequestTrace", "Histogram", "MetricsCollector"),
+    "transport": ("HostConfig", "Response", "StreamedResponse", "Transport", "RequestsTransport", "Urllib3Transport", "HttpxTransport", "LocalTransport"),
+    "references": ("VerseRange", "BibleReference", "BIBLE_BOOKS", "KJV_VERSIFICATION", "find_book", "check_chapter", "parse_reference", "parse_references"),
+    "structure": ("DIVISIONS", "QuranStructure", "QURAN_STRUCTURE"),
+    "corpus": ("QuranCorpus",),
+    "search": ("SearchIndex", "tokenize"),
+    "analytics": ("EditionStats", "Concordance", "corpus_documents", "text_documents", "term_stats", "concordance"),
+    "export": ("QURAN_COLUMNS", "BIBLE_COLUMNS", "quran_rows", "bible_rows", "export_rows", "export_quran", "export_bible"),
+    "prefetch": ("Prefetcher",),
+    "models": ("Quran", "Surah", "Ayah", "BibleBook", "BibleChapter", "BibleVerse", "Book", "Chapter", "Verse", "Translation", "QuranTranslation", "BibleTranslation", "QuranColumns"),
+}
+_LAZY = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+__all__ = (*_LAZY, *errors.__all__, *constants.__all__)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 
 __title__ = "holybooks"
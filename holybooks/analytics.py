@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import math
+import os
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import TYPE_CHECKING, NamedTuple
+from .search import tokenize
+
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Iterable, Iterator, Tuple, Any, Union, Sequence
+    from .corpus import QuranCorpus
+
+    # (edition, citation, text)
+    DOCUMENT = Tuple[str, str, str]
+
+
+__all__ = (
+    "EditionStats",
+    "Concordance",
+    "corpus_documents",
+    "text_documents",
+    "term_stats",
+    "concordance",
+)
+
+
+class EditionStats:
+    def __init__(self, edition: str) -> None:
+        self.edition = edition
+        self.documents = 0
+        self.tokens = 0
+        # n -> Counter of space separated n-grams, 1 holds the single terms.
+        self.ngrams: Dict[int, Counter] = {}
+        self.document_frequency: Counter = Counter()
+
+    def __repr__(self) -> str:
+        return f"EditionStats(edition={self.edition}, documents={self.documents}, tokens={self.tokens}, terms={len(self.terms)})"
+
+    @property
+    def terms(self) -> Counter:
+        return self.ngrams.get(1, Counter())
+
+    def merge(self, other: EditionStats) -> None:
+        self.documents += other.documents
+        self.tokens += other.tokens
+        self.document_frequency.update(other.document_frequency)
+        for n, counts in other.ngrams.items():
+            if n in self.ngrams:
+                self.ngrams[n].update(counts)
+            else:
+                self.ngrams[n] = counts
+
+    def top(self, limit: int = 20, n: int = 1) -> List[Tuple[str, int]]:
+        return self.ngrams.get(n, Counter()).most_common(limit)
+
+    def collocations(self, limit: int = 20, *, min_count: int = 5) -> List[Tuple[str, float]]:
+        # Bigrams by pointwise mutual information, rare pairs are skipped since PMI overrates them.
+        bigrams = self.ngrams.get(2)
+        if not bigrams or not self.tokens:
+            return []
+
+        terms = self.terms
+        total = self.tokens
+        scored = []
+        for bigram, count in bigrams.items():
+            if count >= min_count:
+                first, second = bigram.split(" ")
+                scored.append((bigram, math.log2(count * total / (terms[first] * terms[second]))))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+
+    def as_dict(self, limit: int = 100) -> Dict[str, Any]:
+        return {
+            "edition": self.edition,
+            "documents": self.documents,
+            "tokens": self.tokens,
+            "vocabulary": len(self.terms),
+            "ngrams": {str(n): self.top(limit, n) for n in sorted(self.ngrams)},
+            "collocations": self.collocations(limit) if 2 in self.ngrams else [],
+        }
+
+
+class Concordance(NamedTuple):
+    edition: str
+    citation: str
+    left: str
+    keyword: str
+    right: str
+
+    def __str__(self) -> str:
+        return f"{self.citation:>12}  {self.left:>40} [{self.keyword}] {self.right}"
+
+
+def corpus_documents(corpus: QuranCorpus, editions: Optional[Iterable[str]] = None) -> Iterator[DOCUMENT]:
+    for edition in editions if editions is not None else corpus.editions:
+        for citation, text in corpus.iter_texts(edition):
+            yield edition, citation, text
+
+
+def _citation(item: Union[dict, Any]) -> Tuple[str, str]:
+    data = getattr(item, "data", item)
+    if isinstance(data, dict):
+        if "numberInSurah" in data:
+            surah = data.get("surah")
+            surah = surah["number"] if isinstance(surah, dict) else surah
+            return f"{surah}:{data['numberInSurah']}", data.get("text") or ""
+        return f"{data.get('book_name')} {data.get('chapter')}:{data.get('verse')}", data.get("text") or ""
+    # BibleVerse
+    return f"{item.book_name} {item.chapter_number}:{item.number}", item.text or ""
+
+
+def text_documents(items: Iterable[Union[dict, Any]], edition: str) -> Iterator[DOCUMENT]:
+    # Ayah or BibleVerse models, or the dicts the HTTP clients and QuranCorpus return.
+    for item in items:
+        citation, text = _citation(item)
+        yield edition, citation, text
+
+
+# Fewer documents than this are counted in this process, starting workers would take longer than the work.
+# Counting takes about 40 microseconds per ayah, a spawned worker around 100 ms to start.
+_MIN_PARALLEL = 4000
+
+
+def _shards(documents: Iterable[DOCUMENT], size: int) -> Iterator[List[DOCUMENT]]:
+    documents = iter(documents)
+    while True:
+        shard = list(islice(documents, size))
+        if not shard:
+            return
+        yield shard
+
+
+def _map(func, shards: Iterable[tuple], processes: Optional[int]) -> Iterator[Any]:
+    # One worker or less runs in this process, starting a pool would only add pickling.
+    workers = processes if processes is not None else os.cpu_count() or 1
+    if workers > 1:
+        # Shards are read ahead until there is one per worker and enough documents to be worth a pool.
+        # When the input ends first, there are no more workers than shards and small inputs stay here.
+        shards = iter(shards)
+        head, documents = [], 0
+        for args in shards:
+            head.append(args)
+            documents += len(args[0])
+            if len(head) >= workers and documents >= _MIN_PARALLEL:
+                break
+        else:
+            workers = len(head) if documents >= _MIN_PARALLEL else 1
+        shards = chain(head, shards)
+    if workers <= 1:
+        return map(lambda args: func(*args), shards)
+
+    def results() -> Iterator[Any]:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # At most two shards per worker are queued, so the input is never fully materialised.
+            pending = []
+            for args in shards:
+                pending.append(executor.submit(func, *args))
+                if len(pending) >= 2 * workers:
+                    yield pending.pop(0).result()
+            for future in pending:
+                yield future.result()
+
+    return results()
+
+
+def _count(shard: List[DOCUMENT], sizes: Tuple[int, ...]) -> Dict[str, EditionStats]:
+    stats: Dict[str, EditionStats] = {}
+    for edition, _, text in shard:
+        edition_stats = stats.get(edition)
+        if edition_stats is None:
+            edition_stats = stats[edition] = EditionStats(edition)
+            edition_stats.ngrams = {n: Counter() for n in sizes}
+
+        tokens = tokenize(text)
+        edition_stats.documents += 1
+        edition_stats.tokens += len(tokens)
+        edition_stats.document_frequency.update(set(tokens))
+        for n in sizes:
+            if n == 1:
+                edition_stats.ngrams[1].update(tokens)
+            else:
+                edition_stats.ngrams[n].update(map(" ".join, zip(*(tokens[i:] for i in range(n)))))
+    return stats
+
+
+def term_stats(
+    documents: Iterable[DOCUMENT],
+    *,
+    ngrams: Sequence[int] = (1, 2),
+    processes: Optional[int] = None,
+    shard_size: int = 2000
+) -> Dict[str, EditionStats]:
+    sizes = tuple(sorted(set(ngrams) | {1}))
+    merged: Dict[str, EditionStats] = {}
+    for partial in _map(_count, ((shard, sizes) for shard in _shards(documents, shard_size)), processes):
+        for edition, stats in partial.items():
+            if edition in merged:
+                merged[edition].merge(stats)
+            else:
+                merged[edition] = stats
+    return merged
+
+
+def _matches(tokens: List[str], keyword: List[str]) -> Iterator[int]:
+    # The last keyword term may end with * to match any word starting with it.
+    last = keyword[-1].rstrip("*")
+    prefix = last != keyword[-1]
+    head = keyword[:-1]
+    for start in range(len(tokens) - len(keyword) + 1):
+        if head and tokens[start] != head[0]:
+            continue
+        end = start + len(head)
+        if tokens[start:end] == head and (tokens[end].startswith(last) if prefix else tokens[end] == last):
+            yield start
+
+
+def _concordance(shard: List[DOCUMENT], keyword: List[str], width: int) -> List[Concordance]:
+    lines = []
+    for edition, citation, text in shard:
+        tokens = tokenize(text)
+        for start in _matches(tokens, keyword):
+            end = start + len(keyword)
+            lines.append(Concordance(
+                edition,
+                citation,
+                " ".join(tokens[max(0, start - width):start]),
+                " ".join(tokens[start:end]),
+                " ".join(tokens[end:end + width]),
+            ))
+    return lines
+
+
+def concordance(
+    documents: Iterable[DOCUMENT],
+    keyword: str,
+    *,
+    width: int = 5,
+    processes: Optional[int] = None,
+    shard_size: int = 2000
+) -> List[Concordance]:
+    # Keyword in context, in document order. The keyword is tokenized like the text, so phrases work.
+    terms = tokenize(keyword)
+    if not terms:
+        raise ValueError(f"Keyword has no words: {keyword!r}")
+    if keyword.rstrip().endswith("*"):
+        terms[-1] += "*"
+
+    lines = []
+    for partial in _map(_concordance, ((shard, terms, width) for shard in _shards(documents, shard_size)), processes):
+        lines.extend(partial)
+    return lines
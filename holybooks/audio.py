@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import hashlib
+import os
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+from .errors import DownloadError
+
+if TYPE_CHECKING:
+    from typing import Optional, Callable, List, Tuple, Union, Iterable, Dict, Any
+    import requests
+
+
+__all__ = (
+    "download_audio",
+    "download_audios",
+)
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _hash_file(filename: str, algorithm: str) -> hashlib._Hash:
+    digest = hashlib.new(algorithm)
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest
+
+
+def _verify(url: str, filename: str, size: Optional[int], checksum: Optional[str], algorithm: str) -> None:
+    actual = os.path.getsize(filename)
+    if size is not None and actual != size:
+        raise DownloadError(url, f"expected {size} bytes but got {actual}")
+    if checksum is not None and _hash_file(filename, algorithm).hexdigest() != checksum.lower():
+        raise DownloadError(url, f"{algorithm} checksum mismatch")
+
+
+def download_audio(
+    url: str,
+    filename: str,
+    *,
+    session: Optional[requests.Session] = None,
+    chunk_size: int = CHUNK_SIZE,
+    resume: bool = True,
+    overwrite: bool = False,
+    size: Optional[int] = None,
+    checksum: Optional[str] = None,
+    algorithm: str = "sha256",
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    timeout: Optional[float] = 60
+) -> str:
+    if not overwrite and os.path.exists(filename):
+        _verify(url, filename, size, checksum, algorithm)
+        return filename
+
+    partial = filename + ".part"
+    offset = os.path.getsize(partial) if resume and os.path.exists(partial) else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+    if session is None:
+        # Imported here so loading the models does not pull in requests.
+        import requests
+        session = requests
+    with session.get(url, headers=headers, stream=True, timeout=timeout) as res:
+        if res.status_code == 416 and offset:
+            # The partial file already holds the whole body.
+            total = offset
+        else:
+            if res.status_code not in (200, 206):
+                raise DownloadError(url, f"unexpected status code {res.status_code}")
+
+            if res.status_code == 200:
+                offset = 0
+            length = res.headers.get("Content-Length")
+            total = offset + int(length) if length is not None else None
+
+            done = offset
+            with open(partial, "ab" if offset else "wb") as f:
+                for chunk in res.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    done += len(chunk)
+                    if progress is not None:
+                        progress(done, total)
+
+    try:
+        _verify(url, partial, size if size is not None else total, checksum, algorithm)
+    except DownloadError:
+        os.remove(partial)
+        raise
+    os.replace(partial, filename)
+    return filename
+
+
+def download_audios(
+    jobs: Iterable[Union[Tuple[str, str], Tuple[str, str, Dict[str, Any]]]],
+    *,
+    session: Optional[requests.Session] = None,
+    max_workers: int = 8,
+    progress: Optional[Callable[[int, int, str], None]] = None,
+    **kwargs
+) -> List[Union[str, Exception]]:
+    # kwargs apply to every file. A size or checksum only describes one file, it goes in that job's options.
+    for name in ("size", "checksum"):
+        if name in kwargs:
+            raise TypeError(f"{name}= differs per file, pass it in each job as (url, filename, {{{name!r}: ...}})")
+
+    jobs = list(jobs)
+    results: List[Union[str, Exception]] = [None] * len(jobs)
+    if not jobs:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+        futures = {
+            executor.submit(download_audio, job[0], job[1], session=session, **{**kwargs, **(job[2] if len(job) > 2 else {})}): index
+            for index, job in enumerate(jobs)
+        }
+        for completed, future in enumerate(as_completed(futures), 1):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                results[index] = e
+            if progress is not None:
+                progress(completed, len(jobs), jobs[index][1])
+    return results
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from .errors import NotFound
+from .fork import after_fork
+
+if TYPE_CHECKING:
+    from typing import Optional, Any, Dict, Tuple
+
+
+__all__ = (
+    "ResponseCache",
+)
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+MISSING: Any = _Missing()
+
+
+def _copy(obj):
+    # Responses are plain JSON, this is a lot cheaper than copy.deepcopy.
+    if isinstance(obj, dict):
+        return {k: _copy(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_copy(v) for v in obj]
+    return obj
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        *,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = 300.0
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be above 0")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Tuple[Optional[float], bool, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        after_fork(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _after_fork(self) -> None:
+        # The entries are kept, only the lock is replaced in case another thread held it during the fork.
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key) is not MISSING
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(size={len(self)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        scheme, netloc, path, query, _ = urlsplit(url)
+        items = parse_qsl(query, keep_blank_values=True)
+        if params:
+            items.extend((str(k), str(v)) for k, v in params.items() if v is not None)
+        return urlunsplit((scheme.lower(), netloc.lower(), path.rstrip("/") or "/", urlencode(sorted(items)), ""))
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self), "maxsize": self.maxsize}
+
+    def _lookup(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+
+        expires, _, _ = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._entries[key]
+            return MISSING
+        return entry
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is MISSING:
+                self.misses += 1
+                return MISSING
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        _, failed, value = entry
+        if failed:
+            raise NotFound(value)
+        return _copy(value)
+
+    def _store(self, key: str, failed: bool, value: Any, ttl: Optional[float]) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires, failed, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def set(self, key: str, value: Any) -> None:
+        self._store(key, False, _copy(value), self.ttl)
+
+    def set_not_found(self, key: str, error: NotFound) -> None:
+        if self.negative_ttl == 0:
+            return
+        self._store(key, True, error.args[0] if error.args else str(error), self.negative_ttl)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
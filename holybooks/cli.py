@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+
+from itertools import islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, List, Dict, Iterable, Iterator, IO, Any, Sequence
+    from .client import Client
+
+
+__all__ = (
+    "run",
+    "main",
+)
+
+# "2:255" or "262" is an ayah, anything else is read as Bible references.
+QURAN_CITATION = re.compile(r"\d+(?::\d+)?")
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="holybooks",
+        description="Look up Quran and Bible citations, one per line, and print one JSON object per line.",
+    )
+    parser.add_argument("file", nargs="?", default="-", help="file with one citation per line, - or nothing reads stdin")
+    parser.add_argument("--quran-translation", default="en.asad")
+    parser.add_argument("--bible-translation", default="kjv")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent requests per batch")
+    parser.add_argument("--batch-size", type=int, default=100, help="lines fetched together before their results are written")
+    parser.add_argument("--corpus", help="QuranCorpus database to read mirrored editions from")
+    parser.add_argument("--offline", action="store_true", help="never touch the network, needs --corpus, Bible lines fail")
+    return parser
+
+
+def _lines(f: IO[str]) -> Iterator[str]:
+    for line in f:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def _error(citation: str, error: Exception) -> Dict[str, Any]:
+    return {"citation": citation, "error": f"{type(error).__name__}: {error}"}
+
+
+def _lookup(client: Client, lines: List[str], workers: int) -> Iterator[Dict[str, Any]]:
+    # Ayahs go through fetch_ayahs, Bible lines through fetch_passages, which merges them into a few requests.
+    # The corpus only mirrors the Quran, so offline every Bible line is an error.
+    from .errors import NotFound
+    from .references import parse_references
+
+    quran = [line for line in lines if QURAN_CITATION.fullmatch(line)]
+    ayahs = dict(zip(quran, client.fetch_ayahs(quran, max_workers=workers))) if quran else {}
+
+    references: Dict[str, Any] = {}
+    for line in lines:
+        if line not in ayahs and line not in references:
+            try:
+                references[line] = [(r.book.name, r.citation()) for r in parse_references(line)]
+            except Exception as e:
+                references[line] = e
+            else:
+                if client.offline:
+                    references[line] = NotFound("Bible passages are not mirrored and the client is offline")
+    pairs = sorted({pair for value in references.values() if isinstance(value, list) for pair in value})
+    passages = dict(zip(pairs, client.http_client.fetch_passages(pairs))) if pairs else {}
+
+    for line in lines:
+        if line in ayahs:
+            ayah = ayahs[line]
+            yield _error(line, ayah) if isinstance(ayah, Exception) else {"citation": line, "ayah": ayah.data}
+            continue
+
+        value = references[line]
+        if isinstance(value, Exception):
+            yield _error(line, value)
+            continue
+        verses = []
+        for pair in value:
+            passage = passages[pair]
+            if isinstance(passage, Exception):
+                yield _error(line, passage)
+                break
+            verses.extend(passage)
+        else:
+            yield {"citation": line, "verses": verses}
+
+
+def run(client: Client, lines: Iterable[str], out: IO[str], *, workers: int = 8, batch_size: int = 100) -> int:
+    # Returns how many lines failed. Results are written and flushed batch by batch, in input order.
+    failed = 0
+    lines = iter(lines)
+    while True:
+        batch = list(islice(lines, batch_size))
+        if not batch:
+            return failed
+        for result in _lookup(client, batch, workers):
+            failed += "error" in result
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        out.flush()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.offline and not args.corpus:
+        parser.error("--offline needs --corpus, without one every line would fail")
+    from .client import Client
+
+    corpus = None
+    if args.corpus:
+        from .corpus import QuranCorpus
+        corpus = QuranCorpus(args.corpus)
+
+    f = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+    try:
+        with Client(
+            quran_translation=args.quran_translation,
+            bible_translation=args.bible_translation,
+            corpus=corpus,
+            offline=args.offline,
+        ) as client:
+            failed = run(client, _lines(f), sys.stdout, workers=args.workers, batch_size=args.batch_size)
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if f is not sys.stdin:
+            f.close()
+        if corpus is not None:
+            corpus.close()
+    return 1 if failed else 0
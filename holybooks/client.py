@@ -1,36 +1,359 @@
 from __future__ import annotations
+
+import asyncio
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
-from .http import HTTPClient
-from .models import Quran, Surah, Ayah, BibleChapter, BibleVerse
+from .http import HTTPClient, AsyncHTTPClient
+from .models import Quran, Surah, Ayah, BibleChapter, BibleVerse, QuranTranslation
+from .corpus import QuranCorpus
+from .coalesce import SingleFlight
+from .fork import after_fork
+from .search import SearchIndex, _SORTS
+from .errors import NotFound
+from .metrics import timed_build
+from .references import find_book, parse_references
+from .structure import QURAN_STRUCTURE
 
 if TYPE_CHECKING:
-    from typing import Optional, Union, List
+    from typing import Optional, Union, List, Iterable, Tuple, Callable, Dict, Hashable, Iterator, AsyncIterator, Any
     from .constants import NUMBER
+    from .cache import ResponseCache
+    from .ratelimit import RateLimiter
+    from .metrics import Hooks
+    from .transport import Transport
+    from .prefetch import Prefetcher
     from .models import Quran, Surah, Ayah, BibleChapter, BibleVerse
 
 __all__ = (
     "Client",
+    "AsyncClient",
 )
 
 class Client:
-    def __init__(self, *, quran_translation: str = "en.asad", bible_translation: str = "kjv") -> None:
+    def __init__(
+        self,
+        *,
+        quran_translation: str = "en.asad",
+        bible_translation: str = "kjv",
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
+        corpus: Optional[QuranCorpus] = None,
+        offline: bool = False,
+        coalesce: bool = True,
+        hooks: Optional[Hooks] = None,
+        transport: Optional[Transport] = None,
+        validate_references: bool = True,
+        session_per_thread: bool = False,
+        prefetcher: Optional[Prefetcher] = None
+    ) -> None:
+        if prefetcher is not None and cache is None:
+            raise ValueError("A prefetcher needs a cache to keep what it fetches, pass cache=ResponseCache()")
+
+        http_client = HTTPClient(quran_translation = quran_translation,
+            bible_translation = bible_translation, cache = cache, rate_limiter = rate_limiter, decoder = decoder, coalesce = coalesce, hooks = hooks,
+            transport = transport, validate_references = validate_references, session_per_thread = session_per_thread)
+        self._setup(http_client, quran_translation=quran_translation, bible_translation=bible_translation, corpus=corpus, offline=offline, prefetcher=prefetcher)
+
+    def _setup(
+        self,
+        http_client: Union[HTTPClient, AsyncHTTPClient],
+        *,
+        quran_translation: str,
+        bible_translation: str,
+        corpus: Optional[QuranCorpus],
+        offline: bool,
+        prefetcher: Optional[Prefetcher]
+    ) -> None:
+        # State shared by Client and AsyncClient, the constructors only differ in the HTTP client they build.
         self.quran_translation = quran_translation
         self.bible_translation = bible_translation
-        self.http_client = HTTPClient(quran_translation = self.quran_translation,
-            bible_translation = self.bible_translation)
+        self.corpus = corpus
+        self.offline = offline
+        self.search_indexes: Dict[str, SearchIndex] = {}
+        self.http_client = http_client
+        self.prefetcher = prefetcher
+        # Concurrent first searches of one edition mirror it and build its index once, the others wait for it.
+        self._builds = SingleFlight()
+        self._corpus_lock = threading.Lock()
+        after_fork(self)
+
+    def _after_fork(self) -> None:
+        self._corpus_lock = threading.Lock()
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # The prefetcher's workers are stopped first, they use the transport.
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        self.http_client.close()
+
+    def has_edition(self, translation: str = "") -> bool:
+        # Whether the edition is mirrored in the corpus, lookups of a mirrored edition never touch the network.
+        edition = translation or self.quran_translation
+        return self.corpus is not None and edition in self.corpus
+
+    def _local(self, translation: str = "") -> Optional[QuranCorpus]:
+        edition = translation or self.quran_translation
+        if self.has_edition(edition):
+            return self.corpus
+        if self.offline:
+            raise NotFound(f"Edition {edition} is not mirrored and the client is offline")
+        return None
+
+    def _models(self) -> dict:
+        # Models keep the HTTP client rather than its session, which may be per thread or replaced after a fork.
+        models = {"http": self.http_client}
+        hooks = self.http_client.hooks
+        if hooks is not None:
+            models["hooks"] = hooks
+        return models
+
+    def _local_index(self, translation: str = "") -> Optional[SearchIndex]:
+        edition = translation or self.quran_translation
+        index = self.search_indexes.get(edition)
+        if index is None and self.has_edition(edition):
+            index = self._builds.do("index:" + edition, lambda: self.search_indexes.get(edition) or self._index_quran(edition))
+        if index is None and self.offline:
+            raise NotFound(f"Edition {edition} is not mirrored and the client is offline")
+        return index
+
+    def _index_quran(self, edition: str) -> SearchIndex:
+        index = self.search_indexes[edition] = SearchIndex(self.corpus.iter_ayahs(edition))
+        return index
+
+    def _store_quran(self, payload: dict) -> str:
+        if self.corpus is None:
+            with self._corpus_lock:
+                if self.corpus is None:
+                    self.corpus = QuranCorpus()
+        edition = self.corpus.store(payload)
+        # An index of the edition as it was before is dropped, the next search builds a new one.
+        self.search_indexes.pop(edition, None)
+        return edition
+
+    @staticmethod
+    def _search_sort(sort: Optional[str], index: Optional[SearchIndex]) -> str:
+        # Only a local index ranks by relevance, the remote endpoint always answers in mushaf order.
+        if sort is not None and sort not in _SORTS:
+            raise ValueError(f"Unknown sort: {sort}, expected one of {', '.join(_SORTS)}")
+        if index is None:
+            if sort == "relevance":
+                raise ValueError("sort='relevance' needs a local index, mirror the edition or call build_search_index first")
+            return "mushaf"
+        return sort or "relevance"
+
+    def _to_ayah(self, data: dict, translations: Optional[Dict[str, QuranTranslation]] = None) -> Ayah:
+        if "data" in data:
+            return Ayah(**data, **self._models())
+
+        kwargs = {"data": data, **self._models()}
+
+        if translations is not None:
+            edition = data["translation"]
+            translation = translations.get(edition["identifier"])
+            if translation is None:
+                translation = translations[edition["identifier"]] = QuranTranslation(**edition)
+            kwargs["translation"] = translation
+        return Ayah(**kwargs)
+
+    def _to_ayahs(self, data: Union[dict, List[dict]]) -> Union[Ayah, List[Ayah]]:
+        if isinstance(data, dict):
+            return self._to_ayah(data)
+        translations = {}
+        return timed_build(self.http_client.hooks, "Ayah", lambda: [self._to_ayah(d, translations) for d in data])
+
+    def _split_editions(self, translations: Iterable[str], citation: str, chapter: NUMBER, juz: NUMBER) -> Tuple[Dict[str, List[Ayah]], List[str]]:
+        columns, remote = {}, []
+        for translation in translations:
+            if self.has_edition(translation):
+                if chapter:
+                    columns[translation] = Surah(**self.corpus.fetch_book_chapter(chapter, translation=translation), **self._models()).ayats
+                elif juz:
+                    columns[translation] = self._to_ayahs(self.corpus.fetch_chapter_verse(translation=translation, juz=juz))
+                else:
+                    columns[translation] = [self._to_ayahs(self.corpus.fetch_chapter_verse(citation=citation, translation=translation))]
+            elif self.offline:
+                raise NotFound(f"Edition {translation} is not mirrored and the client is offline")
+            else:
+                remote.append(translation)
+        return columns, remote
+
+    def _edition_columns(self, items: List[dict], chapter: NUMBER) -> Dict[str, List[Ayah]]:
+        columns = {}
+        translations = {}
+        for item in items:
+            if chapter:
+                columns[item["edition"]["identifier"]] = Surah(data=item, **self._models()).ayats
+            else:
+                columns[item["edition"]["identifier"]] = [self._to_ayah(item, translations)]
+        return columns
+
+    @staticmethod
+    def _align(columns: Dict[str, List[Ayah]], translations: List[str]) -> List[Dict[str, Ayah]]:
+        rows = {}
+        for translation in translations:
+            for ayah in columns.get(translation, ()):
+                rows.setdefault(ayah.number, {})[translation] = ayah
+        return [rows[number] for number in sorted(rows)]
+
+    @staticmethod
+    def _raise_first(results: Dict[Hashable, object]) -> None:
+        for result in results.values():
+            if isinstance(result, Exception):
+                raise result
+
+    @staticmethod
+    def _quran_keys(citations: Iterable[str]) -> List[str]:
+        return [str(citation).replace(" ", "") for citation in citations]
+
+    @staticmethod
+    def _bible_keys(references: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        return [(book.strip().lower(), citation.replace(" ", "")) for book, citation in references]
+
+    @staticmethod
+    def _fan_out(func: Callable, keys: List[Hashable], max_workers: int) -> Dict[Hashable, object]:
+        unique = list(dict.fromkeys(keys))
+        results = {}
+        if not unique:
+            return results
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as executor:
+            futures = {key: executor.submit(func, key) for key in unique}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    results[key] = e
+        return results
+
+    def _warmup_keys(self, editions: Iterable[str], surahs: Iterable[NUMBER], books: Iterable[str]) -> List[Tuple]:
+        editions, surahs, books = list(editions), list(surahs), list(books)
+        if self.http_client.cache is None and (surahs or books or (editions and self.corpus is None)):
+            raise ValueError("warmup needs a cache to keep what it fetches, pass cache=ResponseCache() (editions can go to a corpus instead)")
+
+        keys = [("quran", edition) for edition in editions]
+        keys += [("surah", QURAN_STRUCTURE.check_surah(surah)) for surah in surahs]
+        for name in books:
+            book = find_book(name)
+            keys += [("chapter", book.name, chapter) for chapter in range(1, book.chapters + 1)]
+        return keys
+
+    @staticmethod
+    def _warmup_results(results: Dict[Hashable, object]) -> Dict[Hashable, Optional[Exception]]:
+        return {key: result if isinstance(result, Exception) else None for key, result in results.items()}
+
+    def _warm(self, key: Tuple, translation: str) -> None:
+        kind = key[0]
+        if kind == "quran":
+            if self.corpus is None:
+                self.http_client.fetch_book(translation=key[1])
+            elif key[1] not in self.corpus:
+                self.mirror_quran(key[1])
+        elif kind == "surah":
+            if self._local(translation) is None:
+                self.http_client.fetch_book_chapter(str(key[1]), translation=translation)
+        else:
+            self.http_client.fetch_book_chapter(key[2], book=key[1])
+
+    def _selection(self, page_size: int, **selectors) -> Tuple[dict, Optional[int]]:
+        # The selector to page through and, when the built-in structure knows it, how many ayahs it has.
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        selected = {division: value for division, value in selectors.items() if value}
+        if not selected:
+            raise ValueError("iter_ayahs needs one of juz, manzil, ruku, page, hizb_quarter or sajda")
+
+        division, value = next(iter(selected.items()))
+        if not self.http_client.validate_references:
+            return selectors, None
+        if division == "sajda":
+            return selectors, len(QURAN_STRUCTURE.sajdas)
+        if QURAN_STRUCTURE.known(division):
+            return selectors, len(QURAN_STRUCTURE.span(division, value))
+        QURAN_STRUCTURE.check_division(division, value)
+        return selectors, None
+
+    @staticmethod
+    def _next_offset(ayahs: List[Ayah], offset: int, page_size: int, size: Optional[int]) -> Optional[int]:
+        # A short page is the last one, a known size also saves the empty request after a full last page.
+        offset += page_size
+        if len(ayahs) < page_size or (size is not None and offset >= size):
+            return None
+        return offset
+
+    @staticmethod
+    def _as_page(ayahs: Union[Ayah, List[Ayah]]) -> List[Ayah]:
+        return ayahs if isinstance(ayahs, list) else [ayahs]
+
+    @staticmethod
+    def _to_verses(data: Union[dict, List[dict]]) -> Union[BibleVerse, List[BibleVerse]]:
+        if isinstance(data, dict):
+            return BibleVerse(**data)
+        return [BibleVerse(**d) for d in data]
+
+    def mirror_quran(self, translation: str = "") -> str:
+        edition = translation or self.quran_translation
+        return self._builds.do("mirror:" + edition, lambda: self._store_quran(self.http_client.fetch_book(translation=translation)))
+
+    def warmup(self, *, editions: Iterable[str] = (), surahs: Iterable[NUMBER] = (), books: Iterable[str] = (), translation: str = "", max_workers: int = 8) -> Dict[Hashable, Optional[Exception]]:
+        # Loads whole editions (into the corpus when there is one), surahs of translation and every chapter of
+        # the Bible books concurrently, so the first real requests are cache hits. Failures are returned, not raised.
+        keys = self._warmup_keys(editions, surahs, books)
+        return self._warmup_results(self._fan_out(lambda key: self._warm(key, translation), keys, max_workers))
 
     def fetch_quran(self, translation: str = "") -> Quran:
-        return Quran(**self.http_client.fetch_book(translation=translation))
-    
+        local = self._local(translation)
+        if local is not None:
+            return Quran(**local.fetch_book(translation=translation or self.quran_translation), **self._models())
+        return Quran(**self.http_client.fetch_book(translation=translation), **self._models())
+
+    def _stream_surah(self, data: dict, translation: Optional[QuranTranslation]) -> Tuple[Surah, QuranTranslation]:
+        # Streamed surahs share one QuranTranslation, completed by _finish_translation at the end.
+        if translation is None:
+            translation = QuranTranslation(**data["translation"])
+        return Surah(data=data, translation=translation, **self._models()), translation
+
+    @staticmethod
+    def _finish_translation(translation: Optional[QuranTranslation], edition: dict) -> None:
+        if translation is not None:
+            translation._update(edition)
+
+    def stream_quran(self, translation: str = "", *, chunk_size: int = 65536) -> Iterator[Surah]:
+        local = self._local(translation)
+        if local is not None:
+            yield from Quran(**local.fetch_book(translation=translation or self.quran_translation), **self._models()).surahs
+            return
+
+        shared = None
+        data = None
+        for data in self.http_client.stream_book(translation=translation, chunk_size=chunk_size):
+            surah, shared = self._stream_surah(data, shared)
+            yield surah
+        if data is not None:
+            self._finish_translation(shared, data["translation"])
+
     def fetch_surah(self, chapter: NUMBER, translation: str = "") -> Surah:
-        return Surah(**self.http_client.fetch_book_chapter(str(chapter), translation=translation))
+        local = self._local(translation)
+        if local is not None:
+            return Surah(**local.fetch_book_chapter(chapter, translation=translation or self.quran_translation), **self._models())
+        surah = Surah(**self.http_client.fetch_book_chapter(str(chapter), translation=translation), **self._models())
+        if self.prefetcher is not None:
+            self.prefetcher.surah(self.http_client, chapter, translation)
+        return surah
 
     def fetch_ayah(self, citation: str = "", translation: str = "", *, juz: NUMBER = None, manzil: NUMBER = None, ruku: NUMBER = None, page: NUMBER = None, hizb_quarter: NUMBER = None, sajda: bool = False, offset: NUMBER = None, limit: NUMBER = None) -> Union[Ayah, List[Ayah]]:
-        data = self.http_client.fetch_chapter_verse(
-            citation=citation, 
-            translation=translation,
+        kwargs = dict(
+            citation=citation,
             juz=juz,
-            manzil=manzil, 
+            manzil=manzil,
             sajda=sajda,
             ruku=ruku,
             page=page,
@@ -38,16 +361,317 @@ class Client:
             offset=offset,
             limit=limit
         )
-
-        if isinstance(data, dict):
-            return Ayah(**data)
-        return [Ayah(**d) for d in data]
+        local = self._local(translation)
+        if local is not None:
+            data = local.fetch_chapter_verse(translation=translation or self.quran_translation, **kwargs)
+        else:
+            data = self.http_client.fetch_chapter_verse(translation=translation, **kwargs)
+            if self.prefetcher is not None and citation and not any((juz, manzil, ruku, page, hizb_quarter, sajda, offset, limit)):
+                self.prefetcher.ayah(self.http_client, citation, translation)
+        return self._to_ayahs(data)
 
     def fetch_chapter(self, book: str, chapter: NUMBER) -> BibleChapter:
-        return BibleChapter(self.http_client.fetch_book_chapter(chapter, book=book))
-    
+        data = self.http_client.fetch_book_chapter(chapter, book=book)
+        if self.prefetcher is not None:
+            self.prefetcher.chapter(self.http_client, book, chapter)
+        return BibleChapter(**data)
+
+    def _ayah_page(self, translation: str, selectors: dict, offset: int, page_size: int) -> List[Ayah]:
+        try:
+            return self._as_page(self.fetch_ayah(translation=translation, offset=offset or None, limit=page_size, **selectors))
+        except NotFound:
+            if offset:
+                return []
+            raise
+
+    def iter_ayahs(self, translation: str = "", *, juz: NUMBER = None, manzil: NUMBER = None, ruku: NUMBER = None, page: NUMBER = None, hizb_quarter: NUMBER = None, sajda: bool = False, page_size: int = 50) -> Iterator[Ayah]:
+        selectors, size = self._selection(page_size, juz=juz, manzil=manzil, ruku=ruku, page=page, hizb_quarter=hizb_quarter, sajda=sajda)
+        # One page is being yielded while the next one is fetched, so at most two pages are held at a time.
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self._ayah_page, translation, selectors, 0, page_size)
+        offset = 0
+        try:
+            while future is not None:
+                ayahs = future.result()
+                offset = self._next_offset(ayahs, offset, page_size, size)
+                future = executor.submit(self._ayah_page, translation, selectors, offset, page_size) if offset is not None else None
+                yield from ayahs
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def fetch_verse(self, book: str, citation: str, translation: str = "") -> Union[BibleVerse, List[BibleVerse]]:
         data = self.http_client.fetch_chapter_verse(book, citation=citation, translation=translation)
-        if isinstance(data, dict):
-            return BibleVerse(**data)
-        return [BibleVerse(**d) for d in data]
\ No newline at end of file
+        if self.prefetcher is not None:
+            self.prefetcher.verse(self.http_client, book, citation, translation)
+        return self._to_verses(data)
+
+    def build_search_index(self, translation: str = "") -> SearchIndex:
+        edition = translation or self.quran_translation
+        if not self.has_edition(edition):
+            self.mirror_quran(edition)
+        return self._builds.do("index:" + edition, lambda: self._index_quran(edition))
+
+    def search(self, keyword: str, chapter: NUMBER = "all", translation: str = "", *, sort: Optional[str] = None) -> List[Ayah]:
+        # sort defaults to relevance for a local index and mushaf order for the remote endpoint.
+        index = self._local_index(translation)
+        sort = self._search_sort(sort, index)
+        if index is not None:
+            return self._to_ayahs(index.search(keyword, chapter, sort=sort))
+        return self._to_ayahs(self.http_client.search(keyword, chapter, translation))
+
+    def fetch_editions(self, translations: Iterable[str], citation: str = "", *, chapter: NUMBER = None, juz: NUMBER = None) -> List[Dict[str, Ayah]]:
+        translations = list(dict.fromkeys(translation or self.quran_translation for translation in translations))
+        columns, remote = self._split_editions(translations, citation, chapter, juz)
+        if remote and juz:
+            # There is no multi-edition juz endpoint upstream, fetch the editions concurrently instead.
+            results = self._fan_out(lambda translation: self.fetch_ayah(translation=translation, juz=juz), remote, len(remote))
+            self._raise_first(results)
+            columns.update(results)
+        elif remote:
+            columns.update(self._edition_columns(self.http_client.fetch_editions(citation, chapter=chapter, translations=remote), chapter))
+        return self._align(columns, translations)
+
+    def download_surah_audio(self, chapter: NUMBER, directory: str = ".", translation: str = "ar.alafasy", **kwargs) -> List[Union[str, Exception]]:
+        return self.fetch_surah(chapter, translation).download_audio(directory, **kwargs)
+
+    def fetch_ayahs(self, citations: Iterable[str], translation: str = "", *, max_workers: int = 8) -> List[Union[Ayah, Exception]]:
+        keys = self._quran_keys(citations)
+        results = self._fan_out(lambda citation: self.fetch_ayah(citation, translation), keys, max_workers)
+        return [results[key] for key in keys]
+
+    def fetch_verses(self, references: Iterable[Tuple[str, str]], translation: str = "", *, max_workers: int = 8) -> List[Union[BibleVerse, List[BibleVerse], Exception]]:
+        keys = self._bible_keys(references)
+        results = self._fan_out(lambda key: self.fetch_verse(*key, translation), keys, max_workers)
+        return [results[key] for key in keys]
+
+    @staticmethod
+    def _to_passages(passages: List[Union[List[dict], Exception]]) -> List[Union[List[BibleVerse], Exception]]:
+        return [
+            passage if isinstance(passage, Exception) else [BibleVerse(**verse) for verse in passage]
+            for passage in passages
+        ]
+
+    def fetch_passages(self, references: Iterable[Tuple[str, str]], translation: str = "", *, max_url_length: int = 2000) -> List[Union[List[BibleVerse], Exception]]:
+        return self._to_passages(self.http_client.fetch_passages(references, translation=translation, max_url_length=max_url_length))
+
+    @staticmethod
+    def _flatten_passages(passages: List[Union[List[BibleVerse], Exception]]) -> List[BibleVerse]:
+        verses = []
+        for passage in passages:
+            if isinstance(passage, Exception):
+                raise passage
+            verses.extend(passage)
+        return verses
+
+    def fetch_reference(self, reference: str, translation: str = "") -> List[BibleVerse]:
+        references = [(r.book.name, r.citation()) for r in parse_references(reference)]
+        return self._flatten_passages(self.fetch_passages(references, translation))
+
+
+class AsyncClient(Client):
+    def __init__(
+        self,
+        *,
+        quran_translation: str = "en.asad",
+        bible_translation: str = "kjv",
+        http_client: Optional[AsyncHTTPClient] = None,
+        connection_limit: int = 100,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
+        corpus: Optional[QuranCorpus] = None,
+        offline: bool = False,
+        coalesce: bool = True,
+        hooks: Optional[Hooks] = None,
+        validate_references: bool = True
+    ) -> None:
+        # transport and session_per_thread are sync only: every request of an AsyncClient goes through one
+        # aiohttp session on the event loop. A custom session is passed as http_client=AsyncHTTPClient(session=...).
+        http_client = http_client or AsyncHTTPClient(
+            quran_translation = quran_translation,
+            bible_translation = bible_translation,
+            connection_limit = connection_limit,
+            cache = cache,
+            rate_limiter = rate_limiter,
+            decoder = decoder,
+            coalesce = coalesce,
+            hooks = hooks,
+            validate_references = validate_references
+        )
+        # Prefetching runs the sync client on worker threads, an AsyncClient does not prefetch.
+        self._setup(http_client, quran_translation=quran_translation, bible_translation=bible_translation, corpus=corpus, offline=offline, prefetcher=None)
+
+    @staticmethod
+    async def _gather(func: Callable, keys: List[Hashable], max_workers: int) -> Dict[Hashable, object]:
+        unique = list(dict.fromkeys(keys))
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def run(key):
+            async with semaphore:
+                return await func(key)
+
+        results = await asyncio.gather(*(run(key) for key in unique), return_exceptions=True)
+        return dict(zip(unique, results))
+
+    def __enter__(self) -> AsyncClient:
+        # close() is a coroutine here, a plain with block would never await it.
+        raise TypeError("use 'async with'")
+
+    def __exit__(self, *args) -> None:
+        raise TypeError("use 'async with'")
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.http_client.close()
+
+    async def _mirror(self, translation: str) -> str:
+        return self._store_quran(await self.http_client.fetch_book(translation=translation))
+
+    async def mirror_quran(self, translation: str = "") -> str:
+        edition = translation or self.quran_translation
+        return await self._builds.do_async("mirror:" + edition, lambda: self._mirror(translation))
+
+    async def _warm(self, key: Tuple, translation: str) -> None:
+        kind = key[0]
+        if kind == "quran":
+            if self.corpus is None:
+                await self.http_client.fetch_book(translation=key[1])
+            elif key[1] not in self.corpus:
+                await self.mirror_quran(key[1])
+        elif kind == "surah":
+            if self._local(translation) is None:
+                await self.http_client.fetch_book_chapter(str(key[1]), translation=translation)
+        else:
+            await self.http_client.fetch_book_chapter(key[2], book=key[1])
+
+    async def warmup(self, *, editions: Iterable[str] = (), surahs: Iterable[NUMBER] = (), books: Iterable[str] = (), translation: str = "", max_workers: int = 32) -> Dict[Hashable, Optional[Exception]]:
+        keys = self._warmup_keys(editions, surahs, books)
+        return self._warmup_results(await self._gather(lambda key: self._warm(key, translation), keys, max_workers))
+
+    async def fetch_quran(self, translation: str = "") -> Quran:
+        local = self._local(translation)
+        if local is not None:
+            return Quran(**local.fetch_book(translation=translation or self.quran_translation), **self._models())
+        return Quran(**await self.http_client.fetch_book(translation=translation), **self._models())
+
+    async def stream_quran(self, translation: str = "", *, chunk_size: int = 65536) -> AsyncIterator[Surah]:
+        local = self._local(translation)
+        if local is not None:
+            for surah in Quran(**local.fetch_book(translation=translation or self.quran_translation), **self._models()).surahs:
+                yield surah
+            return
+
+        shared = None
+        data = None
+        async for data in self.http_client.stream_book(translation=translation, chunk_size=chunk_size):
+            surah, shared = self._stream_surah(data, shared)
+            yield surah
+        if data is not None:
+            self._finish_translation(shared, data["translation"])
+
+    async def fetch_surah(self, chapter: NUMBER, translation: str = "") -> Surah:
+        local = self._local(translation)
+        if local is not None:
+            return Surah(**local.fetch_book_chapter(chapter, translation=translation or self.quran_translation), **self._models())
+        return Surah(**await self.http_client.fetch_book_chapter(str(chapter), translation=translation), **self._models())
+
+    async def fetch_ayah(self, citation: str = "", translation: str = "", *, juz: NUMBER = None, manzil: NUMBER = None, ruku: NUMBER = None, page: NUMBER = None, hizb_quarter: NUMBER = None, sajda: bool = False, offset: NUMBER = None, limit: NUMBER = None) -> Union[Ayah, List[Ayah]]:
+        kwargs = dict(
+            citation=citation,
+            juz=juz,
+            manzil=manzil,
+            sajda=sajda,
+            ruku=ruku,
+            page=page,
+            hizb_quarter=hizb_quarter,
+            offset=offset,
+            limit=limit
+        )
+        local = self._local(translation)
+        if local is not None:
+            data = local.fetch_chapter_verse(translation=translation or self.quran_translation, **kwargs)
+        else:
+            data = await self.http_client.fetch_chapter_verse(translation=translation, **kwargs)
+        return self._to_ayahs(data)
+
+    async def fetch_chapter(self, book: str, chapter: NUMBER) -> BibleChapter:
+        return BibleChapter(**await self.http_client.fetch_book_chapter(chapter, book=book))
+
+    async def _ayah_page(self, translation: str, selectors: dict, offset: int, page_size: int) -> List[Ayah]:
+        try:
+            return self._as_page(await self.fetch_ayah(translation=translation, offset=offset or None, limit=page_size, **selectors))
+        except NotFound:
+            if offset:
+                return []
+            raise
+
+    async def iter_ayahs(self, translation: str = "", *, juz: NUMBER = None, manzil: NUMBER = None, ruku: NUMBER = None, page: NUMBER = None, hizb_quarter: NUMBER = None, sajda: bool = False, page_size: int = 50) -> AsyncIterator[Ayah]:
+        selectors, size = self._selection(page_size, juz=juz, manzil=manzil, ruku=ruku, page=page, hizb_quarter=hizb_quarter, sajda=sajda)
+        task = asyncio.ensure_future(self._ayah_page(translation, selectors, 0, page_size))
+        offset = 0
+        try:
+            while task is not None:
+                ayahs = await task
+                offset = self._next_offset(ayahs, offset, page_size, size)
+                task = asyncio.ensure_future(self._ayah_page(translation, selectors, offset, page_size)) if offset is not None else None
+                for ayah in ayahs:
+                    yield ayah
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def fetch_verse(self, book: str, citation: str, translation: str = "") -> Union[BibleVerse, List[BibleVerse]]:
+        data = await self.http_client.fetch_chapter_verse(book, citation=citation, translation=translation)
+        return self._to_verses(data)
+
+    async def build_search_index(self, translation: str = "") -> SearchIndex:
+        edition = translation or self.quran_translation
+        if not self.has_edition(edition):
+            await self.mirror_quran(edition)
+        return self._builds.do("index:" + edition, lambda: self._index_quran(edition))
+
+    async def search(self, keyword: str, chapter: NUMBER = "all", translation: str = "", *, sort: Optional[str] = None) -> List[Ayah]:
+        index = self._local_index(translation)
+        sort = self._search_sort(sort, index)
+        if index is not None:
+            return self._to_ayahs(index.search(keyword, chapter, sort=sort))
+        return self._to_ayahs(await self.http_client.search(keyword, chapter, translation))
+
+    async def fetch_editions(self, translations: Iterable[str], citation: str = "", *, chapter: NUMBER = None, juz: NUMBER = None) -> List[Dict[str, Ayah]]:
+        translations = list(dict.fromkeys(translation or self.quran_translation for translation in translations))
+        columns, remote = self._split_editions(translations, citation, chapter, juz)
+        if remote and juz:
+            results = await self._gather(lambda translation: self.fetch_ayah(translation=translation, juz=juz), remote, len(remote))
+            self._raise_first(results)
+            columns.update(results)
+        elif remote:
+            columns.update(self._edition_columns(await self.http_client.fetch_editions(citation, chapter=chapter, translations=remote), chapter))
+        return self._align(columns, translations)
+
+    async def download_surah_audio(self, chapter: NUMBER, directory: str = ".", translation: str = "ar.alafasy", **kwargs) -> List[Union[str, Exception]]:
+        surah = await self.fetch_surah(chapter, translation)
+        return await asyncio.get_running_loop().run_in_executor(None, lambda: surah.download_audio(directory, **kwargs))
+
+    async def fetch_ayahs(self, citations: Iterable[str], translation: str = "", *, max_workers: int = 32) -> List[Union[Ayah, Exception]]:
+        keys = self._quran_keys(citations)
+        results = await self._gather(lambda citation: self.fetch_ayah(citation, translation), keys, max_workers)
+        return [results[key] for key in keys]
+
+    async def fetch_verses(self, references: Iterable[Tuple[str, str]], translation: str = "", *, max_workers: int = 32) -> List[Union[BibleVerse, List[BibleVerse], Exception]]:
+        keys = self._bible_keys(references)
+        results = await self._gather(lambda key: self.fetch_verse(*key, translation), keys, max_workers)
+        return [results[key] for key in keys]
+
+    async def fetch_passages(self, references: Iterable[Tuple[str, str]], translation: str = "", *, max_url_length: int = 2000) -> List[Union[List[BibleVerse], Exception]]:
+        return self._to_passages(await self.http_client.fetch_passages(references, translation=translation, max_url_length=max_url_length))
+
+    async def fetch_reference(self, reference: str, translation: str = "") -> List[BibleVerse]:
+        references = [(r.book.name, r.citation()) for r in parse_references(reference)]
+        return self._flatten_passages(await self.fetch_passages(references, translation))
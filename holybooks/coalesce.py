@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+
+from typing import TYPE_CHECKING
+from .cache import _copy
+from .fork import after_fork
+
+if TYPE_CHECKING:
+    from typing import Optional, Any, Dict, Callable, Awaitable
+
+
+__all__ = (
+    "SingleFlight",
+)
+
+
+class _Call:
+    __slots__ = ("event", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self.shared = 0
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._tasks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, list]] = weakref.WeakKeyDictionary()
+        after_fork(self)
+
+    def _after_fork(self) -> None:
+        # Leaders of calls in flight during a fork only exist in the parent, their followers would wait forever.
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._tasks = weakref.WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        return len(self._calls) + sum(len(tasks) for tasks in self._tasks.values())
+
+    def __repr__(self) -> str:
+        return f"SingleFlight(in_flight={len(self)}, shared={self.shared})"
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        # The first caller for a key runs fn, callers arriving while it runs wait for its outcome.
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return _copy(call.result)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            call.result = result
+        finally:
+            with self._lock:
+                del self._calls[key]
+                waiters = call.waiters
+            call.event.set()
+
+        # Parsers mutate responses in place, so the original is only handed out when nobody else shares it.
+        return _copy(result) if waiters else result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        calls = self._tasks.get(loop)
+        if calls is None:
+            calls = self._tasks[loop] = {}
+
+        call = calls.get(key)
+        if call is None:
+            task = loop.create_task(fn())
+            call = calls[key] = [task, 0]
+            task.add_done_callback(lambda t: self._done(calls, key, t))
+        else:
+            self.shared += 1
+        call[1] += 1
+
+        try:
+            # A cancelled caller must not cancel the request the others are waiting on.
+            result = await asyncio.shield(call[0])
+        finally:
+            call[1] -= 1
+        # Callers resume one by one, the last one can keep the original.
+        return _copy(result) if call[1] else result
+
+    @staticmethod
+    def _done(calls: Dict[str, list], key: str, task: asyncio.Task) -> None:
+        if calls.get(key, (None,))[0] is task:
+            del calls[key]
+        if not task.cancelled():
+            # Marks the exception as retrieved when every caller went away.
+            task.exception()
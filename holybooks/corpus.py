@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+
+from typing import TYPE_CHECKING
+from .errors import NotFound
+from .structure import QURAN_STRUCTURE
+from .fork import after_fork
+
+if TYPE_CHECKING:
+    from typing import Optional, Union, List, Iterator, Tuple
+    from .constants import NUMBER
+
+
+__all__ = (
+    "QuranCorpus",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS editions (
+    identifier TEXT PRIMARY KEY,
+    edition TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS surahs (
+    edition TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (edition, number)
+);
+CREATE TABLE IF NOT EXISTS ayahs (
+    edition TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    surah INTEGER NOT NULL,
+    number_in_surah INTEGER NOT NULL,
+    juz INTEGER,
+    manzil INTEGER,
+    ruku INTEGER,
+    page INTEGER,
+    hizb_quarter INTEGER,
+    sajda INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (edition, number)
+) WITHOUT ROWID;
+CREATE UNIQUE INDEX IF NOT EXISTS ayahs_citation ON ayahs (edition, surah, number_in_surah);
+CREATE INDEX IF NOT EXISTS ayahs_juz ON ayahs (edition, juz, number);
+CREATE INDEX IF NOT EXISTS ayahs_manzil ON ayahs (edition, manzil, number);
+CREATE INDEX IF NOT EXISTS ayahs_ruku ON ayahs (edition, ruku, number);
+CREATE INDEX IF NOT EXISTS ayahs_page ON ayahs (edition, page, number);
+CREATE INDEX IF NOT EXISTS ayahs_hizb_quarter ON ayahs (edition, hizb_quarter, number);
+CREATE INDEX IF NOT EXISTS ayahs_sajda ON ayahs (edition, sajda, number);
+"""
+
+_SELECTORS = ("juz", "manzil", "ruku", "page", "hizb_quarter")
+
+
+class QuranCorpus:
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._inherited: List[sqlite3.Connection] = []
+        self._editions = {
+            identifier: json.loads(edition)
+            for identifier, edition in self._conn.execute("SELECT identifier, edition FROM editions")
+        }
+        after_fork(self)
+
+    def __repr__(self) -> str:
+        return f"QuranCorpus(path={self.path}, editions={self.editions})"
+
+    def __contains__(self, edition: str) -> bool:
+        return edition in self._editions
+
+    @classmethod
+    def from_file(cls, filename: str, path: str = ":memory:") -> QuranCorpus:
+        with open(filename, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+
+        corpus = cls(path)
+        corpus.store(payload)
+        return corpus
+
+    @property
+    def editions(self) -> List[str]:
+        return list(self._editions)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _after_fork(self) -> None:
+        # SQLite connections must not cross a fork. The inherited one is kept but never used or closed,
+        # closing it would release the parent's file locks. An in-memory database cannot be reopened.
+        self._lock = threading.RLock()
+        if self.path != ":memory:":
+            self._inherited.append(self._conn)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+
+    def store(self, payload: dict) -> str:
+        data = payload.get("data", payload)
+        edition = data["edition"]
+        identifier = edition["identifier"]
+        surahs = []
+        ayahs = []
+        for surah in data["surahs"]:
+            meta = {k: v for k, v in surah.items() if k not in ("ayahs", "translation", "session")}
+            surahs.append((identifier, meta["number"], json.dumps(meta, ensure_ascii=False)))
+            for ayah in surah["ayahs"]:
+                ayah = {k: v for k, v in ayah.items() if k not in ("surah", "translation", "session")}
+                ayahs.append((
+                    identifier,
+                    ayah["number"],
+                    meta["number"],
+                    ayah["numberInSurah"],
+                    ayah.get("juz"),
+                    ayah.get("manzil"),
+                    ayah.get("ruku"),
+                    ayah.get("page"),
+                    ayah.get("hizbQuarter"),
+                    1 if ayah.get("sajda") else 0,
+                    json.dumps(ayah, ensure_ascii=False),
+                ))
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM ayahs WHERE edition = ?", (identifier,))
+            self._conn.execute("DELETE FROM surahs WHERE edition = ?", (identifier,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO editions VALUES (?, ?)",
+                (identifier, json.dumps(edition, ensure_ascii=False))
+            )
+            self._conn.executemany("INSERT INTO surahs VALUES (?, ?, ?)", surahs)
+            self._conn.executemany("INSERT INTO ayahs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", ayahs)
+            self._editions[identifier] = edition
+        return identifier
+
+    def _edition(self, edition: str) -> dict:
+        try:
+            return dict(self._editions[edition])
+        except KeyError:
+            raise NotFound(f"Edition {edition} is not stored in this corpus") from None
+
+    def _query(self, sql: str, args: tuple) -> list:
+        with self._lock:
+            return self._conn.execute(sql, args).fetchall()
+
+    def _surah_meta(self, edition: str, number: int) -> dict:
+        rows = self._query("SELECT data FROM surahs WHERE edition = ? AND number = ?", (edition, number))
+        if not rows:
+            raise NotFound("Surah number should be between 1 and 114")
+        return json.loads(rows[0][0])
+
+    def _surah_metas(self, edition: str) -> dict:
+        return {
+            number: json.loads(data)
+            for number, data in self._query("SELECT number, data FROM surahs WHERE edition = ?", (edition,))
+        }
+
+    def fetch_book(self, *, translation: str) -> dict:
+        edition = self._edition(translation)
+        surahs = self._surah_metas(translation)
+        for surah in surahs.values():
+            surah["ayahs"] = []
+            surah["translation"] = edition
+
+        for surah, data in self._query("SELECT surah, data FROM ayahs WHERE edition = ? ORDER BY number", (translation,)):
+            surahs[surah]["ayahs"].append(json.loads(data))
+
+        return {
+            "code": 200,
+            "status": "OK",
+            "data": {"surahs": list(surahs.values()), "edition": edition, "translation": edition}
+        }
+
+    def fetch_book_chapter(self, chapter: NUMBER, *, translation: str) -> dict:
+        edition = self._edition(translation)
+        # The same InvalidReference the HTTP client raises before sending a request.
+        chapter = QURAN_STRUCTURE.check_surah(chapter)
+        data = self._surah_meta(translation, chapter)
+        rows = self._query("SELECT data FROM ayahs WHERE edition = ? AND surah = ? ORDER BY number", (translation, chapter))
+        ayahs = []
+        for (ayah,) in rows:
+            ayah = json.loads(ayah)
+            ayah["translation"] = edition
+            ayahs.append(ayah)
+
+        data.update(ayahs=ayahs, edition=edition, translation=edition)
+        return {"code": 200, "status": "OK", "data": data}
+
+    def _ayah(self, edition: dict, surahs: dict, surah: int, data: str) -> dict:
+        ayah = json.loads(data)
+        ayah["surah"] = {**surahs[surah], "translation": edition}
+        ayah["translation"] = edition
+        return ayah
+
+    def fetch_chapter_verse(
+        self,
+        *,
+        citation: str = "",
+        translation: str,
+        **kwargs
+    ) -> Union[dict, List[dict]]:
+        edition = self._edition(translation)
+        offset = kwargs.pop("offset", None)
+        limit = kwargs.pop("limit", None)
+        sajda = kwargs.pop("sajda", None)
+
+        for selector in _SELECTORS:
+            value = kwargs.pop(selector, None)
+            if value:
+                sql = f"SELECT surah, data FROM ayahs WHERE edition = ? AND {selector} = ? ORDER BY number"
+                args = (translation, QURAN_STRUCTURE.check_division(selector, value))
+                break
+        else:
+            if sajda:
+                sql = "SELECT surah, data FROM ayahs WHERE edition = ? AND sajda = 1 ORDER BY number"
+                args = (translation,)
+            else:
+                return self._fetch_citation(edition, citation, translation)
+
+        if limit or offset:
+            sql += " LIMIT ? OFFSET ?"
+            args += (int(limit) if limit else -1, int(offset or 0))
+
+        rows = self._query(sql, args)
+        if not rows:
+            raise NotFound("Ayahs not found for the given selector")
+
+        surahs = self._surah_metas(translation)
+        return [self._ayah(edition, surahs, surah, data) for surah, data in rows]
+
+    def _fetch_citation(self, edition: dict, citation: str, translation: str) -> dict:
+        citation = str(citation).strip()
+        try:
+            if ":" in citation:
+                surah, number = citation.split(":")
+                rows = self._query(
+                    "SELECT surah, data FROM ayahs WHERE edition = ? AND surah = ? AND number_in_surah = ?",
+                    (translation, int(surah), int(number))
+                )
+            else:
+                rows = self._query("SELECT surah, data FROM ayahs WHERE edition = ? AND number = ?", (translation, int(citation)))
+        except ValueError:
+            raise NotFound("Please specify an Ayah number (1 to 6236) or a reference in the format Surah:Ayat (2:255).") from None
+
+        if not rows:
+            raise NotFound("Please specify an Ayah number (1 to 6236) or a reference in the format Surah:Ayat (2:255).")
+
+        surah, data = rows[0]
+        ayah = self._ayah(edition, {surah: self._surah_meta(translation, surah)}, surah, data)
+        ayah["edition"] = edition
+        return {"code": 200, "status": "OK", "data": ayah}
+
+    def iter_ayahs(self, translation: str) -> Iterator[dict]:
+        edition = self._edition(translation)
+        surahs = self._surah_metas(translation)
+        for surah, data in self._query("SELECT surah, data FROM ayahs WHERE edition = ? ORDER BY number", (translation,)):
+            yield self._ayah(edition, surahs, surah, data)
+
+    def iter_texts(self, translation: str) -> Iterator[Tuple[str, str]]:
+        # (citation, text) without decoding the stored ayah JSON in Python.
+        self._edition(translation)
+        rows = self._query(
+            "SELECT surah, number_in_surah, json_extract(data, '$.text') FROM ayahs WHERE edition = ? ORDER BY number",
+            (translation,)
+        )
+        for surah, number, text in rows:
+            yield f"{surah}:{number}", text or ""
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Union, List, Optional
+
+
+__all__ = (
+    "loads",
+    "get_decoder",
+    "ArrayStream",
+)
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+def get_decoder(name: str = "auto") -> Callable[[Union[bytes, str]], Any]:
+    if name in ("auto", "orjson"):
+        try:
+            import orjson
+        except ImportError:
+            if name == "orjson":
+                raise
+        else:
+            return orjson.loads
+
+    if name in ("auto", "msgspec"):
+        try:
+            import msgspec
+        except ImportError:
+            if name == "msgspec":
+                raise
+        else:
+            return msgspec.json.Decoder().decode
+
+    if name in ("auto", "json"):
+        return _stdlib_loads
+
+    raise ValueError(f"Unknown decoder: {name}")
+
+
+loads = get_decoder()
+
+
+_WHITESPACE = " \t\n\r,"
+
+
+class ArrayStream:
+    # Push parser for one large array inside a JSON document, e.g. data.surahs of a full edition.
+    # Every item is returned by feed() as soon as its closing bracket arrives, the rest of the
+    # document (code, status, edition, ...) is available as .document after close().
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.document: Optional[Any] = None
+        self._start = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._scanner = json.JSONDecoder()
+        self._buffer = ""
+        self._head: Optional[str] = None
+        self._tail: Optional[List[str]] = None
+        self._retry_at = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        self._buffer += self._decoder.decode(chunk)
+        return self._items()
+
+    def close(self) -> List[Any]:
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._retry_at = 0
+        items = self._items()
+        if self._head is None:
+            # No such array, most likely an error response, keep the whole document.
+            self.document = json.loads(self._buffer)
+        elif self._tail is None:
+            # Raises the JSONDecodeError of the truncated or malformed item.
+            self._scanner.raw_decode(self._buffer.lstrip(_WHITESPACE))
+        else:
+            self.document = json.loads(self._head + '"' + self.key + '": []' + "".join(self._tail))
+        self._buffer = ""
+        return items
+
+    def _items(self) -> List[Any]:
+        if self._tail is not None:
+            self._tail.append(self._buffer)
+            self._buffer = ""
+            return []
+
+        if self._head is None:
+            match = self._start.search(self._buffer)
+            if match is None:
+                return []
+            self._head = self._buffer[:match.start()]
+            self._buffer = self._buffer[match.end():]
+
+        # A failed attempt rescans the partial item, only retry once the buffer has doubled so
+        # parsing stays linear in the body size.
+        if len(self._buffer) < self._retry_at:
+            return []
+
+        items = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                break
+            if buffer[pos] == "]":
+                self._tail = [buffer[pos + 1:]]
+                buffer, pos = "", 0
+                break
+            try:
+                item, pos = self._scanner.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            items.append(item)
+
+        self._buffer = buffer[pos:]
+        self._retry_at = 0 if items else 2 * len(self._buffer)
+        return items
@@ -12,6 +12,8 @@ __all__ = (
     "WrongLang",
     "NotFound",
     "TooManyRequests",
+    "DownloadError",
+    "InvalidReference",
 )
 
 
@@ -67,3 +69,17 @@ class TooManyRequests(Exception):
         super().__init__(
             "Too many requests!"
         )
+
+
+class DownloadError(Exception):
+    def __init__(self, url: str, msg: str) -> None:
+        self.url = url
+        super().__init__(
+            f"Failed to download {url}: {msg}"
+        )
+
+
+class InvalidReference(NotFound, ValueError):
+    # Raised before any request, a NotFound so code written against the API's 404 keeps working.
+    def __init__(self, msg: str) -> None:
+        super().__init__(msg)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from .references import find_book
+from .errors import NotFound
+
+if TYPE_CHECKING:
+    import pyarrow
+    from typing import Optional, Union, List, Dict, Iterable, Iterator, IO, Any, Tuple
+    from .client import Client
+
+
+__all__ = (
+    "QURAN_COLUMNS",
+    "BIBLE_COLUMNS",
+    "quran_rows",
+    "bible_rows",
+    "export_rows",
+    "export_quran",
+    "export_bible",
+)
+
+# Column -> Arrow type name, the JSON Lines rows have the same keys in the same order.
+QURAN_COLUMNS = {
+    "edition": "string",
+    "number": "int16",
+    "surah": "int16",
+    "number_in_surah": "int16",
+    "juz": "int8",
+    "manzil": "int8",
+    "ruku": "int16",
+    "page": "int16",
+    "hizb_quarter": "int16",
+    "sajda": "bool_",
+    "surah_name": "string",
+    "surah_english_name": "string",
+    "text": "string",
+}
+
+BIBLE_COLUMNS = {
+    "translation": "string",
+    "book_id": "string",
+    "book": "string",
+    "chapter": "int16",
+    "verse": "int16",
+    "text": "string",
+}
+
+FORMATS = ("jsonl", "parquet", "arrow")
+
+
+def _quran_row(edition: str, surah: dict, ayah: dict) -> Dict[str, Any]:
+    return {
+        "edition": edition,
+        "number": ayah.get("number"),
+        "surah": surah.get("number"),
+        "number_in_surah": ayah.get("numberInSurah"),
+        "juz": ayah.get("juz"),
+        "manzil": ayah.get("manzil"),
+        "ruku": ayah.get("ruku"),
+        "page": ayah.get("page"),
+        "hizb_quarter": ayah.get("hizbQuarter"),
+        "sajda": bool(ayah.get("sajda")),
+        "surah_name": surah.get("name"),
+        "surah_english_name": surah.get("englishName"),
+        "text": ayah.get("text"),
+    }
+
+
+def quran_rows(client: Client, translation: str = "") -> Iterator[Dict[str, Any]]:
+    # A mirrored edition is read from the corpus, anything else is streamed surah by surah.
+    edition = translation or client.quran_translation
+    if client.has_edition(edition):
+        for ayah in client.corpus.iter_ayahs(edition):
+            yield _quran_row(edition, ayah["surah"], ayah)
+        return
+    if client.offline:
+        raise NotFound(f"Edition {edition} is not mirrored and the client is offline")
+
+    for surah in client.http_client.stream_book(translation=translation):
+        for ayah in surah["ayahs"]:
+            yield _quran_row(edition, surah, ayah)
+
+
+def bible_rows(client: Client, books: Iterable[str], translation: str = "", *, max_workers: int = 8) -> Iterator[Dict[str, Any]]:
+    # Chapters of one book are fetched concurrently and written in order, one book is held at a time.
+    http = client.http_client
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for name in books:
+            book = find_book(name)
+            chapters = executor.map(lambda chapter: http.fetch_book_chapter(chapter, book=book.slug, translation=translation), range(1, book.chapters + 1))
+            for chapter in chapters:
+                edition = chapter["translation"]["id"]
+                for verse in chapter["verses"]:
+                    yield {
+                        "translation": edition,
+                        "book_id": verse.get("book_id") or book.id,
+                        "book": verse.get("book_name") or book.name,
+                        "chapter": verse.get("chapter"),
+                        "verse": verse.get("verse"),
+                        "text": (verse.get("text") or "").strip(),
+                    }
+
+
+def _format(path: Union[str, IO], format: Optional[str]) -> str:
+    if format is None:
+        name = path if isinstance(path, str) else getattr(path, "name", "")
+        extension = os.path.splitext(str(name))[1].lower().lstrip(".")
+        format = {"json": "jsonl", "ndjson": "jsonl", "pq": "parquet", "feather": "arrow", "ipc": "arrow"}.get(extension, extension or "jsonl")
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format: {format}, expected one of {', '.join(FORMATS)}")
+    return format
+
+
+def _batches(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _pyarrow(format: str):
+    # Imported when the first writer is built, only the module the format needs.
+    try:
+        import pyarrow
+        if format == "parquet":
+            import pyarrow.parquet
+        else:
+            import pyarrow.ipc
+    except ImportError:
+        raise RuntimeError(f"pyarrow is required to export {format}, install it with: pip install holybooks[arrow]") from None
+    return pyarrow
+
+
+def _schema(pyarrow, columns: Dict[str, str]) -> pyarrow.Schema:
+    return pyarrow.schema([(name, getattr(pyarrow, kind)()) for name, kind in columns.items()])
+
+
+def _write_jsonl(rows: Iterable[Dict[str, Any]], path: Union[str, IO], batch_size: int) -> int:
+    count = 0
+    f = open(path, "w", encoding="utf-8") if isinstance(path, str) else path
+    try:
+        for batch in _batches(rows, batch_size):
+            f.write("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in batch))
+            count += len(batch)
+    finally:
+        if isinstance(path, str):
+            f.close()
+    return count
+
+
+def _write_arrow(rows: Iterable[Dict[str, Any]], path: Union[str, IO], format: str, columns: Dict[str, str], batch_size: int) -> int:
+    pyarrow = _pyarrow(format)
+    schema = _schema(pyarrow, columns)
+    sink = path if isinstance(path, str) else pyarrow.PythonFile(path, mode="w")
+    if format == "parquet":
+        writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    else:
+        writer = pyarrow.ipc.new_file(sink, schema)
+
+    count = 0
+    try:
+        for batch in _batches(rows, batch_size):
+            writer.write_batch(pyarrow.RecordBatch.from_pylist(batch, schema=schema))
+            count += len(batch)
+    finally:
+        writer.close()
+    return count
+
+
+def export_rows(
+    rows: Iterable[Dict[str, Any]],
+    path: Union[str, IO],
+    *,
+    columns: Dict[str, str],
+    format: Optional[str] = None,
+    batch_size: int = 10000
+) -> int:
+    # Writes batch_size rows at a time, so memory stays bounded whatever the size of the input.
+    # The format comes from the file extension unless given: jsonl, parquet or arrow.
+    format = _format(path, format)
+    if format == "jsonl":
+        return _write_jsonl(rows, path, batch_size)
+    return _write_arrow(rows, path, format, columns, batch_size)
+
+
+def export_quran(client: Client, path: Union[str, IO], translation: str = "", **kwargs) -> int:
+    return export_rows(quran_rows(client, translation), path, columns=QURAN_COLUMNS, **kwargs)
+
+
+def export_bible(client: Client, books: Iterable[str], path: Union[str, IO], translation: str = "", *, max_workers: int = 8, **kwargs) -> int:
+    return export_rows(bible_rows(client, books, translation, max_workers=max_workers), path, columns=BIBLE_COLUMNS, **kwargs)
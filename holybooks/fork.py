@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import os
+import weakref
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+__all__ = (
+    "after_fork",
+)
+
+# Objects with an _after_fork method, called in the child process of every fork. Only weak references
+# are kept, since os.register_at_fork callbacks cannot be removed.
+_TRACKED: weakref.WeakSet = weakref.WeakSet()
+
+
+def after_fork(obj: Any) -> Any:
+    _TRACKED.add(obj)
+    return obj
+
+
+def _reinit() -> None:
+    for obj in list(_TRACKED):
+        obj._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit)
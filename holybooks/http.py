@@ -1,24 +1,72 @@
 from __future__ import annotations
 
-import requests
+import asyncio
+import time
 
+from contextlib import AsyncExitStack, ExitStack, nullcontext
 from typing import TYPE_CHECKING
-from .errors import NotFound, TooManyRequests
+from urllib.parse import urlsplit
+from .errors import NotFound, TooManyRequests, InvalidReference
 from .constants import SLASH
+from .cache import ResponseCache, MISSING
+from .coalesce import SingleFlight
+from .decoder import loads, ArrayStream
+from .transport import METHODS, RequestsTransport, Transport
+from .references import KJV_VERSIFICATION, VerseRange, check_chapter, parse_reference
+from .structure import QURAN_STRUCTURE
+from .fork import after_fork
 
 if TYPE_CHECKING:
-    from typing import Tuple, Union, List
+    import aiohttp
+    import requests
+    from typing import Tuple, Union, List, Optional, Dict, Iterable, Iterator, AsyncIterator
     from .constants import NUMBER
-    
+    from .ratelimit import RateLimiter
+    from .metrics import Hooks, RequestTrace
+    from .references import BibleBook
+    from typing import Callable, Any
+
 
 
 
 __all__ = (
     "HTTPClient",
+    "AsyncHTTPClient",
 )
 
-class HTTPClient:
-    def __init__(self, *, quran_translation = "en.asad", bible_translation = "kjv") -> None:
+# First path segment of an api.alquran.cloud route -> key in HTTPClient.urls["quran"].
+_QURAN_ENDPOINTS = {
+    "quran": "quran",
+    "surah": "chapter",
+    "ayah": "verse",
+    "search": "search",
+    "juz": "juz",
+    "manzil": "manzil",
+    "ruku": "ruku",
+    "page": "page",
+    "hizbQuarter": "hizb_quarter",
+    "sajda": "sajda",
+}
+
+class BaseHTTPClient:
+    def __init__(
+        self,
+        *,
+        quran_translation = "en.asad",
+        bible_translation = "kjv",
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
+        coalesce: bool = True,
+        hooks: Optional[Hooks] = None,
+        validate_references: bool = True
+    ) -> None:
+        self.decoder = decoder or loads
+        self.validate_references = validate_references
+        self.cache = cache
+        self.hooks = hooks
+        self.flights = SingleFlight() if coalesce else None
+        self.rate_limiter = rate_limiter
         self.quran_translation = quran_translation
         self.bible_translation = bible_translation
         self.base_quran_url = "http://api.alquran.cloud/v1"
@@ -28,6 +76,8 @@ class HTTPClient:
                 "quran": lambda translation = self.quran_translation: self.base_quran_url + "/quran" + SLASH + translation,
                 "chapter": lambda chapter, translation = self.quran_translation: self.base_quran_url + "/surah/" + str(chapter) + SLASH + translation,
                 "verse": lambda citation, translation = self.quran_translation: self.base_quran_url + "/ayah/" + citation + SLASH + translation,
+                "chapter_editions": lambda chapter, translations: self.base_quran_url + "/surah/" + str(chapter) + "/editions/" + ",".join(translations),
+                "verse_editions": lambda citation, translations: self.base_quran_url + "/ayah/" + citation + "/editions/" + ",".join(translations),
                 "search": lambda keyword, surah = "all", translation = self.quran_translation: self.base_quran_url + "/search/" + keyword + SLASH + surah + SLASH + translation,
                 "juz": lambda juz, translation = self.quran_translation: self.base_quran_url + "/juz/" + str(juz) + SLASH + translation,
                 "manzil": lambda manzil, translation = self.quran_translation: self.base_quran_url + "/manzil/" + str(manzil) + SLASH + translation,
@@ -38,16 +88,20 @@ class HTTPClient:
             },
             "bible": {
                 "chapter": lambda book, chapter, translation = self.bible_translation: self.base_bible_url + SLASH + book + str(chapter) + f"?translation={translation}",
-                "verse": lambda book, chapter, starting_verse, ending_verse = "", translation = self.bible_translation: self.base_bible_url + SLASH + book + str(chapter) + ":" + str(starting_verse) + ("-" + str(ending_verse) if str(ending_verse) else "") + f"?translation={translation}"
+                "verse": lambda book, chapter, starting_verse, ending_verse = "", translation = self.bible_translation: self.base_bible_url + SLASH + book + str(chapter) + ":" + str(starting_verse) + ("-" + str(ending_verse) if str(ending_verse) else "") + f"?translation={translation}",
+                "verses": lambda book, ranges, translation = self.bible_translation: self.base_bible_url + SLASH + book + ",".join(ranges) + f"?translation={translation}"
             }
         }
-        self.__session = requests.Session()
+
+    @property
+    def session(self):
+        return None
 
     def _parse_ayahs(self, res) -> Tuple[dict, int]:
         edition = res["data"]["edition"]
         data = res.get("data")
         verses = data.get("ayahs") or None
-            
+
         if verses:
             for verse in verses:
                 verse["translation"] = edition
@@ -62,25 +116,76 @@ class HTTPClient:
             if surah:
                 surah["translation"] = edition
             return res, 0
-        
 
-    def request(
-        self,
-        url: str,
-        method: str = "get",
-        *args,
-        **kwargs
-    ) -> dict:
-        try: 
-            req = getattr(self.__session, method.lower())
-        except AttributeError:
-            raise AttributeError(f"Cannot find method: {method}")
+    def endpoint(self, url: str) -> str:
+        if url.startswith(self.base_quran_url):
+            parts = url[len(self.base_quran_url):].strip(SLASH).split(SLASH)
+            name = _QURAN_ENDPOINTS.get(parts[0])
+            if name is not None:
+                if name in ("chapter", "verse") and "editions" in parts:
+                    name += "_editions"
+                return "quran." + name
 
-        url = url.replace(" ", "%20")
-        res = req(url, *args, **kwargs)
-        data = res.json()
-        code = res.status_code    
-        
+        if url.startswith(self.base_bible_url):
+            path = urlsplit(url).path
+            return "bible." + ("verses" if "," in path else "verse" if ":" in path else "chapter")
+        return "other"
+
+    def _trace(self, method: str, url: str) -> Optional[RequestTrace]:
+        hooks = self.hooks
+        if not hooks:
+            return None
+        return hooks.request(self.endpoint(url), method, url)
+
+    def _from_cache(self, key: Optional[str], url: str):
+        if key is None:
+            return MISSING
+
+        hooks = self.hooks
+        if not hooks:
+            return self.cache.get(key)
+
+        try:
+            data = self.cache.get(key)
+        except NotFound:
+            hooks.emit("cache_hit", endpoint=self.endpoint(url), url=url, negative=True)
+            raise
+        if data is MISSING:
+            hooks.emit("cache_miss", endpoint=self.endpoint(url), url=url)
+        else:
+            hooks.emit("cache_hit", endpoint=self.endpoint(url), url=url, negative=False)
+        return data
+
+    def _cache_key(self, url: str, method: str, params: Optional[dict]) -> Optional[str]:
+        if self.cache is None or method.lower() != "get":
+            return None
+        return self.cache.make_key(url, params)
+
+    def _flight_key(self, url: str, method: str, params: Optional[dict]) -> Optional[str]:
+        if self.flights is None or method.lower() != "get":
+            return None
+        return ResponseCache.make_key(url, params)
+
+    def _store_response(self, key: Optional[str], code: int, data) -> None:
+        try:
+            self._check_response(code, data)
+        except NotFound as e:
+            if key is not None:
+                self.cache.set_not_found(key, e)
+            raise
+
+        if key is not None and code < 400:
+            self.cache.set(key, data)
+
+    def _retry_delay(self, url: str, attempt: int, retry_after: Optional[str]) -> float:
+        delay = None
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.backoff(url, attempt, retry_after)
+        if delay is None:
+            raise TooManyRequests()
+        return delay
+
+    def _check_response(self, code: int, data) -> None:
         if code == 404:
             try:
                 raise NotFound(data["data"])
@@ -91,32 +196,54 @@ class HTTPClient:
 
         elif code == 429:
             raise TooManyRequests()
-        return data
 
-    def fetch_book(self, book: str = "", *, translation: str = "") -> dict:
+    def _book_route(self, book: str = "", *, translation: str = "") -> str:
         if book:
             ... #TODO: For bible later!
 
-        url = self.urls["quran"]["quran"](translation or self.quran_translation)
-        res = self.request(url)
+        return self.urls["quran"]["quran"](translation or self.quran_translation)
+
+    def _parse_book(self, res: dict) -> dict:
         edition = res["data"]["edition"]
         res["data"]["translation"] = edition
         for chapter in res["data"]["surahs"]:
-            chapter["translation"] = edition 
-        return {**res, 'session': self.__session}
+            chapter["translation"] = edition
+        return res
 
-    def fetch_book_chapter(
-        self, 
-        chapter, 
-        *, 
-        book: str = "", 
-        beginning_verse: NUMBER = "",
-        ending_verse: NUMBER = "",
+    def _stream_edition(self, translation: str = "") -> dict:
+        # The edition comes after the surahs in the payload, streamed surahs share this dict
+        # and it is filled in once the edition has been parsed.
+        identifier = translation or self.quran_translation
+        return {"identifier": identifier, "name": identifier}
+
+    @staticmethod
+    def _stream_surahs(surahs: List[dict], edition: dict) -> List[dict]:
+        for surah in surahs:
+            surah["translation"] = edition
+        return surahs
+
+    def _finish_stream(self, code: int, document: dict, surahs: List[dict], edition: dict) -> List[dict]:
+        self._check_response(code, document)
+        edition.update(document["data"]["edition"])
+        return self._stream_surahs(surahs, edition)
+
+    def _book_chapter_route(
+        self,
+        chapter,
+        *,
+        book: str = "",
         translation = ""
-    ) -> dict:
+    ) -> str:
+        if book:
+            if self.validate_references:
+                book = check_chapter(book, chapter, counts=not self._as_written(translation)).slug
+            return self.urls["bible"]["chapter"](book, chapter, translation or self.bible_translation)
+        if self.validate_references:
+            QURAN_STRUCTURE.check_surah(chapter)
+        return self.urls["quran"]["chapter"](chapter, translation or self.quran_translation)
+
+    def _parse_book_chapter(self, res: dict, *, book: str = "") -> dict:
         if book:
-            url = self.urls["bible"]["chapter"](book, chapter, translation or self.bible_translation)
-            res = self.request(url)
             verses = res["verses"]
             translation_data = {
                 "name": res["translation_name"],
@@ -135,34 +262,171 @@ class HTTPClient:
             del res["translation_note"]
             res["number"] = _verse["chapter"]
             return res
-        
-        else:
-            url = self.urls["quran"]["chapter"](chapter, translation or self.quran_translation)
-            res = self.request(url)
-            res = self._parse_ayahs(res)[0]
-            return {**res, "session": self.__session}
 
-    def fetch_chapter_verse(
-        self, 
-        book: str = "", 
+        return self._parse_ayahs(res)[0]
+
+    @staticmethod
+    def _split_citation(citation: str) -> Tuple[str, str, str]:
+        try:
+            chapter, verse = citation.split(":")
+            if "-" in verse:
+                starting_verse, ending_verse = verse.split("-")
+
+            else:
+                starting_verse, ending_verse = (verse, "")
+        except ValueError:
+            raise ValueError("Wrong citation! the citation argument must be put with any of these formats: 1:1, 3:10, 3:1-10")
+        return chapter, starting_verse, ending_verse
+
+    def _as_written(self, translation: str) -> bool:
+        # The chapter and verse counts are KJV ones. References in other translations are only checked for
+        # the book and syntax, then sent as written since where their chapters end is not known.
+        return self.validate_references and (translation or self.bible_translation).lower() not in KJV_VERSIFICATION
+
+    def _passage(self, book: str, citation: str, counts: bool = True) -> Tuple[str, Tuple[VerseRange, ...], Optional[BibleBook]]:
+        if self.validate_references:
+            reference = parse_reference(book, citation, counts=counts)
+            return reference.book.slug, reference.ranges, reference.book
+
+        chapter, starting_verse, ending_verse = self._split_citation(citation.replace(" ", ""))
+        chapter, starting_verse = int(chapter), int(starting_verse)
+        return book.strip().lower(), (VerseRange(chapter, starting_verse, chapter, int(ending_verse or starting_verse)),), None
+
+    def _passages_routes(
+        self,
+        references: List[Tuple[str, str]],
+        translation: str = "",
+        max_url_length: int = 2000,
+        errors: Optional[Dict[int, Exception]] = None
+    ) -> List[Tuple[str, List[int]]]:
+        # Packs references to the same book into compound requests like "romans12:1-2,12:5-7,13:1".
+        # With an errors dict, invalid references are put there instead of failing the whole batch.
+        translation = translation or self.bible_translation
+        as_written = self._as_written(translation)
+        books = {}
+        routes = []
+        for index, (book, citation) in enumerate(references):
+            try:
+                book, ranges, _ = self._passage(book, citation, not as_written)
+            except InvalidReference as e:
+                if errors is None:
+                    raise
+                errors[index] = e
+                continue
+            if as_written:
+                routes.append((self.urls["bible"]["verses"](book, [citation.replace(" ", "")], translation), [index]))
+                continue
+            books.setdefault(book, []).append((index, ",".join(r.citation() for r in ranges)))
+
+        for book, pieces in books.items():
+            indexes, ranges = [], []
+            for index, piece in pieces:
+                if ranges and len(self.urls["bible"]["verses"](book, ranges + [piece], translation)) > max_url_length:
+                    routes.append((self.urls["bible"]["verses"](book, ranges, translation), indexes))
+                    indexes, ranges = [], []
+                indexes.append(index)
+                ranges.append(piece)
+            routes.append((self.urls["bible"]["verses"](book, ranges, translation), indexes))
+        return routes
+
+    def _split_passages(self, res: dict, references: List[Tuple[str, str]], indexes: List[int], translation: str = "") -> Dict[int, List[dict]]:
+        translation_data = {
+            "name": res["translation_name"],
+            "id": res["translation_id"],
+            "note": res["translation_note"]
+        }
+        verses = {(int(verse["chapter"]), int(verse["verse"])): verse for verse in res["verses"]}
+        as_written = self._as_written(translation)
+        passages = {}
+        for index in indexes:
+            book, citation = references[index]
+            if as_written:
+                # Sent on its own, the whole response belongs to it.
+                selected = res["verses"]
+            else:
+                _, ranges, bible_book = self._passage(book, citation)
+                selected = (verses.get(key) for r in ranges for key in r.keys(bible_book))
+            passage = [
+                {**verse, "reference": f"{verse['book_name']} {citation}", "translation": translation_data}
+                for verse in selected
+                if verse is not None
+            ]
+            if not passage:
+                passage = NotFound(f"{book} {citation} not found")
+            passages[index] = passage
+        return passages
+
+    def _chapter_verse_route(
+        self,
+        book: str = "",
         *,
         citation: str,
         translation: str = "",
         **kwargs
-    ) -> Union[dict, List[dict]]:
+    ) -> Tuple[str, dict]:
+        if book:
+            if self.validate_references:
+                # Unknown books and impossible chapters or verses fail here instead of with a 404.
+                if self._as_written(translation):
+                    reference = parse_reference(book, citation, counts=False)
+                    return self.urls["bible"]["verses"](reference.book.slug, [citation.replace(" ", "")], translation or self.bible_translation), {}
+                reference = parse_reference(book, citation)
+                return self.urls["bible"]["verses"](reference.book.slug, reference.citations(), translation or self.bible_translation), {}
+            chapter, starting_verse, ending_verse = self._split_citation(citation)
+            return self.urls["bible"]["verse"](book, chapter, starting_verse, ending_verse, translation or self.bible_translation), {}
+
+        params = {}
+        offset = kwargs.pop("offset", None)
+        limit = kwargs.pop("limit", None)
+        juz = kwargs.pop("juz", None)
+        manzil = kwargs.pop("manzil", None)
+        ruku = kwargs.pop("ruku", None)
+        page = kwargs.pop("page", None)
+        hizb_quarter = kwargs.pop("hizb_quarter", None)
+        sajda = kwargs.pop("sajda", None)
+
+        if self.validate_references:
+            # Out of range surahs, ayahs and divisions fail here instead of with a 404.
+            selectors = {"juz": juz, "manzil": manzil, "ruku": ruku, "page": page, "hizb_quarter": hizb_quarter}
+            for division, value in selectors.items():
+                if value:
+                    QURAN_STRUCTURE.check_division(division, value)
+                    break
+            else:
+                if not sajda:
+                    QURAN_STRUCTURE.parse(citation)
+
+        if juz:
+            url = self.urls["quran"]["juz"](juz, translation or self.quran_translation)
+
+        elif manzil:
+            url = self.urls["quran"]["manzil"](manzil, translation or self.quran_translation)
+
+        elif ruku:
+            url = self.urls["quran"]["ruku"](ruku, translation or self.quran_translation)
+
+        elif page:
+            url = self.urls["quran"]["page"](page, translation or self.quran_translation)
+
+        elif hizb_quarter:
+            url = self.urls["quran"]["hizb_quarter"](hizb_quarter, translation or self.quran_translation)
+
+        elif sajda:
+            url = self.urls["quran"]["sajda"](translation or self.quran_translation)
+
+        else:
+            url = self.urls["quran"]["verse"](citation, translation or self.quran_translation)
+
+        if offset:
+            params["offset"] = offset
+
+        if limit:
+            params["limit"] = limit
+
+        return url, params
+
+    def _parse_chapter_verse(self, res: dict, *, book: str = "") -> Union[dict, List[dict]]:
         if book:
-            try:
-                chapter, verse = citation.split(":")
-                if "-" in verse:
-                    starting_verse, ending_verse = verse.split("-")
-
-                else:
-                    starting_verse, ending_verse = (verse, "")
-            except ValueError:
-                raise ValueError("Wrong citation! the citation argument must be put with any of these formats: 1:1, 3:10, 3:1-10")
-                
-            url = self.urls["bible"]["verse"](book, chapter, starting_verse, ending_verse, translation or self.bible_translation)
-            res = self.request(url)
             data = res["verses"]
             if len(data) > 1:
                 for d in data:
@@ -172,9 +436,9 @@ class HTTPClient:
                         "id": res["translation_id"],
                         "note": res["translation_note"]
                     }
-                    
-                return [{**d} for d in data]
-            
+
+                return data
+
             else:
                 # if
                 data = data[0]
@@ -184,58 +448,463 @@ class HTTPClient:
                     "id": res["translation_id"],
                     "note": res["translation_note"]
                 }
-                
+
                 return data
 
-        else:
-            params = {}
-            offset = kwargs.pop("offset", None)
-            limit = kwargs.pop("limit", None)
-            juz = kwargs.pop("juz", None)
-            manzil = kwargs.pop("manzil", None)
-            ruku = kwargs.pop("ruku", None)
-            page = kwargs.pop("page", None)
-            hizb_quarter = kwargs.pop("hizb_quarter", None)
-            sajda = kwargs.pop("sajda", None)
-            
-            if juz:
-                url = self.urls["quran"]["juz"](juz, translation or self.quran_translation)
-            
-            elif manzil:
-                url = self.urls["quran"]["manzil"](manzil, translation or self.quran_translation)
-
-            elif ruku:
-                url = self.urls["quran"]["ruku"](ruku, translation or self.quran_translation)
-
-            elif page:
-                url = self.urls["quran"]["page"](page, translation or self.quran_translation)
-
-            elif hizb_quarter:
-                url = self.urls["quran"]["hizb_quarter"](hizb_quarter, translation or self.quran_translation)
-
-            elif sajda:
-                url = self.urls["quran"]["sajda"](translation or self.quran_translation)
-                
+        data, check = self._parse_ayahs(res)
+        if not check:
+            return data
+        return data["data"]["ayahs"]
+
+    def _editions_route(self, citation: str = "", *, chapter: NUMBER = None, translations: List[str]) -> str:
+        if self.validate_references:
+            if chapter:
+                QURAN_STRUCTURE.check_surah(chapter)
             else:
-                url = self.urls["quran"]["verse"](citation, translation or self.quran_translation)
-
-            if offset:
-                params["offset"] = offset
-            
-            if limit:
-                params["limit"] = limit
-                
-            res = self.request(url, params=params)
-            data, check = self._parse_ayahs(res)
-            if not check:
-                return {**data, "session": self.__session}
-            return [{**ayah, "session": self.__session} for ayah in data ["data"]["ayahs"]]
+                QURAN_STRUCTURE.parse(citation)
+        if chapter:
+            return self.urls["quran"]["chapter_editions"](chapter, translations)
+        return self.urls["quran"]["verse_editions"](str(citation), translations)
 
-    def search(self, keyword: str, chapter: NUMBER = "all", translation: str = "") -> List[dict]:
-        url = self.urls["quran"]["search"](keyword, chapter, translation or self.quran_translation)
-        data = self.request(url)
+    def _parse_editions(self, res: dict) -> List[dict]:
+        items = res["data"]
+        for item in items:
+            edition = item["edition"]
+            item["translation"] = edition
+            for ayah in item.get("ayahs") or ():
+                ayah["translation"] = edition
+            surah = item.get("surah")
+            if surah:
+                surah["translation"] = edition
+        return items
+
+    def _search_route(self, keyword: str, chapter: NUMBER = "all", translation: str = "") -> str:
+        if self.validate_references and str(chapter) != "all":
+            QURAN_STRUCTURE.check_surah(chapter)
+        return self.urls["quran"]["search"](keyword, str(chapter), translation or self.quran_translation)
+
+    def _parse_search(self, data: dict) -> List[dict]:
         verses = data["data"]["matches"]
         for verse in verses:
             verse["translation"] = verse["edition"]
             verse["surah"]["translation"] = verse["edition"]
-        return [{**ayah, "session": self.__session} for ayah in verses]
\ No newline at end of file
+        return verses
+
+
+class HTTPClient(BaseHTTPClient):
+    def __init__(
+        self,
+        *,
+        quran_translation = "en.asad",
+        bible_translation = "kjv",
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
+        coalesce: bool = True,
+        hooks: Optional[Hooks] = None,
+        transport: Optional[Transport] = None,
+        validate_references: bool = True,
+        session_per_thread: bool = False
+    ) -> None:
+        super().__init__(
+            quran_translation=quran_translation,
+            bible_translation=bible_translation,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            decoder=decoder,
+            coalesce=coalesce,
+            hooks=hooks,
+            validate_references=validate_references
+        )
+        if transport is not None and session_per_thread:
+            raise ValueError("session_per_thread only applies to the default transport, pass RequestsTransport(per_thread=True) instead")
+
+        # A transport passed in may be shared by other clients, so only our own one is closed.
+        self.transport = transport or RequestsTransport(per_thread=session_per_thread)
+        self.__owns_transport = transport is None
+
+    @property
+    def session(self) -> Optional[requests.Session]:
+        return self.transport.session
+
+    def close(self) -> None:
+        if self.__owns_transport:
+            self.transport.close()
+
+    def request(
+        self,
+        url: str,
+        method: str = "get",
+        *args,
+        **kwargs
+    ) -> dict:
+        if method.lower() not in METHODS:
+            raise AttributeError(f"Cannot find method: {method}")
+
+        url = url.replace(" ", "%20")
+        key = self._cache_key(url, method, kwargs.get("params"))
+        data = self._from_cache(key, url)
+        if data is not MISSING:
+            return data
+
+        flight = self._flight_key(url, method, kwargs.get("params"))
+        if flight is not None:
+            return self.flights.do(flight, lambda: self._send(method, url, key, *args, **kwargs))
+        return self._send(method, url, key, *args, **kwargs)
+
+    def _send(self, method: str, url: str, key: Optional[str], *args, **kwargs) -> dict:
+        trace = self._trace(method, url)
+        attempt = 0
+        try:
+            while True:
+                with self.rate_limiter.limit(url) if self.rate_limiter else nullcontext():
+                    res = self.transport.request(method, url, *args, **kwargs)
+
+                if res.status_code != 429:
+                    break
+                delay = self._retry_delay(url, attempt, res.headers.get("Retry-After"))
+                if trace is not None:
+                    trace.retry(attempt, delay)
+                time.sleep(delay)
+                attempt += 1
+
+            if trace is not None:
+                trace.decoding()
+            data = self.decoder(res.content)
+        except Exception as e:
+            if trace is not None:
+                trace.end(None, error=e)
+            raise
+
+        if trace is not None:
+            trace.end(res.status_code, len(res.content))
+        self._store_response(key, res.status_code, data)
+        return data
+
+    def fetch_book(self, book: str = "", *, translation: str = "") -> dict:
+        url = self._book_route(book, translation=translation)
+        return self._parse_book(self.request(url))
+
+    def stream_book(self, book: str = "", *, translation: str = "", chunk_size: int = 65536) -> Iterator[dict]:
+        # Same surahs as fetch_book, yielded while the body is still downloading. Not cached or coalesced.
+        url = self._book_route(book, translation=translation).replace(" ", "%20")
+        edition = self._stream_edition(translation)
+        parser = ArrayStream("surahs")
+        # Duck-typed transports without stream() get the whole body as one chunk.
+        stream = getattr(self.transport, "stream", None) or (lambda *args, **kwargs: Transport.stream(self.transport, *args, **kwargs))
+        trace = self._trace("get", url)
+        size = 0
+        attempt = 0
+        try:
+            while True:
+                with ExitStack() as response:
+                    # The rate limiter slot is given back once the headers are in, a slow consumer does not keep it.
+                    with self.rate_limiter.limit(url) if self.rate_limiter else nullcontext():
+                        res = response.enter_context(stream("get", url, chunk_size=chunk_size))
+                    if res.status_code != 429:
+                        if trace is not None:
+                            trace.decoding()
+                        for chunk in res.chunks:
+                            size += len(chunk)
+                            yield from self._stream_surahs(parser.feed(chunk), edition)
+                        break
+                    retry_after = res.headers.get("Retry-After")
+
+                delay = self._retry_delay(url, attempt, retry_after)
+                if trace is not None:
+                    trace.retry(attempt, delay)
+                time.sleep(delay)
+                attempt += 1
+
+            surahs = parser.close()
+        except GeneratorExit:
+            # The consumer stopped early, which is not a failed request.
+            if trace is not None:
+                trace.end(res.status_code, size)
+            raise
+        except Exception as e:
+            if trace is not None:
+                trace.end(None, size, error=e)
+            raise
+
+        if trace is not None:
+            trace.end(res.status_code, size)
+        surahs = self._finish_stream(res.status_code, parser.document, surahs, edition)
+
+        yield from surahs
+
+    def fetch_book_chapter(
+        self,
+        chapter,
+        *,
+        book: str = "",
+        beginning_verse: NUMBER = "",
+        ending_verse: NUMBER = "",
+        translation = ""
+    ) -> dict:
+        url = self._book_chapter_route(chapter, book=book, translation=translation)
+        return self._parse_book_chapter(self.request(url), book=book)
+
+    def fetch_chapter_verse(
+        self,
+        book: str = "",
+        *,
+        citation: str,
+        translation: str = "",
+        **kwargs
+    ) -> Union[dict, List[dict]]:
+        url, params = self._chapter_verse_route(book, citation=citation, translation=translation, **kwargs)
+        res = self.request(url, params=params)
+        return self._parse_chapter_verse(res, book=book)
+
+    def search(self, keyword: str, chapter: NUMBER = "all", translation: str = "") -> List[dict]:
+        url = self._search_route(keyword, chapter, translation)
+        return self._parse_search(self.request(url))
+
+    def fetch_editions(self, citation: str = "", *, chapter: NUMBER = None, translations: List[str]) -> List[dict]:
+        url = self._editions_route(citation, chapter=chapter, translations=translations)
+        return self._parse_editions(self.request(url))
+
+    def fetch_passages(
+        self,
+        references: Iterable[Tuple[str, str]],
+        *,
+        translation: str = "",
+        max_url_length: int = 2000
+    ) -> List[Union[List[dict], Exception]]:
+        references = list(references)
+        passages = {}
+        for url, indexes in self._passages_routes(references, translation, max_url_length, passages):
+            try:
+                passages.update(self._split_passages(self.request(url), references, indexes, translation))
+            except NotFound as e:
+                if len(indexes) == 1:
+                    passages[indexes[0]] = e
+                    continue
+                # One bad reference fails the whole compound request, retry them one by one.
+                for index in indexes:
+                    passages[index] = self.fetch_passages([references[index]], translation=translation)[0]
+        return [passages[index] for index in range(len(references))]
+
+
+def _aiohttp():
+    # Imported on first use, aiohttp alone takes longer to import than the rest of the package.
+    try:
+        import aiohttp
+    except ImportError:
+        raise RuntimeError("aiohttp is required for AsyncHTTPClient, install it with: pip install holybooks[async]") from None
+    return aiohttp
+
+
+class AsyncHTTPClient(BaseHTTPClient):
+    def __init__(
+        self,
+        *,
+        quran_translation = "en.asad",
+        bible_translation = "kjv",
+        session: Optional[aiohttp.ClientSession] = None,
+        connection_limit: int = 100,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
+        coalesce: bool = True,
+        hooks: Optional[Hooks] = None,
+        validate_references: bool = True
+    ) -> None:
+        _aiohttp()
+        super().__init__(
+            quran_translation=quran_translation,
+            bible_translation=bible_translation,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            decoder=decoder,
+            coalesce=coalesce,
+            hooks=hooks,
+            validate_references=validate_references
+        )
+        self.connection_limit = connection_limit
+        self.__session = session
+        self.__owns_session = session is None
+        after_fork(self)
+
+    def _after_fork(self) -> None:
+        # The parent's aiohttp session is dropped rather than closed, closing it would need the parent's event loop.
+        if self.__owns_session:
+            self.__session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.__session is None or self.__session.closed:
+            aiohttp = _aiohttp()
+            self.__session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connection_limit)
+            )
+            self.__owns_session = True
+        return self.__session
+
+    async def close(self) -> None:
+        if self.__owns_session and self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None
+
+    async def request(
+        self,
+        url: str,
+        method: str = "get",
+        *args,
+        **kwargs
+    ) -> dict:
+        session = self._get_session()
+        try:
+            req = getattr(session, method.lower())
+        except AttributeError:
+            raise AttributeError(f"Cannot find method: {method}")
+
+        url = url.replace(" ", "%20")
+        key = self._cache_key(url, method, kwargs.get("params"))
+        data = self._from_cache(key, url)
+        if data is not MISSING:
+            return data
+
+        flight = self._flight_key(url, method, kwargs.get("params"))
+        if flight is not None:
+            return await self.flights.do_async(flight, lambda: self._send(req, method, url, key, *args, **kwargs))
+        return await self._send(req, method, url, key, *args, **kwargs)
+
+    async def _send(self, req: Callable[..., Any], method: str, url: str, key: Optional[str], *args, **kwargs) -> dict:
+        trace = self._trace(method, url)
+        attempt = 0
+        try:
+            while True:
+                async with self.rate_limiter.limit_async(url) if self.rate_limiter else nullcontext():
+                    async with req(url, *args, **kwargs) as res:
+                        if res.status != 429:
+                            body = await res.read()
+                            break
+                        retry_after = res.headers.get("Retry-After")
+
+                delay = self._retry_delay(url, attempt, retry_after)
+                if trace is not None:
+                    trace.retry(attempt, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+            if trace is not None:
+                trace.decoding()
+            data = self.decoder(body)
+        except Exception as e:
+            if trace is not None:
+                trace.end(None, error=e)
+            raise
+
+        if trace is not None:
+            trace.end(res.status, len(body))
+        self._store_response(key, res.status, data)
+        return data
+
+    async def fetch_book(self, book: str = "", *, translation: str = "") -> dict:
+        url = self._book_route(book, translation=translation)
+        return self._parse_book(await self.request(url))
+
+    async def stream_book(self, book: str = "", *, translation: str = "", chunk_size: int = 65536) -> AsyncIterator[dict]:
+        url = self._book_route(book, translation=translation).replace(" ", "%20")
+        edition = self._stream_edition(translation)
+        parser = ArrayStream("surahs")
+        session = self._get_session()
+        trace = self._trace("get", url)
+        size = 0
+        attempt = 0
+        try:
+            while True:
+                async with AsyncExitStack() as response:
+                    async with self.rate_limiter.limit_async(url) if self.rate_limiter else nullcontext():
+                        res = await response.enter_async_context(session.get(url))
+                    if res.status != 429:
+                        if trace is not None:
+                            trace.decoding()
+                        async for chunk in res.content.iter_chunked(chunk_size):
+                            size += len(chunk)
+                            for surah in self._stream_surahs(parser.feed(chunk), edition):
+                                yield surah
+                        break
+                    retry_after = res.headers.get("Retry-After")
+
+                delay = self._retry_delay(url, attempt, retry_after)
+                if trace is not None:
+                    trace.retry(attempt, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+            surahs = parser.close()
+        except GeneratorExit:
+            if trace is not None:
+                trace.end(res.status, size)
+            raise
+        except Exception as e:
+            if trace is not None:
+                trace.end(None, size, error=e)
+            raise
+
+        if trace is not None:
+            trace.end(res.status, size)
+        surahs = self._finish_stream(res.status, parser.document, surahs, edition)
+
+        for surah in surahs:
+            yield surah
+
+    async def fetch_book_chapter(
+        self,
+        chapter,
+        *,
+        book: str = "",
+        beginning_verse: NUMBER = "",
+        ending_verse: NUMBER = "",
+        translation = ""
+    ) -> dict:
+        url = self._book_chapter_route(chapter, book=book, translation=translation)
+        return self._parse_book_chapter(await self.request(url), book=book)
+
+    async def fetch_chapter_verse(
+        self,
+        book: str = "",
+        *,
+        citation: str,
+        translation: str = "",
+        **kwargs
+    ) -> Union[dict, List[dict]]:
+        url, params = self._chapter_verse_route(book, citation=citation, translation=translation, **kwargs)
+        res = await self.request(url, params=params)
+        return self._parse_chapter_verse(res, book=book)
+
+    async def search(self, keyword: str, chapter: NUMBER = "all", translation: str = "") -> List[dict]:
+        url = self._search_route(keyword, chapter, translation)
+        return self._parse_search(await self.request(url))
+
+    async def fetch_editions(self, citation: str = "", *, chapter: NUMBER = None, translations: List[str]) -> List[dict]:
+        url = self._editions_route(citation, chapter=chapter, translations=translations)
+        return self._parse_editions(await self.request(url))
+
+    async def fetch_passages(
+        self,
+        references: Iterable[Tuple[str, str]],
+        *,
+        translation: str = "",
+        max_url_length: int = 2000
+    ) -> List[Union[List[dict], Exception]]:
+        references = list(references)
+        passages = {}
+
+        async def fetch(url: str, indexes: List[int]) -> None:
+            try:
+                passages.update(self._split_passages(await self.request(url), references, indexes, translation))
+            except NotFound as e:
+                if len(indexes) == 1:
+                    passages[indexes[0]] = e
+                    return
+                singles = await asyncio.gather(*(
+                    self.fetch_passages([references[index]], translation=translation) for index in indexes
+                ))
+                passages.update((index, single[0]) for index, single in zip(indexes, singles))
+
+        routes = self._passages_routes(references, translation, max_url_length, passages)
+        await asyncio.gather(*(fetch(url, indexes) for url, indexes in routes))
+        return [passages[index] for index in range(len(references))]
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from bisect import bisect_left
+from collections import defaultdict
+from typing import TYPE_CHECKING
+from .fork import after_fork
+
+if TYPE_CHECKING:
+    from typing import Optional, Callable, Dict, List, Tuple, Iterable, Any
+
+
+__all__ = (
+    "EVENTS",
+    "Hooks",
+    "RequestTrace",
+    "Histogram",
+    "MetricsCollector",
+)
+
+EVENTS = (
+    "request_start",
+    "request_end",
+    "retry",
+    "cache_hit",
+    "cache_miss",
+    "model_build",
+)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Hooks:
+    def __init__(self) -> None:
+        self._callbacks: Dict[str, List[Callable[..., None]]] = {}
+
+    def __bool__(self) -> bool:
+        # Clients only start timing anything when at least one callback is registered.
+        return bool(self._callbacks)
+
+    def __repr__(self) -> str:
+        return f"Hooks(events={sorted(self._callbacks)})"
+
+    def on(self, event: str, callback: Optional[Callable[..., None]] = None):
+        if event not in EVENTS:
+            raise ValueError(f"Unknown event: {event}, expected one of {', '.join(EVENTS)}")
+
+        def register(callback: Callable[..., None]) -> Callable[..., None]:
+            self._callbacks.setdefault(event, []).append(callback)
+            return callback
+
+        return register if callback is None else register(callback)
+
+    def off(self, event: str, callback: Callable[..., None]) -> None:
+        callbacks = self._callbacks.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            self._callbacks.pop(event, None)
+
+    def emit(self, event: str, **fields) -> None:
+        for callback in self._callbacks.get(event, ()):
+            callback(**fields)
+
+    def request(self, endpoint: str, method: str, url: str) -> RequestTrace:
+        return RequestTrace(self, endpoint, method, url)
+
+
+class RequestTrace:
+    __slots__ = ("hooks", "endpoint", "method", "url", "start", "decode_start", "retries")
+
+    def __init__(self, hooks: Hooks, endpoint: str, method: str, url: str) -> None:
+        self.hooks = hooks
+        self.endpoint = endpoint
+        self.method = method.upper()
+        self.url = url
+        self.retries = 0
+        self.decode_start = None
+        hooks.emit("request_start", endpoint=endpoint, method=self.method, url=url)
+        self.start = time.perf_counter()
+
+    def retry(self, attempt: int, delay: float) -> None:
+        self.retries = attempt + 1
+        self.hooks.emit("retry", endpoint=self.endpoint, url=self.url, attempt=attempt, delay=delay)
+
+    def decoding(self) -> None:
+        self.decode_start = time.perf_counter()
+
+    def end(self, status: Optional[int], size: int = 0, error: Optional[BaseException] = None) -> None:
+        now = time.perf_counter()
+        self.hooks.emit(
+            "request_end",
+            endpoint=self.endpoint,
+            method=self.method,
+            url=self.url,
+            status=status,
+            size=size,
+            elapsed=now - self.start,
+            decode_time=now - self.decode_start if self.decode_start is not None else 0.0,
+            retries=self.retries,
+            error=error
+        )
+
+
+def timed_build(hooks: Optional[Hooks], model: str, build: Callable[[], List[Any]]) -> List[Any]:
+    if not hooks:
+        return build()
+
+    start = time.perf_counter()
+    built = build()
+    hooks.emit("model_build", model=model, count=len(built), elapsed=time.perf_counter() - start)
+    return built
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count}, sum={self.sum:.6f})"
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        # Upper bound of the bucket holding the q-th observation.
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float("inf")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": {_format_bound(bound): total for bound, total in self.cumulative()},
+        }
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    items = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+    return "{" + items + "}" if items else ""
+
+
+class MetricsCollector:
+    def __init__(self, hooks: Optional[Hooks] = None, *, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+        after_fork(self)
+
+        self.hooks.on("request_end", self._on_request_end)
+        self.hooks.on("retry", self._on_retry)
+        self.hooks.on("cache_hit", self._on_cache_hit)
+        self.hooks.on("cache_miss", self._on_cache_miss)
+        self.hooks.on("model_build", self._on_model_build)
+
+    def __repr__(self) -> str:
+        return f"MetricsCollector(endpoints={sorted(self.latency)})"
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.latency: Dict[str, Histogram] = defaultdict(lambda: Histogram(self.buckets))
+            self.decode: Dict[str, Histogram] = defaultdict(lambda: Histogram(self.buckets))
+            self.builds: Dict[str, Histogram] = defaultdict(lambda: Histogram(self.buckets))
+            self.requests: Dict[Tuple[str, str], int] = defaultdict(int)
+            self.bytes: Dict[str, int] = defaultdict(int)
+            self.retries: Dict[str, int] = defaultdict(int)
+            self.errors: Dict[str, int] = defaultdict(int)
+            self.cache_hits: Dict[str, int] = defaultdict(int)
+            self.cache_misses: Dict[str, int] = defaultdict(int)
+            self.models: Dict[str, int] = defaultdict(int)
+
+    def close(self) -> None:
+        self.hooks.off("request_end", self._on_request_end)
+        self.hooks.off("retry", self._on_retry)
+        self.hooks.off("cache_hit", self._on_cache_hit)
+        self.hooks.off("cache_miss", self._on_cache_miss)
+        self.hooks.off("model_build", self._on_model_build)
+
+    def _on_request_end(self, *, endpoint: str, status: Optional[int], size: int, elapsed: float, decode_time: float, error, **_) -> None:
+        with self._lock:
+            self.latency[endpoint].observe(elapsed)
+            self.requests[(endpoint, str(status) if status is not None else "error")] += 1
+            self.bytes[endpoint] += size
+            if error is not None:
+                self.errors[endpoint] += 1
+            else:
+                self.decode[endpoint].observe(decode_time)
+
+    def _on_retry(self, *, endpoint: str, **_) -> None:
+        with self._lock:
+            self.retries[endpoint] += 1
+
+    def _on_cache_hit(self, *, endpoint: str, **_) -> None:
+        with self._lock:
+            self.cache_hits[endpoint] += 1
+
+    def _on_cache_miss(self, *, endpoint: str, **_) -> None:
+        with self._lock:
+            self.cache_misses[endpoint] += 1
+
+    def _on_model_build(self, *, model: str, count: int, elapsed: float, **_) -> None:
+        with self._lock:
+            self.builds[model].observe(elapsed)
+            self.models[model] += count
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = sorted(set(self.latency) | set(self.cache_hits) | set(self.cache_misses))
+            return {
+                "endpoints": {
+                    endpoint: {
+                        "requests": {status: n for (e, status), n in sorted(self.requests.items()) if e == endpoint},
+                        "latency": self.latency[endpoint].as_dict() if endpoint in self.latency else None,
+                        "decode": self.decode[endpoint].as_dict() if endpoint in self.decode else None,
+                        "bytes": self.bytes.get(endpoint, 0),
+                        "retries": self.retries.get(endpoint, 0),
+                        "errors": self.errors.get(endpoint, 0),
+                        "cache_hits": self.cache_hits.get(endpoint, 0),
+                        "cache_misses": self.cache_misses.get(endpoint, 0),
+                    }
+                    for endpoint in endpoints
+                },
+                "models": {
+                    model: {"built": self.models[model], "build": histogram.as_dict()}
+                    for model, histogram in sorted(self.builds.items())
+                },
+            }
+
+    def to_prometheus(self, prefix: str = "holybooks") -> str:
+        lines = []
+
+        def histograms(name: str, doc: str, label: str, values: Dict[str, Histogram]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {doc}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for key, histogram in sorted(values.items()):
+                for bound, total in histogram.cumulative():
+                    lines.append(f"{prefix}_{name}_bucket{_labels(**{label: key, 'le': _format_bound(bound)})} {total}")
+                lines.append(f"{prefix}_{name}_sum{_labels(**{label: key})} {histogram.sum}")
+                lines.append(f"{prefix}_{name}_count{_labels(**{label: key})} {histogram.count}")
+
+        def counters(name: str, doc: str, values: Dict[Any, int], label: str = "endpoint") -> None:
+            lines.append(f"# HELP {prefix}_{name} {doc}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for key, value in sorted(values.items()):
+                labels = {"endpoint": key[0], "status": key[1]} if isinstance(key, tuple) else {label: key}
+                lines.append(f"{prefix}_{name}{_labels(**labels)} {value}")
+
+        with self._lock:
+            histograms("request_duration_seconds", "Time from sending a request to decoding its response, retries included.", "endpoint", self.latency)
+            histograms("decode_duration_seconds", "Time spent decoding response bodies.", "endpoint", self.decode)
+            counters("requests_total", "Requests by endpoint and status code.", self.requests)
+            counters("response_bytes_total", "Response body bytes received.", self.bytes)
+            counters("retries_total", "Requests retried after a 429 response.", self.retries)
+            counters("request_errors_total", "Requests that raised before a response was decoded.", self.errors)
+            counters("cache_hits_total", "Responses served from the ResponseCache.", self.cache_hits)
+            counters("cache_misses_total", "ResponseCache lookups that missed.", self.cache_misses)
+            histograms("model_build_duration_seconds", "Time spent building model objects.", "model", self.builds)
+            counters("models_built_total", "Model objects built.", self.models, label="model")
+
+        return "\n".join(lines) + "\n"
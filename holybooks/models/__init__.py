@@ -2,3 +2,4 @@ from .quran import *
 from .bible import *
 from .mixins import *
 from .translation import *
+from .columnar import *
@@ -10,6 +10,8 @@ __all__ = (
 )
 
 class BibleBook(Book):
+    __slots__ = ("id", "chapter")
+
     def __init__(self, *args, **kwargs) -> None:
         self.id = kwargs.pop("id")
         self.chapter = kwargs.pop("chapter")
@@ -22,6 +24,8 @@ class BibleBook(Book):
         return self.name
 
 class BibleChapter(Chapter):
+    __slots__ = ("verse", "verses", "book_name", "book_id", "reference", "full_text", "translation")
+
     def __init__(self, *args, **kwargs) -> None:
         self.verse = kwargs.pop("verse", None)
         self.verses = [BibleVerse(**data) for data in kwargs.pop("verses")] if kwargs.get("verses", None) else None
@@ -53,6 +57,8 @@ class BibleChapter(Chapter):
 
 
 class BibleVerse(Verse):
+    __slots__ = ("book_id", "book_name", "chapter_number", "reference", "translation")
+
     def __init__(self, *args, **kwargs) -> None:
         self.book_id = kwargs.pop("book_id")
         self.book_name = kwargs.pop("book_name")
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from array import array
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from .quran import Surah, Ayah
+from .translation import QuranTranslation
+
+if TYPE_CHECKING:
+    import numpy
+    from typing import Optional, Union, List, Dict, Iterable, Tuple
+    from .quran import Quran
+
+
+__all__ = (
+    "QuranColumns",
+)
+
+_FIELDS = {
+    "number": "number",
+    "surah": None,
+    "number_in_surah": "numberInSurah",
+    "juz": "juz",
+    "manzil": "manzil",
+    "page": "page",
+    "ruku": "ruku",
+    "hizb_quarter": "hizbQuarter",
+}
+
+# Payload keys held in the columns, everything else an ayah has (audio, audioSecondary, ...) is kept as is.
+_COLUMN_KEYS = frozenset(key for key in _FIELDS.values() if key) | {"text", "sajda", "surah", "translation", "session"}
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    # Imported on first use, numpy would otherwise be loaded with every model.
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class QuranColumns:
+    __slots__ = ("translation", "surahs", "columns", "sajda", "sajdas", "extras", "_text", "_offsets", "_surah_models", "_arrays", "_http")
+
+    def __init__(self, payload: dict, *, http = None, translation: Optional[QuranTranslation] = None) -> None:
+        data = payload.get("data", payload)
+        edition = data.get("edition") or data.get("translation")
+        self.translation = translation or QuranTranslation(**edition)
+        self.surahs: List[dict] = []
+        self.columns: Dict[str, array] = {name: array("H") for name in _FIELDS}
+        self.sajda = array("B")
+        self.sajdas: Dict[int, dict] = {}
+        self.extras: Dict[int, dict] = {}
+        self._offsets = array("L", [0])
+        self._surah_models: Dict[int, Surah] = {}
+        self._arrays: Optional[Dict[str, numpy.ndarray]] = None
+        self._http = http
+
+        texts = []
+        size = 0
+        for surah in data["surahs"]:
+            self.surahs.append({k: v for k, v in surah.items() if k not in ("ayahs", "translation", "session")})
+            for ayah in surah["ayahs"]:
+                index = len(self.sajda)
+                for name, key in _FIELDS.items():
+                    self.columns[name].append(int(ayah[key]) if key else int(surah["number"]))
+
+                sajda = ayah.get("sajda")
+                self.sajda.append(1 if sajda else 0)
+                if sajda:
+                    self.sajdas[index] = sajda
+                extra = {k: v for k, v in ayah.items() if k not in _COLUMN_KEYS}
+                if extra:
+                    self.extras[index] = extra
+
+                text = (ayah.get("text") or "").encode("utf-8")
+                texts.append(text)
+                size += len(text)
+                self._offsets.append(size)
+
+        self._text = b"".join(texts)
+
+    def __len__(self) -> int:
+        return len(self.sajda)
+
+    def __repr__(self) -> str:
+        return f"QuranColumns(ayahs={len(self)}, translation={self.translation})"
+
+    def __getitem__(self, index: int) -> Ayah:
+        return self.ayah(index)
+
+    @classmethod
+    def from_quran(cls, quran: Quran) -> QuranColumns:
+        return quran.to_columns()
+
+    def column(self, name: str) -> array:
+        if name == "sajda":
+            return self.sajda
+        return self.columns[name]
+
+    def text(self, index: int) -> str:
+        return self._text[self._offsets[index]:self._offsets[index + 1]].decode("utf-8")
+
+    def texts(self, indexes: Optional[Iterable[int]] = None) -> List[str]:
+        if indexes is None:
+            indexes = range(len(self))
+        return [self.text(i) for i in indexes]
+
+    def to_numpy(self) -> Dict[str, numpy.ndarray]:
+        # The arrays are built once, the columns do not change after __init__.
+        if self._arrays is None:
+            numpy = _numpy()
+            if numpy is None:
+                raise RuntimeError("numpy is required for QuranColumns.to_numpy, install it with: pip install holybooks[numpy]")
+
+            arrays = {name: numpy.frombuffer(column, dtype=numpy.uint16) for name, column in self.columns.items()}
+            arrays["sajda"] = numpy.frombuffer(self.sajda, dtype=numpy.uint8).astype(bool)
+            arrays["text_offsets"] = numpy.array(self._offsets, dtype=numpy.int64)
+            # Every caller gets these same arrays and most are views of the columns, so they are read-only.
+            for arr in arrays.values():
+                arr.flags.writeable = False
+            self._arrays = arrays
+        return dict(self._arrays)
+
+    def select(self, **conditions: Union[int, Tuple[int, int], range, bool]) -> List[int]:
+        if _numpy() is not None:
+            return self._select_numpy(conditions)
+
+        indexes = range(len(self))
+        for name, value in conditions.items():
+            column = self.column(name)
+            if isinstance(value, bool):
+                indexes = [i for i in indexes if bool(column[i]) is value]
+            elif isinstance(value, (tuple, range)):
+                low, high = (value.start, value.stop - 1) if isinstance(value, range) else value
+                indexes = [i for i in indexes if low <= column[i] <= high]
+            else:
+                indexes = [i for i in indexes if column[i] == value]
+        return list(indexes)
+
+    def _select_numpy(self, conditions: dict) -> List[int]:
+        numpy = _numpy()
+        arrays = self.to_numpy()
+        mask = numpy.ones(len(self), dtype=bool)
+        for name, value in conditions.items():
+            column = arrays[name]
+            if isinstance(value, bool):
+                mask &= column == value
+            elif isinstance(value, (tuple, range)):
+                low, high = (value.start, value.stop - 1) if isinstance(value, range) else value
+                mask &= (column >= low) & (column <= high)
+            else:
+                mask &= column == value
+        return numpy.flatnonzero(mask).tolist()
+
+    def _surah(self, number: int) -> Surah:
+        surah = self._surah_models.get(number)
+        if surah is None:
+            surah = self._surah_models[number] = Surah(
+                data=dict(self.surahs[number - 1]),
+                http=self._http,
+                translation=self.translation
+            )
+        return surah
+
+    def ayah(self, index: int) -> Ayah:
+        if index < 0:
+            index += len(self)
+        columns = self.columns
+        data = {
+            **self.extras.get(index, {}),
+            "number": columns["number"][index],
+            "text": self.text(index),
+            "numberInSurah": columns["number_in_surah"][index],
+            "juz": columns["juz"][index],
+            "manzil": columns["manzil"][index],
+            "page": columns["page"][index],
+            "ruku": columns["ruku"][index],
+            "hizbQuarter": columns["hizb_quarter"][index],
+            "sajda": self.sajdas.get(index, False),
+        }
+        kwargs = {"data": data, "surah": self._surah(columns["surah"][index]), "translation": self.translation}
+        if self._http is not None:
+            kwargs["http"] = self._http
+        return Ayah(**kwargs)
+
+    def ayahs(self, indexes: Iterable[int]) -> List[Ayah]:
+        return [self.ayah(i) for i in indexes]
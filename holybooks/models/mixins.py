@@ -18,19 +18,23 @@ __all__ = (
 class Translation:
     name: str
     id: NUMBER
-    
+
 class Comparable:
+    __slots__ = ()
+
     def __eq__(self, other):
         o = getattr(self, "number", None)
         other= getattr("number", other, None)
         if o and other:
             return o == other and o.chapter == other.chapter and o.book == other.book
         return False
-        
+
 class Book(Comparable):
+    __slots__ = ("name", "translation")
+
     def __init__(
-        self, 
-        name: str, 
+        self,
+        name: str,
         *,
         translation: Union[BibleTranslation, QuranTranslation]
     ) -> None:
@@ -39,6 +43,8 @@ class Book(Comparable):
 
 
 class Chapter(Comparable):
+    __slots__ = ("number",)
+
     def __init__(
         self,
         number: int
@@ -46,12 +52,13 @@ class Chapter(Comparable):
         self.number = number
 
 class Verse(Comparable):
+    __slots__ = ("text", "number")
+
     def __init__(
-        self, 
+        self,
         text: str,
         number: int
     ) -> None:
         self.text = text
         self.number = number
 
-    
\ No newline at end of file
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import requests
+import os
+import warnings
 
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
 from .mixins import Book, Chapter, Verse
 from .translation import QuranTranslation
+from ..audio import download_audio, download_audios
+from ..metrics import timed_build
 
 if TYPE_CHECKING:
-    from typing import Union, Optional, List, Self
-    from io import BufferedWriter
+    from typing import Union, Optional, List, Callable, Mapping, Self
     from ..constants import NUMBER
+    from .columnar import QuranColumns
+    from requests import Session
+    from ..http import HTTPClient
 
 
 __all__ = (
@@ -19,6 +24,16 @@ __all__ = (
     "Ayah"
 )
 
+def _http(kwargs: dict) -> Optional[HTTPClient]:
+    # Models used to take the client's requests session, they look it up on the HTTP client now.
+    if "session" in kwargs:
+        warnings.warn(
+            "session= is ignored by the Quran models, pass the HTTP client as http= instead",
+            DeprecationWarning,
+            stacklevel=3
+        )
+    return kwargs.get("http", None)
+
 @dataclass
 class Sajda:
     id: NUMBER
@@ -26,10 +41,13 @@ class Sajda:
     obligatory: bool
 
 class Quran(Book):
+    __slots__ = ("data", "__http", "_hooks", "_surahs")
+
     def __init__(self, *args, **kwargs) -> None:
         self.data = kwargs.pop("data")
-        self.__session = kwargs.get("session", requests.Session())
-        self._surahs = [Surah(data=d, session=self.__session) for d in self.data.get("surahs")]
+        self.__http = _http(kwargs)
+        self._hooks = kwargs.get("hooks", None)
+        self._surahs = None
         super().__init__("Quran", translation=QuranTranslation(**self.data.pop("translation")))
 
     def __repr__(self):
@@ -37,30 +55,47 @@ class Quran(Book):
 
     def __str__(self):
         return self.name
-        
+
+    def to_columns(self) -> QuranColumns:
+        from .columnar import QuranColumns
+        return QuranColumns(self.data, http=self.__http, translation=self.translation)
+
     @property
     def surahs(self) -> Optional[List[Surah]]:
+        if self._surahs is None:
+            self._surahs = timed_build(self._hooks, "Surah", lambda: [
+                Surah(data=d, http=self.__http, hooks=self._hooks, translation=self.translation)
+                for d in self.data.get("surahs")
+            ])
         return self._surahs
 
 class Surah(Chapter):
+    __slots__ = ("raw_data", "data", "translation", "__http", "_hooks", "_ayats")
+
     def __init__(self, *args, **kwargs) -> None:
         self.raw_data = kwargs.pop("data")
         self.data = self.raw_data.pop("data", None) or self.raw_data
-        self.translation = QuranTranslation(**self.data.get("translation"))
-        self.__session = kwargs.get("session", None)
+        self.translation = kwargs.pop("translation", None) or QuranTranslation(**self.data.get("translation"))
+        self.__http = _http(kwargs)
+        self._hooks = kwargs.get("hooks", None)
+        self._ayats = None
         super().__init__(self.data.get("number"))
 
+    def _session(self) -> Optional[Session]:
+        # Looked up on every download: the client hands out a per-thread session and replaces it after a fork.
+        return self.__http.session if self.__http is not None else None
+
     def __repr__(self):
         return f"Surah(name={self.name}, number={self.number})"
-        
+
     @property
     def name(self) -> str:
         return self.data.get("name")
-        
+
     @property
     def english_name(self) -> str:
         return self.data.get("englishName")
-        
+
     @property
     def english_name_translation(self) -> str:
         return self.data.get("englishNameTranslation")
@@ -71,34 +106,71 @@ class Surah(Chapter):
 
     @property
     def number_of_ayats(self) -> NUMBER:
-        return self.data.get("numberOfAyahs") or len(self.ayats)
+        return self.data.get("numberOfAyahs") or len(self.data.get("ayahs") or ())
+
+    def download_audio(
+        self,
+        directory: str = ".",
+        ext: str = "mp3",
+        *,
+        max_workers: int = 8,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+        checksums: Optional[Mapping[int, str]] = None,
+        **kwargs
+    ) -> List[Union[str, Exception]]:
+        # checksums maps ayah numbers in the surah to the hash of their file, ayahs missing from it are not checked.
+        os.makedirs(directory, exist_ok=True)
+        checksums = checksums or {}
+        jobs = [
+            (
+                ayah.audio,
+                os.path.join(directory, f"{self.number}-{ayah.number_in_surah}.{ext}"),
+                {"checksum": checksums[ayah.number_in_surah]} if ayah.number_in_surah in checksums else {}
+            )
+            for ayah in self.ayats if ayah.audio
+        ]
+        return download_audios(jobs, session=self._session(), max_workers=max_workers, progress=progress, **kwargs)
 
     @property
     def ayats(self) -> List[Ayah]:
-        return [Ayah(data=data, surah=self, session=self.__session) for data in self.data.get("ayahs")]
+        if self._ayats is None:
+            self._ayats = timed_build(self._hooks, "Ayah", lambda: [
+                Ayah(data=data, surah=self, http=self.__http, hooks=self._hooks, translation=self.translation)
+                for data in self.data.get("ayahs") or ()
+            ])
+        return self._ayats
 
 class Ayah(Verse):
+    __slots__ = ("raw_data", "data", "translation", "__http", "_hooks", "_surah")
+
     def __init__(self, *args, **kwargs) -> None:
         self.raw_data = kwargs.pop("data")
         self.data = self.raw_data.get("data") or self.raw_data
-        self.translation = QuranTranslation(**self.data.get("translation"))
-        self.__session = kwargs.get("session", requests.Session())
-        self._surah = kwargs.pop("surah", None) or Surah(data=self.raw_data.get("surah") or self.data.get("surah"), session=self.__session)
+        self.translation = kwargs.pop("translation", None) or QuranTranslation(**self.data.get("translation"))
+        self.__http = _http(kwargs)
+        self._hooks = kwargs.get("hooks", None)
+        self._surah = kwargs.pop("surah", None)
         super().__init__(self.data.get("text"), self.data.get("number"))
 
+    def _session(self) -> Optional[Session]:
+        return self.__http.session if self.__http is not None else None
+
     def __repr__(self):
         return f"Ayah(number={self.number_in_surah}, surah={repr(self.surah)})"
 
     def __str__(self):
         return self.text
 
-    def download_audio(self, filename: str = "", ext: str = "mp3") -> Optional[BufferedWriter]:
+    def download_audio(self, filename: str = "", ext: str = "mp3", **kwargs) -> Optional[str]:
         if not self.audio:
             return None
-        with open(filename + "." +  ext or f"{self.surah.number}:{self.number_in_surah}.{ext}", "wb") as f:
-            f.write(self.__session.get(self.audio).content)
-        return f
-        
+        return download_audio(
+            self.audio,
+            (filename or f"{self.surah.number}-{self.number_in_surah}") + "." + ext,
+            session=self._session(),
+            **kwargs
+        )
+
     @property
     def audio(self) -> Optional[str]:
         return self.data.get("audio")
@@ -134,4 +206,11 @@ class Ayah(Verse):
     
     @property
     def surah(self) -> Surah:
+        if self._surah is None:
+            self._surah = Surah(
+                data=self.raw_data.get("surah") or self.data.get("surah"),
+                http=self.__http,
+                hooks=self._hooks,
+                translation=self.translation
+            )
         return self._surah
\ No newline at end of file
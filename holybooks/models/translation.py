@@ -11,15 +11,21 @@ __all__ = (
 
 class QuranTranslation(Translation):
     def __init__(self, *args, **kwargs) -> None:
-        self.language = kwargs.pop("language", None)
-        self.author = kwargs.pop("englishName", None)
-        self.format = kwargs.pop("format", None)
-        self.type = kwargs.pop("type", None)
-        self.direction = kwargs.pop("direction", None)
         super().__init__(**{
             "name": kwargs.pop("name"),
             "id": kwargs.pop("identifier"),
         })
+        self._update(kwargs)
+
+    def _update(self, edition: dict) -> None:
+        # Also fills in a translation made before its edition details were known, like a streamed one.
+        self.name = edition.get("name", self.name)
+        self.id = edition.get("identifier", self.id)
+        self.language = edition.get("language")
+        self.author = edition.get("englishName")
+        self.format = edition.get("format")
+        self.type = edition.get("type")
+        self.direction = edition.get("direction")
 
 class BibleTranslation(Translation):
     def __init__(self, *args, **kwargs) -> None:
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING
+from .errors import InvalidReference
+from .fork import after_fork
+from .references import find_book, parse_reference
+from .structure import QURAN_STRUCTURE
+
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Tuple, Hashable, Callable, Iterable
+    from .constants import NUMBER
+    from .http import HTTPClient
+    from .references import BibleBook
+
+
+__all__ = (
+    "Prefetcher",
+)
+
+
+class _Stream:
+    # The last range read from one stream (an edition's ayahs, a book's verses...) and the run of
+    # consecutive reads in the same direction that led to it.
+    __slots__ = ("first", "last", "direction", "run")
+
+    def __init__(self) -> None:
+        self.first: Optional[int] = None
+        self.last: Optional[int] = None
+        self.direction = 0
+        self.run = 0
+
+
+@lru_cache(maxsize=None)
+def _verse_offsets(book: BibleBook) -> Tuple[int, ...]:
+    return (0, *accumulate(book.verses))
+
+
+def _verse_position(book: BibleBook, chapter: int, verse: int) -> int:
+    return _verse_offsets(book)[chapter - 1] + verse
+
+
+def _verse_citation(book: BibleBook, position: int) -> str:
+    offsets = _verse_offsets(book)
+    chapter = next(i for i in range(1, len(offsets)) if position <= offsets[i])
+    return f"{chapter}:{position - offsets[chapter - 1]}"
+
+
+class Prefetcher:
+    def __init__(
+        self,
+        *,
+        radius: int = 2,
+        max_window: int = 16,
+        max_workers: int = 2,
+        max_pending: int = 64,
+        min_accuracy: float = 0.2,
+        max_streams: int = 1024
+    ) -> None:
+        # A read with no pattern prefetches radius neighbours on each side. Consecutive reads in one
+        # direction prefetch ahead in that direction, the window doubling with every step up to max_window.
+        # Neighbours stop being guessed once less than min_accuracy of the prefetches are read.
+        self.radius = radius
+        self.max_window = max_window
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.min_accuracy = min_accuracy
+        self.max_streams = max_streams
+        self.issued = 0
+        self.used = 0
+        self.failed = 0
+        self._streams: OrderedDict[Hashable, _Stream] = OrderedDict()
+        self._prefetched: OrderedDict[Hashable, None] = OrderedDict()
+        self._pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        after_fork(self)
+
+    def __repr__(self) -> str:
+        return f"Prefetcher(issued={self.issued}, used={self.used}, failed={self.failed}, accuracy={self.accuracy:.2f})"
+
+    @property
+    def accuracy(self) -> float:
+        return self.used / self.issued if self.issued else 1.0
+
+    def _plan(self, key: Hashable, first: int, last: int, limit: int) -> List[int]:
+        with self._lock:
+            for position in range(first, last + 1):
+                if self._prefetched.pop((key, position), False) is None:
+                    self.used += 1
+
+            stream = self._streams.pop(key, None) or _Stream()
+            self._streams[key] = stream
+            if len(self._streams) > self.max_streams:
+                self._streams.popitem(last=False)
+
+            if stream.last is not None and first == stream.last + 1:
+                direction = 1
+            elif stream.first is not None and last == stream.first - 1:
+                direction = -1
+            else:
+                direction = 0
+            stream.run = stream.run + 1 if direction and direction == stream.direction else int(bool(direction))
+            stream.direction = direction
+            stream.first, stream.last = first, last
+
+            if stream.run:
+                window = min(self.max_window, 2 ** stream.run)
+                start = last + 1 if direction > 0 else first - 1
+                positions = [start + direction * i for i in range(window)]
+            elif self.issued < 20 or self.accuracy >= self.min_accuracy:
+                positions = [p for i in range(1, self.radius + 1) for p in (last + i, first - i)]
+            else:
+                positions = []
+            return [p for p in positions if 1 <= p <= limit and (key, p) not in self._prefetched]
+
+    def _submit(self, key: Hashable, positions: Iterable[int], fetch: Callable[[int], object]) -> None:
+        for position in positions:
+            with self._lock:
+                if self._pending >= self.max_pending:
+                    return
+                self._prefetched[(key, position)] = None
+                if len(self._prefetched) > 16 * self.max_pending:
+                    self._prefetched.popitem(last=False)
+                self._pending += 1
+                self.issued += 1
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="holybooks-prefetch")
+                executor = self._executor
+            executor.submit(self._run, fetch, position)
+
+    def _run(self, fetch: Callable[[int], object], position: int) -> None:
+        try:
+            fetch(position)
+        except Exception:
+            with self._lock:
+                self.failed += 1
+        finally:
+            with self._lock:
+                self._pending = max(0, self._pending - 1)
+
+    def ayah(self, http: HTTPClient, citation: NUMBER, translation: str = "") -> None:
+        # Ayahs are numbered across the whole Quran, so reading on from the last ayah of a surah continues into the next one.
+        try:
+            number = QURAN_STRUCTURE.parse(citation)
+        except InvalidReference:
+            return
+        key = ("ayah", translation or http.quran_translation)
+        fetch = lambda p: http.fetch_chapter_verse(citation="%d:%d" % QURAN_STRUCTURE.split(p), translation=translation)
+        self._submit(key, self._plan(key, number, number, QURAN_STRUCTURE.ayahs), fetch)
+
+    def surah(self, http: HTTPClient, chapter: NUMBER, translation: str = "") -> None:
+        try:
+            chapter = QURAN_STRUCTURE.check_surah(chapter)
+        except InvalidReference:
+            return
+        key = ("surah", translation or http.quran_translation)
+        fetch = lambda p: http.fetch_book_chapter(str(p), translation=translation)
+        self._submit(key, self._plan(key, chapter, chapter, QURAN_STRUCTURE.surahs), fetch)
+
+    def verse(self, http: HTTPClient, book: str, citation: str, translation: str = "") -> None:
+        # Verses are numbered across the book, so reading on from the end of a chapter continues into the next one.
+        try:
+            reference = parse_reference(book, citation)
+        except InvalidReference:
+            return
+        found = reference.book
+        positions = [_verse_position(found, chapter, verse) for chapter, verse in reference.keys()]
+        if not positions:
+            return
+        key = ("verse", found.id, translation or http.bible_translation)
+        fetch = lambda p: http.fetch_chapter_verse(book, citation=_verse_citation(found, p), translation=translation)
+        plan = self._plan(key, min(positions), max(positions), _verse_offsets(found)[-1])
+        self._submit(key, plan, fetch)
+
+    def chapter(self, http: HTTPClient, book: str, chapter: NUMBER) -> None:
+        try:
+            found = find_book(book)
+        except InvalidReference:
+            return
+        if not str(chapter).isdigit():
+            return
+        key = ("chapter", found.id)
+        fetch = lambda p: http.fetch_book_chapter(p, book=book)
+        self._submit(key, self._plan(key, int(chapter), int(chapter), found.chapters), fetch)
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._pending = 0
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _after_fork(self) -> None:
+        # The parent's worker threads do not exist in the child.
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = 0
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+import weakref
+
+from contextlib import contextmanager, asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+from .fork import after_fork
+
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Iterator, AsyncIterator
+
+
+__all__ = (
+    "TokenBucket",
+    "RateLimiter",
+)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be above 0")
+
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        after_fork(self)
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self.rate}, capacity={self.capacity})"
+
+    def reserve(self) -> float:
+        # Takes a token now and returns how long the caller has to wait before using it.
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        buckets: Optional[Dict[str, TokenBucket]] = None,
+        *,
+        default: Optional[TokenBucket] = None,
+        max_in_flight: int = 16,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 60.0
+    ) -> None:
+        if buckets is None:
+            buckets = {
+                "api.alquran.cloud": TokenBucket(10, 20),
+                # bible-api.com allows 15 requests every 30 seconds per IP.
+                "bible-api.com": TokenBucket(0.5, 15),
+            }
+
+        self.buckets = buckets
+        self.default = default
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._semaphore = threading.BoundedSemaphore(max_in_flight)
+        self._async_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+        after_fork(self)
+
+    def _after_fork(self) -> None:
+        # Slots taken by the parent's threads would never be given back in the child.
+        self._semaphore = threading.BoundedSemaphore(self.max_in_flight)
+        self._async_semaphores = weakref.WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(buckets={self.buckets}, max_in_flight={self.max_in_flight})"
+
+    def bucket(self, url: str) -> Optional[TokenBucket]:
+        return self.buckets.get(urlsplit(url).hostname or "", self.default)
+
+    def _reserve(self, url: str) -> float:
+        bucket = self.bucket(url)
+        return bucket.reserve() if bucket is not None else 0.0
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        wait = self._reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+        with self._semaphore:
+            yield
+
+    @asynccontextmanager
+    async def limit_async(self, url: str) -> AsyncIterator[None]:
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._async_semaphores[loop] = asyncio.Semaphore(self.max_in_flight)
+
+        wait = self._reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        async with semaphore:
+            yield
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def backoff(self, url: str, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        # Returns None once retries are exhausted, otherwise the delay before the next attempt.
+        if attempt >= self.max_retries:
+            return None
+
+        # A server asking for a longer wait than backoff_max is not waited on for longer than that either.
+        delay = self.parse_retry_after(retry_after)
+        if delay is None:
+            delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        else:
+            delay = min(delay, self.backoff_max)
+
+        bucket = self.bucket(url)
+        if bucket is not None:
+            bucket.pause(delay)
+        return delay
@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+import re
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+from .errors import InvalidReference
+
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Tuple, Iterator
+    from .constants import NUMBER
+
+
+__all__ = (
+    "BibleBook",
+    "VerseRange",
+    "BibleReference",
+    "BIBLE_BOOKS",
+    "KJV_VERSIFICATION",
+    "find_book",
+    "check_chapter",
+    "parse_reference",
+    "parse_references",
+)
+
+# name, bible-api.com book id, aliases, verses per chapter (KJV versification, 31102 verses).
+_BOOKS = (
+    ("Genesis", "GEN", "gen ge gn",
+        "31 25 24 26 32 22 24 22 29 32 32 20 18 24 21 16 27 33 38 18 34 24 20 67 34 35 46 22 35 43 55 32 20 31 29 43 36 30 23 23 57 38 34 34 28 34 31 22 33 26"),
+    ("Exodus", "EXO", "exod ex exo",
+        "22 25 22 31 23 30 25 32 35 29 10 51 22 31 27 36 16 27 25 26 36 31 33 18 40 37 21 43 46 38 18 35 23 35 35 38 29 31 43 38"),
+    ("Leviticus", "LEV", "lev le lv",
+        "17 16 17 35 19 30 38 36 24 20 47 8 59 57 33 34 16 30 37 27 24 33 44 23 55 46 34"),
+    ("Numbers", "NUM", "num nu nm nb",
+        "54 34 51 49 31 27 89 26 23 36 35 16 33 45 41 50 13 32 22 29 35 41 30 25 18 65 23 31 40 16 54 42 56 29 34 13"),
+    ("Deuteronomy", "DEU", "deut de dt",
+        "46 37 29 49 33 25 26 20 29 22 32 32 18 29 23 22 20 22 21 20 23 30 25 22 19 19 26 68 29 20 30 52 29 12"),
+    ("Joshua", "JOS", "josh jos jsh",
+        "18 24 17 24 15 27 26 35 27 43 23 24 33 15 63 10 18 28 51 9 45 34 16 33"),
+    ("Judges", "JDG", "judg jdg jg jdgs",
+        "36 23 31 24 31 40 25 35 57 18 40 15 25 20 20 31 13 31 30 48 25"),
+    ("Ruth", "RUT", "rth ru",
+        "22 23 18 22"),
+    ("1 Samuel", "1SA", "1sam 1sa 1sm",
+        "28 36 21 22 12 21 17 22 27 27 15 25 23 52 35 23 58 30 24 42 15 23 29 22 44 25 12 25 11 31 13"),
+    ("2 Samuel", "2SA", "2sam 2sa 2sm",
+        "27 32 39 12 25 23 29 18 13 19 27 31 39 33 37 23 29 33 43 26 22 51 39 25"),
+    ("1 Kings", "1KI", "1kgs 1ki 1kg",
+        "53 46 28 34 18 38 51 66 28 29 43 33 34 31 34 34 24 46 21 43 29 53"),
+    ("2 Kings", "2KI", "2kgs 2ki 2kg",
+        "18 25 27 44 27 33 20 29 37 36 21 21 25 29 38 20 41 37 37 21 26 20 37 20 30"),
+    ("1 Chronicles", "1CH", "1chr 1ch 1chron",
+        "54 55 24 43 26 81 40 40 44 14 47 40 14 17 29 43 27 17 19 8 30 19 32 31 31 32 34 21 30"),
+    ("2 Chronicles", "2CH", "2chr 2ch 2chron",
+        "17 18 17 22 14 42 22 18 31 19 23 16 22 15 19 14 19 34 11 37 20 12 21 27 28 23 9 27 36 27 21 33 25 33 27 23"),
+    ("Ezra", "EZR", "ezr",
+        "11 70 13 24 17 22 28 36 15 44"),
+    ("Nehemiah", "NEH", "neh ne",
+        "11 20 32 23 19 19 73 18 38 39 36 47 31"),
+    ("Esther", "EST", "esth est es",
+        "22 23 15 17 14 14 10 17 32 3"),
+    ("Job", "JOB", "jb",
+        "22 13 26 21 27 30 21 22 35 22 20 25 28 22 35 22 16 21 29 29 34 30 17 25 6 14 23 28 25 31 40 22 33 37 16 33 24 41 30 24 34 17"),
+    ("Psalms", "PSA", "ps psa psalm pss psm pslm",
+        "6 12 8 8 12 10 17 9 20 18 7 8 6 7 5 11 15 50 14 9 13 31 6 10 22 12 14 9 11 12 24 11 22 22 28 12 40 22 13 17 13 11 5 26 17 11 9 14 20 23 19 9 6 7 23 13 11 11 17 12 8 12 11 10 13 20 7 35 36 5 24 20 28 23 10 12 20 72 13 19 16 8 18 12 13 17 7 18 52 17 16 15 5 23 11 13 12 9 9 5 8 28 22 35 45 48 43 13 31 7 10 10 9 8 18 19 2 29 176 7 8 9 4 8 5 6 5 6 8 8 3 18 3 3 21 26 9 8 24 13 10 7 12 15 21 10 20 14 9 6"),
+    ("Proverbs", "PRO", "prov pro prv pr",
+        "33 22 35 27 23 35 27 36 18 32 31 28 25 35 33 33 28 24 29 30 31 29 35 34 28 28 27 28 27 33 31"),
+    ("Ecclesiastes", "ECC", "eccl ecc ec eccles qoh",
+        "18 26 22 16 20 12 29 17 18 20 10 14"),
+    ("Song of Solomon", "SNG", "song sos so sg cant canticles songofsongs songs",
+        "17 17 11 16 16 13 13 14"),
+    ("Isaiah", "ISA", "isa is",
+        "31 22 26 6 30 13 25 22 21 34 16 6 22 32 9 14 14 7 25 6 17 25 18 23 12 21 13 29 24 33 9 20 24 17 10 22 38 22 8 31 29 25 28 28 25 13 15 22 26 11 23 15 12 17 13 12 21 14 21 22 11 12 19 12 25 24"),
+    ("Jeremiah", "JER", "jer je jr",
+        "19 37 25 31 31 30 34 22 26 25 23 17 27 22 21 21 27 23 15 18 14 30 40 10 38 24 22 17 32 24 40 44 26 22 19 32 21 28 18 16 18 22 13 30 5 28 7 47 39 46 64 34"),
+    ("Lamentations", "LAM", "lam la",
+        "22 22 66 22 22"),
+    ("Ezekiel", "EZK", "ezek eze ezk",
+        "28 10 27 17 17 14 27 18 11 22 25 28 23 23 8 63 24 32 14 49 32 31 49 27 17 21 36 26 21 26 18 32 33 31 15 38 28 23 29 49 26 20 27 31 25 24 23 35"),
+    ("Daniel", "DAN", "dan da dn",
+        "21 49 30 37 31 28 28 27 27 21 45 13"),
+    ("Hosea", "HOS", "hos ho",
+        "11 23 5 19 15 11 16 14 17 15 12 14 16 9"),
+    ("Joel", "JOL", "jl",
+        "20 32 21"),
+    ("Amos", "AMO", "am",
+        "15 16 15 13 27 14 17 14 15"),
+    ("Obadiah", "OBA", "obad ob",
+        "21"),
+    ("Jonah", "JON", "jnh jon",
+        "17 10 10 11"),
+    ("Micah", "MIC", "mic mc",
+        "16 13 12 13 15 16 20"),
+    ("Nahum", "NAM", "nah na",
+        "15 13 19"),
+    ("Habakkuk", "HAB", "hab hb",
+        "17 20 19"),
+    ("Zephaniah", "ZEP", "zeph zep zp",
+        "18 15 20"),
+    ("Haggai", "HAG", "hag hg",
+        "15 23"),
+    ("Zechariah", "ZEC", "zech zec zc",
+        "21 13 10 14 11 15 14 23 17 12 17 14 9 21"),
+    ("Malachi", "MAL", "mal ml",
+        "14 17 18 6"),
+    ("Matthew", "MAT", "matt mt",
+        "25 23 17 25 48 34 29 34 38 42 30 50 58 36 39 28 27 35 30 34 46 46 39 51 46 75 66 20"),
+    ("Mark", "MRK", "mrk mk mr",
+        "45 28 35 41 43 56 37 38 50 52 33 44 37 72 47 20"),
+    ("Luke", "LUK", "luk lk",
+        "80 52 38 44 39 49 50 56 62 42 54 59 35 35 32 31 37 43 48 47 38 71 56 53"),
+    ("John", "JHN", "jn jhn",
+        "51 25 36 54 47 71 53 59 41 42 57 50 38 31 27 33 26 40 42 31 25"),
+    ("Acts", "ACT", "ac",
+        "26 47 26 37 42 15 60 40 43 48 30 25 52 28 41 40 34 28 41 38 40 30 35 27 27 32 44 31"),
+    ("Romans", "ROM", "rom ro rm",
+        "32 29 31 25 21 23 25 39 33 21 36 21 14 23 33 27"),
+    ("1 Corinthians", "1CO", "1cor 1co",
+        "31 16 23 21 13 20 40 13 27 33 34 31 13 40 58 24"),
+    ("2 Corinthians", "2CO", "2cor 2co",
+        "24 17 18 18 21 18 16 24 15 18 33 21 14"),
+    ("Galatians", "GAL", "gal ga",
+        "24 21 29 31 26 18"),
+    ("Ephesians", "EPH", "eph ephes",
+        "23 22 21 32 33 24"),
+    ("Philippians", "PHP", "phil php pp",
+        "30 30 21 23"),
+    ("Colossians", "COL", "col",
+        "29 23 25 18"),
+    ("1 Thessalonians", "1TH", "1thess 1th 1thes",
+        "10 20 13 18 28"),
+    ("2 Thessalonians", "2TH", "2thess 2th 2thes",
+        "12 17 18"),
+    ("1 Timothy", "1TI", "1tim 1ti",
+        "20 15 16 16 25 21"),
+    ("2 Timothy", "2TI", "2tim 2ti",
+        "18 26 17 22"),
+    ("Titus", "TIT", "tit",
+        "16 15 15"),
+    ("Philemon", "PHM", "philem phm pm",
+        "25"),
+    ("Hebrews", "HEB", "heb",
+        "14 18 19 16 14 20 28 13 28 39 40 29 25"),
+    ("James", "JAS", "jas jm",
+        "27 26 18 17 20"),
+    ("1 Peter", "1PE", "1pet 1pe 1pt",
+        "25 25 22 19 14"),
+    ("2 Peter", "2PE", "2pet 2pe 2pt",
+        "21 22 18"),
+    ("1 John", "1JN", "1jn 1jhn 1jo",
+        "10 29 24 21 21"),
+    ("2 John", "2JN", "2jn 2jhn 2jo",
+        "13"),
+    ("3 John", "3JN", "3jn 3jhn 3jo",
+        "14"),
+    ("Jude", "JUD", "jd",
+        "25"),
+    ("Revelation", "REV", "rev re rv revelations apocalypse apoc",
+        "20 29 22 11 14 17 17 13 21 11 19 17 18 20 8 21 18 24 21 15 27 21"),
+)
+
+
+class BibleBook:
+    __slots__ = ("index", "name", "id", "aliases", "verses")
+
+    def __init__(self, index: int, name: str, id: str, aliases: Tuple[str, ...], verses: Tuple[int, ...]) -> None:
+        self.index = index
+        self.name = name
+        self.id = id
+        self.aliases = aliases
+        self.verses = verses
+
+    def __repr__(self) -> str:
+        return f"BibleBook(name={self.name}, chapters={self.chapters})"
+
+    def __str__(self) -> str:
+        return self.name
+
+    @property
+    def chapters(self) -> int:
+        return len(self.verses)
+
+    @property
+    def slug(self) -> str:
+        # What bible-api.com gets in the URL.
+        return self.name.lower()
+
+    def verse_count(self, chapter: int) -> int:
+        return self.verses[chapter - 1]
+
+
+class VerseRange(NamedTuple):
+    chapter: int
+    verse: int
+    end_chapter: int
+    end_verse: int
+
+    def __str__(self) -> str:
+        return self.citation()
+
+    def citation(self) -> str:
+        if self.chapter != self.end_chapter:
+            return f"{self.chapter}:{self.verse}-{self.end_chapter}:{self.end_verse}"
+        if self.verse != self.end_verse:
+            return f"{self.chapter}:{self.verse}-{self.end_verse}"
+        return f"{self.chapter}:{self.verse}"
+
+    def keys(self, book: Optional[BibleBook] = None) -> Iterator[Tuple[int, int]]:
+        # (chapter, verse) of every verse in the range, ranges across chapters need the book.
+        for chapter in range(self.chapter, self.end_chapter + 1):
+            first = self.verse if chapter == self.chapter else 1
+            last = self.end_verse if chapter == self.end_chapter else book.verse_count(chapter)
+            for verse in range(first, last + 1):
+                yield chapter, verse
+
+
+class BibleReference:
+    __slots__ = ("book", "ranges")
+
+    def __init__(self, book: BibleBook, ranges: Tuple[VerseRange, ...]) -> None:
+        self.book = book
+        self.ranges = ranges
+
+    def __repr__(self) -> str:
+        return f"BibleReference({self})"
+
+    def __str__(self) -> str:
+        return f"{self.book.name} {self.citation()}"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, BibleReference) and self.book is other.book and self.ranges == other.ranges
+
+    def __hash__(self) -> int:
+        return hash((self.book.index, self.ranges))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.keys())
+
+    def citation(self) -> str:
+        return ",".join(r.citation() for r in self.ranges)
+
+    def citations(self) -> List[str]:
+        return [r.citation() for r in self.ranges]
+
+    def keys(self) -> Iterator[Tuple[int, int]]:
+        for r in self.ranges:
+            yield from r.keys(self.book)
+
+
+BIBLE_BOOKS: Tuple[BibleBook, ...] = tuple(
+    BibleBook(index, name, id, tuple(aliases.split()), tuple(map(int, verses.split())))
+    for index, (name, id, aliases, verses) in enumerate(_BOOKS, 1)
+)
+
+# bible-api.com translations numbered like the table above. Others split some chapters differently
+# (the WEB has 3 John 1:15 and Revelation 12:18), so only the book and the syntax of their references are checked.
+KJV_VERSIFICATION: Tuple[str, ...] = ("kjv",)
+
+# Where a whole chapter ends when the counts are not checked, Psalm 119 is the longest chapter in any versification.
+_LONGEST_CHAPTER = 176
+
+_ORDINALS = re.compile(r"^(?:(iii|3rd|third)|(ii|2nd|second)|(i|1st|first))\s+")
+_NOT_KEY = re.compile(r"[\s.]+")
+_ITEM = re.compile(r"^\s*((?:[1-3]\s*)?[^\d\s:,\-–—][^\d:,\-–—]*?)?\s*(\d[\d\s:,.\-–—]*)?\s*$")
+_DASHES = str.maketrans({"–": "-", "—": "-", " ": None, "\t": None, ".": ":"})
+
+
+def _key(name: str) -> str:
+    name = name.strip().lower()
+    ordinal = _ORDINALS.match(name)
+    if ordinal is not None:
+        name = str(4 - ordinal.lastindex) + name[ordinal.end():]
+    return _NOT_KEY.sub("", name)
+
+
+def _build_index() -> Dict[str, BibleBook]:
+    index: Dict[str, BibleBook] = {}
+    for book in BIBLE_BOOKS:
+        index[_key(book.name)] = book
+        index[book.id.lower()] = book
+        for alias in book.aliases:
+            index[alias] = book
+
+    # Any unambiguous start of a full name works too, "Deu", "Hebr" or "1 Cori".
+    prefixes: Dict[str, Optional[BibleBook]] = {}
+    for book in BIBLE_BOOKS:
+        key = _key(book.name)
+        start = 2 if key[0].isdigit() else 1
+        for end in range(start + 2, len(key)):
+            prefix = key[:end]
+            prefixes[prefix] = book if prefixes.get(prefix, book) is book else None
+    for prefix, book in prefixes.items():
+        if book is not None:
+            index.setdefault(prefix, book)
+    return index
+
+
+_INDEX = _build_index()
+
+
+def find_book(name: str) -> BibleBook:
+    book = _INDEX.get(_key(name))
+    if book is None:
+        raise InvalidReference(f"Unknown book: {name.strip()!r}")
+    return book
+
+
+def _check(book: BibleBook, chapter: int, verse: Optional[int] = None, counts: bool = True) -> None:
+    # Without counts only chapter and verse 0 are rejected.
+    if chapter < 1 or counts and chapter > book.chapters:
+        raise InvalidReference(f"{book.name} has {book.chapters} chapter(s), got chapter {chapter}")
+    if verse is None:
+        return
+    if not counts:
+        if verse < 1:
+            raise InvalidReference(f"{book.name} {chapter} has no verse {verse}")
+    elif not 1 <= verse <= book.verse_count(chapter):
+        raise InvalidReference(f"{book.name} {chapter} has {book.verse_count(chapter)} verses, got verse {verse}")
+
+
+def _last_verse(book: BibleBook, chapter: int, counts: bool) -> int:
+    return book.verse_count(chapter) if counts else _LONGEST_CHAPTER
+
+
+def check_chapter(name: str, chapter: NUMBER, *, counts: bool = True) -> BibleBook:
+    book = find_book(name)
+    if not str(chapter).strip().isdigit():
+        raise InvalidReference(f"Malformed chapter: {chapter!r}")
+    _check(book, int(chapter), counts=counts)
+    return book
+
+
+def _point(book: BibleBook, text: str, chapter: Optional[int]) -> Tuple[int, Optional[int]]:
+    # "3:16" -> (3, 16), "16" -> (chapter, 16) inside a chapter, otherwise the whole chapter (16, None).
+    if ":" in text:
+        c, _, v = text.partition(":")
+        if not c.isdigit() or not v.isdigit():
+            raise InvalidReference(f"Malformed reference: {book.name} {text}")
+        return int(c), int(v)
+    if not text.isdigit():
+        raise InvalidReference(f"Malformed reference: {book.name} {text}")
+    if chapter is not None:
+        return chapter, int(text)
+    if book.chapters == 1:
+        return 1, int(text)
+    return int(text), None
+
+
+def _ranges(book: BibleBook, spec: str, counts: bool) -> Tuple[VerseRange, ...]:
+    if not spec:
+        return (VerseRange(1, 1, book.chapters, _last_verse(book, book.chapters, counts)),)
+
+    ranges = []
+    chapter = None
+    for piece in spec.split(","):
+        first, dash, last = piece.partition("-")
+        start_chapter, start_verse = _point(book, first, chapter)
+        _check(book, start_chapter, start_verse, counts)
+
+        if not dash:
+            end_chapter, end_verse = start_chapter, start_verse
+        elif start_verse is None and ":" not in last:
+            # "1-3" in chapter context is a run of whole chapters.
+            if not last.isdigit():
+                raise InvalidReference(f"Malformed reference: {book.name} {piece}")
+            end_chapter, end_verse = int(last), None
+        else:
+            end_chapter, end_verse = _point(book, last, start_chapter)
+        _check(book, end_chapter, end_verse, counts)
+
+        if start_verse is None:
+            start_verse = 1
+        if end_verse is None:
+            end_verse = _last_verse(book, end_chapter, counts)
+        else:
+            chapter = end_chapter
+        if (end_chapter, end_verse) < (start_chapter, start_verse):
+            raise InvalidReference(f"Backwards range: {book.name} {piece}")
+        ranges.append(VerseRange(start_chapter, start_verse, end_chapter, end_verse))
+    return tuple(ranges)
+
+
+@lru_cache(maxsize=65536)
+def _parse_item(text: str, previous: Optional[BibleBook], counts: bool = True) -> BibleReference:
+    match = _ITEM.match(text)
+    if match is None:
+        raise InvalidReference(f"Malformed reference: {text.strip()!r}")
+
+    name, spec = match.groups()
+    if name:
+        book = find_book(name)
+    elif previous is not None:
+        book = previous
+    else:
+        raise InvalidReference(f"Missing book name: {text.strip()!r}")
+
+    spec = (spec or "").translate(_DASHES).strip(",")
+    return BibleReference(book, _ranges(book, spec, counts))
+
+
+def parse_references(text: str) -> List[BibleReference]:
+    # "Gen 1:1-3; 2:4; John 3:16-18,20; 1 Cor 13" -> one reference per item, items without a book continue the previous one.
+    references = []
+    book = None
+    for item in text.split(";"):
+        if not item.strip():
+            continue
+        reference = _parse_item(item, book)
+        references.append(reference)
+        book = reference.book
+    if not references:
+        raise InvalidReference(f"Malformed reference: {text.strip()!r}")
+    return references
+
+
+def parse_reference(book: str, citation: str = "", *, counts: bool = True) -> BibleReference:
+    # counts=False checks the book and the syntax only, for translations not in KJV_VERSIFICATION.
+    return _parse_item(f"{book} {citation}", None, counts)
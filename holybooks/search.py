@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+
+from bisect import bisect_left
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, List, Dict, Iterable, Tuple
+    from .constants import NUMBER
+
+
+__all__ = (
+    "SearchIndex",
+    "tokenize",
+)
+
+# How search results are ordered: best BM25 score first, or by ayah number like the remote /search endpoint.
+_SORTS = ("relevance", "mushaf")
+
+_WORD = re.compile(r"\w+")
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+# Harakat, Quranic annotation marks, superscript alef and tatweel.
+_ARABIC_MARKS = re.compile("[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]")
+_ARABIC_LETTERS = str.maketrans({
+    "آ": "ا",
+    "أ": "ا",
+    "إ": "ا",
+    "ٱ": "ا",
+    "ى": "ي",
+    "ة": "ه",
+})
+
+
+def normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _ARABIC_MARKS.sub("", text)
+    return text.translate(_ARABIC_LETTERS)
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(normalize(text))
+
+
+class SearchIndex:
+    def __init__(self, ayahs: Iterable[dict] = (), *, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._ayahs: List[dict] = []
+        self._surahs: List[int] = []
+        self._lengths: List[int] = []
+        self._postings: Dict[str, Dict[int, List[int]]] = defaultdict(dict)
+        self._vocabulary: Optional[List[str]] = None
+        self._total_length = 0
+        self.add(ayahs)
+
+    def __len__(self) -> int:
+        return len(self._ayahs)
+
+    def __repr__(self) -> str:
+        return f"SearchIndex(ayahs={len(self)}, terms={len(self._postings)})"
+
+    def add(self, ayahs: Iterable[dict]) -> None:
+        for ayah in ayahs:
+            doc = len(self._ayahs)
+            tokens = tokenize(ayah.get("text") or "")
+            for position, token in enumerate(tokens):
+                self._postings[token].setdefault(doc, []).append(position)
+
+            surah = ayah.get("surah")
+            self._ayahs.append(ayah)
+            self._surahs.append(int(surah["number"]) if isinstance(surah, dict) else int(surah or 0))
+            self._lengths.append(len(tokens))
+            self._total_length += len(tokens)
+        self._vocabulary = None
+
+    @property
+    def vocabulary(self) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        return self._vocabulary
+
+    def _expand(self, term: str) -> List[str]:
+        if not term.endswith("*"):
+            return [term] if term in self._postings else []
+
+        prefix = term.rstrip("*")
+        vocabulary = self.vocabulary
+        index = bisect_left(vocabulary, prefix)
+        terms = []
+        while index < len(vocabulary) and vocabulary[index].startswith(prefix):
+            terms.append(vocabulary[index])
+            index += 1
+        return terms
+
+    def _parse(self, query: str) -> Tuple[List[List[str]], List[List[str]]]:
+        terms, phrases = [], []
+        for phrase, word in _QUERY.findall(query):
+            if phrase:
+                tokens = tokenize(phrase)
+                if len(tokens) > 1:
+                    phrases.append(tokens)
+                terms.extend([token] for token in tokens)
+            else:
+                prefix = word.endswith("*")
+                tokens = tokenize(word)
+                if prefix and tokens:
+                    tokens[-1] += "*"
+                terms.extend([token] for token in tokens)
+
+        return [self._expand(term[0]) for term in terms], phrases
+
+    def _has_phrase(self, doc: int, phrase: List[str]) -> bool:
+        positions = [self._postings[token].get(doc) for token in phrase]
+        if not all(positions):
+            return False
+
+        following = [set(p) for p in positions[1:]]
+        return any(
+            all(start + offset + 1 in p for offset, p in enumerate(following))
+            for start in positions[0]
+        )
+
+    def _score(self, term: str, doc: int) -> float:
+        postings = self._postings[term]
+        frequency = len(postings[doc])
+        idf = math.log(1 + (len(self._ayahs) - len(postings) + 0.5) / (len(postings) + 0.5))
+        average = self._total_length / len(self._ayahs)
+        norm = self.k1 * (1 - self.b + self.b * self._lengths[doc] / average)
+        return idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+    def search_ids(self, query: str, chapter: NUMBER = "all", *, limit: Optional[int] = None, sort: str = "relevance") -> List[Tuple[int, float]]:
+        if sort not in _SORTS:
+            raise ValueError(f"Unknown sort: {sort}, expected one of {', '.join(_SORTS)}")
+        clauses, phrases = self._parse(query)
+        if not clauses or not all(clauses):
+            return []
+
+        matches = None
+        for clause in sorted(clauses, key=lambda c: sum(len(self._postings[t]) for t in c)):
+            docs = set()
+            for term in clause:
+                docs.update(self._postings[term])
+            matches = docs if matches is None else matches & docs
+            if not matches:
+                return []
+
+        if chapter not in (None, "", "all"):
+            chapter = int(chapter)
+            matches = {doc for doc in matches if self._surahs[doc] == chapter}
+
+        if phrases:
+            matches = {doc for doc in matches if all(self._has_phrase(doc, phrase) for phrase in phrases)}
+
+        scored = []
+        for doc in matches:
+            score = 0.0
+            for clause in clauses:
+                for term in clause:
+                    if doc in self._postings[term]:
+                        score += self._score(term, doc)
+            scored.append((doc, score))
+
+        if sort == "mushaf":
+            scored.sort(key=lambda item: (self._ayahs[item[0]].get("number", 0), item[0]))
+        else:
+            scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit] if limit is not None else scored
+
+    def search(self, query: str, chapter: NUMBER = "all", *, limit: Optional[int] = None, sort: str = "relevance") -> List[dict]:
+        # Copies, down to the nested surah and edition dicts, so callers cannot change what the index holds.
+        return [
+            {k: dict(v) if isinstance(v, dict) else v for k, v in self._ayahs[doc].items()}
+            for doc, _ in self.search_ids(query, chapter, limit=limit, sort=sort)
+        ]
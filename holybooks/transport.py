@@ -0,0 +1,477 @@
+from __future__ import annotations
+
+import threading
+import weakref
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode, urlsplit
+from .fork import after_fork
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+    import urllib3
+    from typing import Optional, Dict, Union, Tuple, Callable, Mapping, List, Any, Iterator
+
+    TIMEOUT = Union[None, float, Tuple[float, float]]
+    HANDLER = Callable[[str, str, Optional[dict]], Union[Tuple[int, bytes], Tuple[int, bytes, Dict[str, str]]]]
+
+
+__all__ = (
+    "HostConfig",
+    "Response",
+    "StreamedResponse",
+    "Transport",
+    "RequestsTransport",
+    "Urllib3Transport",
+    "HttpxTransport",
+    "LocalTransport",
+)
+
+METHODS = ("get", "post", "put", "patch", "delete", "head", "options")
+
+
+# The HTTP libraries are imported when the first transport using them is built, so importing
+# holybooks (or using LocalTransport) does not load them.
+def _requests():
+    import requests
+    import requests.adapters
+    return requests
+
+
+def _urllib3():
+    import urllib3
+    return urllib3
+
+
+def _httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise RuntimeError("httpx is required for HttpxTransport, install it with: pip install holybooks[http2]") from None
+    return httpx
+
+
+class HostConfig:
+    __slots__ = ("pool_size", "timeout", "headers")
+
+    def __init__(self, pool_size: int = 10, timeout: TIMEOUT = None, headers: Optional[Dict[str, str]] = None) -> None:
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.headers = headers or {}
+
+    def __repr__(self) -> str:
+        return f"HostConfig(pool_size={self.pool_size}, timeout={self.timeout})"
+
+
+class Response:
+    __slots__ = ("status_code", "headers", "content", "url")
+
+    def __init__(self, status_code: int, content: bytes, headers: Optional[Mapping[str, str]] = None, url: str = "") -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers if headers is not None else {}
+        self.url = url
+
+    def __repr__(self) -> str:
+        return f"Response(status_code={self.status_code}, url={self.url})"
+
+
+class StreamedResponse:
+    __slots__ = ("status_code", "headers", "chunks", "url")
+
+    def __init__(self, status_code: int, chunks: Iterator[bytes], headers: Optional[Mapping[str, str]] = None, url: str = "") -> None:
+        self.status_code = status_code
+        self.chunks = chunks
+        self.headers = headers if headers is not None else {}
+        self.url = url
+
+    def __repr__(self) -> str:
+        return f"StreamedResponse(status_code={self.status_code}, url={self.url})"
+
+    def read(self) -> bytes:
+        return b"".join(self.chunks)
+
+
+class Transport(ABC):
+    # Subclasses implement request(method, url, params=..., headers=..., timeout=...) returning an object with
+    # status_code, headers and content, and can then be passed to HTTPClient(transport=...).
+    def __init__(self, hosts: Optional[Dict[str, HostConfig]] = None, *, default: Optional[HostConfig] = None) -> None:
+        self.hosts = dict(hosts or {})
+        self.default = default or HostConfig()
+        self._prefixes = sorted(self.hosts, key=len, reverse=True)
+        after_fork(self)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(hosts={list(self.hosts)})"
+
+    def __enter__(self) -> Transport:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def session(self) -> Optional[requests.Session]:
+        # Used by the models to stream audio, transports without a requests.Session return None.
+        return None
+
+    def config(self, url: str) -> HostConfig:
+        for prefix in self._prefixes:
+            if url.startswith(prefix):
+                return self.hosts[prefix]
+        return self.default
+
+    def _options(self, url: str, headers: Optional[dict], timeout: TIMEOUT) -> Tuple[dict, TIMEOUT]:
+        config = self.config(url)
+        if config.headers:
+            headers = {**config.headers, **(headers or {})}
+        return headers, timeout if timeout is not None else config.timeout
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: TIMEOUT = None
+    ) -> Response:
+        ...
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: TIMEOUT = None,
+        chunk_size: int = 65536
+    ) -> Iterator[StreamedResponse]:
+        # Transports that cannot stream hand out the whole body as one chunk.
+        res = self.request(method, url, params=params, headers=headers, timeout=timeout)
+        yield StreamedResponse(res.status_code, iter((res.content,)), res.headers, url)
+
+    def close(self) -> None:
+        pass
+
+    def _after_fork(self) -> None:
+        # Runs in a forked child: connections inherited from the parent must not be shared with it.
+        pass
+
+
+class RequestsTransport(Transport):
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        *,
+        hosts: Optional[Dict[str, HostConfig]] = None,
+        default: Optional[HostConfig] = None,
+        max_retries: int = 0,
+        per_thread: bool = False
+    ) -> None:
+        # per_thread gives every thread its own session, so threads never contend on one connection pool.
+        if per_thread and session is not None:
+            raise ValueError("per_thread sessions are created by the transport, a session cannot be passed")
+
+        super().__init__(hosts, default=default)
+        self.max_retries = max_retries
+        self.per_thread = per_thread
+        self._mount_default = default is not None
+        self.__session = None if per_thread else self._mount(session or _requests().Session())
+        self._local = threading.local()
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def _mount(self, session: requests.Session) -> requests.Session:
+        HTTPAdapter = _requests().adapters.HTTPAdapter
+        for prefix, config in self.hosts.items():
+            session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=config.pool_size, max_retries=self.max_retries))
+        if self._mount_default:
+            adapter = HTTPAdapter(pool_maxsize=self.default.pool_size, max_retries=self.max_retries)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        if self.__session is not None:
+            return self.__session
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._mount(_requests().Session())
+            with self._lock:
+                self._sessions.add(session)
+        return session
+
+    def request(self, method: str, url: str, *args, headers: Optional[dict] = None, timeout: TIMEOUT = None, **kwargs) -> requests.Response:
+        headers, timeout = self._options(url, headers, timeout)
+        return self.session.request(method.upper(), url, *args, headers=headers, timeout=timeout, **kwargs)
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: TIMEOUT = None,
+        chunk_size: int = 65536
+    ) -> Iterator[StreamedResponse]:
+        headers, timeout = self._options(url, headers, timeout)
+        res = self.session.request(method.upper(), url, params=params, headers=headers, timeout=timeout, stream=True)
+        try:
+            yield StreamedResponse(res.status_code, res.iter_content(chunk_size), res.headers, res.url)
+        finally:
+            res.close()
+
+    def close(self) -> None:
+        if self.__session is not None:
+            self.__session.close()
+        with self._lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def _after_fork(self) -> None:
+        # Closing a connection in the child only drops its copy of the socket, the parent keeps using it.
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.close()
+
+
+class Urllib3Transport(Transport):
+    def __init__(
+        self,
+        hosts: Optional[Dict[str, HostConfig]] = None,
+        *,
+        default: Optional[HostConfig] = None,
+        num_pools: int = 10,
+        block: bool = False,
+        retries: Union[bool, int, urllib3.Retry] = False,
+        **pool_kwargs
+    ) -> None:
+        super().__init__(hosts, default=default)
+        self.num_pools = num_pools
+        self.block = block
+        self.retries = retries
+        self.pool_kwargs = pool_kwargs
+        self._pools: Dict[Optional[str], urllib3.PoolManager] = {}
+        self._lock = threading.Lock()
+
+    def _pool(self, url: str) -> urllib3.PoolManager:
+        prefix = next((p for p in self._prefixes if url.startswith(p)), None)
+        pool = self._pools.get(prefix)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(prefix)
+                if pool is None:
+                    config = self.hosts[prefix] if prefix is not None else self.default
+                    urllib3 = _urllib3()
+                    pool = self._pools[prefix] = urllib3.PoolManager(
+                        num_pools=self.num_pools,
+                        maxsize=config.pool_size,
+                        block=self.block,
+                        retries=self.retries,
+                        headers=urllib3.make_headers(keep_alive=True, accept_encoding=True),
+                        **self.pool_kwargs
+                    )
+        return pool
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: TIMEOUT = None
+    ) -> Response:
+        res, url = self._open(method, url, params, headers, timeout, preload_content=True)
+        return Response(res.status, res.data, res.headers, url)
+
+    def _open(self, method: str, url: str, params: Optional[dict], headers: Optional[dict], timeout: TIMEOUT, **kwargs) -> Tuple[urllib3.BaseHTTPResponse, str]:
+        headers, timeout = self._options(url, headers, timeout)
+        if params:
+            query = urlencode({k: v for k, v in params.items() if v is not None})
+            url += ("&" if urlsplit(url).query else "?") + query
+        if isinstance(timeout, tuple):
+            timeout = _urllib3().Timeout(connect=timeout[0], read=timeout[1])
+
+        pool = self._pool(url)
+        if headers is not None:
+            headers = {**pool.headers, **headers}
+        return pool.request(method.upper(), url, headers=headers, timeout=timeout, decode_content=True, **kwargs), url
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: TIMEOUT = None,
+        chunk_size: int = 65536
+    ) -> Iterator[StreamedResponse]:
+        res, url = self._open(method, url, params, headers, timeout, preload_content=False)
+        try:
+            yield StreamedResponse(res.status, res.stream(chunk_size, decode_content=True), res.headers, url)
+        finally:
+            res.release_conn()
+
+    def close(self) -> None:
+        with self._lock:
+            for pool in self._pools.values():
+                pool.clear()
+            self._pools.clear()
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+        self.close()
+
+
+class HttpxTransport(Transport):
+    def __init__(
+        self,
+        client: Optional[httpx.Client] = None,
+        *,
+        hosts: Optional[Dict[str, HostConfig]] = None,
+        default: Optional[HostConfig] = None,
+        http2: bool = False,
+        **client_kwargs
+    ) -> None:
+        _httpx()  # raises here rather than on the first request when httpx is missing
+        super().__init__(hosts, default=default)
+        self.http2 = http2
+        self.client_kwargs = client_kwargs
+        self._clients: Dict[Optional[str], httpx.Client] = {}
+        self._owned = client is None
+        self._lock = threading.Lock()
+        if client is not None:
+            self._clients[None] = client
+
+    def _client(self, url: str) -> httpx.Client:
+        # A client passed in is used for every host, otherwise each configured base URL gets its own pool.
+        prefix = next((p for p in self._prefixes if url.startswith(p)), None) if self._owned else None
+        client = self._clients.get(prefix)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(prefix)
+                if client is None:
+                    config = self.hosts[prefix] if prefix is not None else self.default
+                    httpx = _httpx()
+                    client = self._clients[prefix] = httpx.Client(
+                        http2=self.http2,
+                        limits=httpx.Limits(max_connections=config.pool_size, max_keepalive_connections=config.pool_size),
+                        **self.client_kwargs
+                    )
+        return client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: TIMEOUT = None
+    ) -> Response:
+        headers, timeout = self._options(url, headers, timeout)
+        if isinstance(timeout, tuple):
+            timeout = _httpx().Timeout(timeout[1], connect=timeout[0])
+        res = self._client(url).request(method.upper(), url, params=params, headers=headers, timeout=timeout)
+        return Response(res.status_code, res.content, res.headers, str(res.url))
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: TIMEOUT = None,
+        chunk_size: int = 65536
+    ) -> Iterator[StreamedResponse]:
+        headers, timeout = self._options(url, headers, timeout)
+        if isinstance(timeout, tuple):
+            timeout = _httpx().Timeout(timeout[1], connect=timeout[0])
+        with self._client(url).stream(method.upper(), url, params=params, headers=headers, timeout=timeout) as res:
+            yield StreamedResponse(res.status_code, res.iter_bytes(chunk_size), res.headers, str(res.url))
+
+    def close(self) -> None:
+        if self._owned:
+            with self._lock:
+                for client in self._clients.values():
+                    client.close()
+                self._clients.clear()
+
+    def _after_fork(self) -> None:
+        # Closing an HTTP/2 connection writes to the socket, so the parent's clients are dropped instead.
+        # A client passed in belongs to the caller and is left alone.
+        self._lock = threading.Lock()
+        if self._owned:
+            self._clients = {}
+
+
+class LocalTransport(Transport):
+    # Answers from handlers in the same process, for tests and benchmarks.
+    def __init__(self, routes: Optional[Dict[str, Union[HANDLER, Tuple[int, bytes]]]] = None, *, fallback: Optional[HANDLER] = None) -> None:
+        super().__init__()
+        self.routes = dict(routes or {})
+        self.fallback = fallback
+        self.calls: List[Tuple[str, str, Optional[dict]]] = []
+        self._lock = threading.Lock()
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+    def route(self, url: str, handler: Union[HANDLER, Tuple[int, bytes]]) -> None:
+        self.routes[url] = handler
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: TIMEOUT = None
+    ) -> Response:
+        with self._lock:
+            self.calls.append((method.upper(), url, params))
+
+        handler = self.routes.get(url, self.routes.get(url.split("?")[0], self.fallback))
+        if handler is None:
+            return Response(404, b'{"code": 404, "status": "NOT FOUND", "data": "Not found."}', {}, url)
+
+        result = handler if isinstance(handler, tuple) else handler(method.upper(), url, params)
+        status, body = result[0], result[1]
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        return Response(status, body, result[2] if len(result) > 2 else {}, url)
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: TIMEOUT = None,
+        chunk_size: int = 65536
+    ) -> Iterator[StreamedResponse]:
+        res = self.request(method, url, params=params, headers=headers, timeout=timeout)
+        body = res.content
+        chunks = (body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+        yield StreamedResponse(res.status_code, chunks, res.headers, url)
@@ -33,4 +33,14 @@ setup(
     ],
     packages=find_packages(),
     install_requires=["requests"],
+    entry_points={
+        "console_scripts": ["holybooks = holybooks.cli:main"],
+    },
+    extras_require={
+        "async": ["aiohttp"],
+        "numpy": ["numpy"],
+        "fast": ["orjson"],
+        "http2": ["httpx[http2]"],
+        "arrow": ["pyarrow"],
+    },
 )
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+
+from urllib.parse import unquote, urlsplit
+from typing import TYPE_CHECKING
+from holybooks import QURAN_STRUCTURE
+
+if TYPE_CHECKING:
+    from typing import Optional, List, Dict, Tuple
+
+
+__all__ = (
+    "edition",
+    "quran_payload",
+    "QuranApi",
+)
+
+
+def edition(identifier: str = "en.test") -> dict:
+    return {
+        "identifier": identifier,
+        "language": identifier.split(".")[0],
+        "name": identifier,
+        "englishName": identifier,
+        "format": "text",
+        "type": "translation",
+        "direction": "ltr",
+    }
+
+
+def quran_payload(identifier: str = "en.test", surahs: int = 3) -> dict:
+    # The first surahs of http://api.alquran.cloud/v1/quran/{edition}, divisions from QURAN_STRUCTURE.
+    chapters = []
+    for surah in range(1, surahs + 1):
+        ayahs = []
+        for in_surah in range(1, QURAN_STRUCTURE.ayah_counts[surah - 1] + 1):
+            where = QURAN_STRUCTURE.locate(f"{surah}:{in_surah}")
+            ayahs.append({
+                "number": where["number"],
+                "text": f"{identifier} ayah {surah} {in_surah}",
+                "numberInSurah": in_surah,
+                "juz": where["juz"],
+                "manzil": where["manzil"],
+                "page": where["page"],
+                "ruku": where["ruku"],
+                "hizbQuarter": where["hizb_quarter"],
+                "sajda": False,
+            })
+        chapters.append({
+            "number": surah,
+            "name": f"Surah {surah}",
+            "englishName": f"Surah {surah}",
+            "englishNameTranslation": f"Surah {surah}",
+            "revelationType": "Meccan",
+            "ayahs": ayahs,
+        })
+    return {"code": 200, "status": "OK", "data": {"surahs": chapters, "edition": edition(identifier)}}
+
+
+def _not_found(message: str) -> Tuple[int, str]:
+    return 404, json.dumps({"code": 404, "status": "NOT FOUND", "data": message})
+
+
+def _ok(data) -> Tuple[int, str]:
+    return 200, json.dumps({"code": 200, "status": "OK", "data": data})
+
+
+class QuranApi:
+    # A LocalTransport handler answering the api.alquran.cloud routes the clients use, from quran_payload editions.
+    def __init__(self, *identifiers: str, surahs: int = 3) -> None:
+        self.payloads = {identifier: quran_payload(identifier, surahs) for identifier in identifiers or ("en.test",)}
+
+    def _meta(self, surah: dict) -> dict:
+        return {k: v for k, v in surah.items() if k != "ayahs"}
+
+    def _ayahs(self, identifier: str) -> List[Tuple[dict, dict]]:
+        return [(surah, ayah) for surah in self.payloads[identifier]["data"]["surahs"] for ayah in surah["ayahs"]]
+
+    def __call__(self, method: str, url: str, params: Optional[Dict[str, str]]) -> Tuple[int, str]:
+        route, *args, identifier = [unquote(part) for part in urlsplit(url).path.split("/")[2:] if part]
+        if identifier not in self.payloads:
+            return _not_found("Edition not found")
+        data = self.payloads[identifier]["data"]
+
+        if route == "quran":
+            return _ok(data)
+
+        if route == "surah":
+            for surah in data["surahs"]:
+                if surah["number"] == int(args[0]):
+                    return _ok({**surah, "edition": data["edition"]})
+            return _not_found("Surah number should be between 1 and 114")
+
+        if route == "ayah":
+            for surah, ayah in self._ayahs(identifier):
+                if args[0] in (str(ayah["number"]), f"{surah['number']}:{ayah['numberInSurah']}"):
+                    return _ok({**ayah, "surah": self._meta(surah), "edition": data["edition"]})
+            return _not_found("Please specify an Ayah number (1 to 6236) or a reference in the format Surah:Ayat (2:255).")
+
+        if route == "search":
+            keyword, chapter = args
+            matches = [
+                {**ayah, "surah": self._meta(surah), "edition": data["edition"]}
+                for surah, ayah in self._ayahs(identifier)
+                if keyword in ayah["text"] and chapter in ("all", str(surah["number"]))
+            ]
+            return _ok({"count": len(matches), "matches": matches})
+
+        # juz, manzil, ruku, page, hizbQuarter, with offset and limit params.
+        params = params or {}
+        offset = int(params.get("offset", 0))
+        limit = int(params["limit"]) if "limit" in params else None
+        selected = [
+            {**ayah, "surah": self._meta(surah)}
+            for surah, ayah in self._ayahs(identifier)
+            if ayah[route] == int(args[0])
+        ][offset:None if limit is None else offset + limit]
+        if not selected:
+            return _not_found(f"{route} not found")
+        return _ok({"number": int(args[0]), "ayahs": selected, "edition": data["edition"]})
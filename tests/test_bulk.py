@@ -0,0 +1,62 @@
+import json
+
+from holybooks import Client, LocalTransport, NotFound, InvalidReference
+from _quran import QuranApi
+
+
+def _client(**kwargs):
+    transport = LocalTransport(fallback=QuranApi())
+    return Client(transport=transport, quran_translation="en.test", **kwargs), transport
+
+
+def _verse(book, chapter, verse):
+    return json.dumps({
+        "reference": f"{book} {chapter}:{verse}",
+        "verses": [{"book_id": book[:3].upper(), "book_name": book, "chapter": chapter, "verse": verse, "text": f"{chapter}:{verse}"}],
+        "text": "",
+        "translation_id": "kjv",
+        "translation_name": "King James Version",
+        "translation_note": "Public Domain",
+    })
+
+
+def test_fetch_ayahs_keeps_input_order():
+    client, _ = _client()
+    citations = ["3:7", "1:1", "2:255", "1:7"]
+    ayahs = client.fetch_ayahs(citations)
+    assert [f"{ayah.surah.number}:{ayah.number_in_surah}" for ayah in ayahs] == citations
+
+
+def test_fetch_ayahs_fetches_duplicates_once():
+    client, transport = _client(coalesce=False)
+    ayahs = client.fetch_ayahs(["2:255", "2: 255", "1:1", "2:255"])
+    assert [ayah.number for ayah in ayahs] == [262, 262, 1, 262]
+    assert len(transport.calls) == 2
+
+
+def test_fetch_ayahs_puts_failures_in_their_slot():
+    client, _ = _client()
+    ayahs = client.fetch_ayahs(["1:1", "2:300", "3:1"])
+    assert ayahs[0].number == 1
+    assert isinstance(ayahs[1], InvalidReference)
+    assert ayahs[2].number_in_surah == 1
+
+
+def test_fetch_ayahs_reports_not_found():
+    # Surah 4 is a valid citation but not in the test edition, so the API answers 404.
+    client, _ = _client()
+    ayahs = client.fetch_ayahs(["4:1", "1:2"])
+    assert isinstance(ayahs[0], NotFound) and not isinstance(ayahs[0], InvalidReference)
+    assert ayahs[1].number == 2
+
+
+def test_fetch_verses_keeps_input_order():
+    transport = LocalTransport({
+        "https://bible-api.com/john3:16": (200, _verse("John", 3, 16)),
+        "https://bible-api.com/genesis1:1": (200, _verse("Genesis", 1, 1)),
+    })
+    client = Client(transport=transport, coalesce=False)
+    verses = client.fetch_verses([("John", "3:16"), ("Genesis", "1:1"), ("john", "3:16"), ("Nowhere", "1:1")])
+    assert [verse.reference for verse in verses[:3]] == ["John 3:16", "Genesis 1:1", "John 3:16"]
+    assert isinstance(verses[3], InvalidReference)
+    assert len(transport.calls) == 2
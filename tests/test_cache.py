@@ -0,0 +1,91 @@
+import pytest
+
+from holybooks import Client, LocalTransport, ResponseCache, NotFound
+from holybooks import cache as cache_module
+from _quran import QuranApi
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def _client(cache, **kwargs):
+    transport = LocalTransport(fallback=QuranApi())
+    return Client(transport=transport, quran_translation="en.test", cache=cache, coalesce=False, **kwargs), transport
+
+
+def test_values_are_copied_in_and_out():
+    cache = ResponseCache()
+    value = {"data": {"ayahs": [1, 2]}}
+    cache.set("k", value)
+    value["data"]["ayahs"].append(3)
+    out = cache.get("k")
+    assert out == {"data": {"ayahs": [1, 2]}}
+    out["data"]["ayahs"].clear()
+    assert cache.get("k") == {"data": {"ayahs": [1, 2]}}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResponseCache(ttl=10)
+    cache.set("k", 1)
+    clock.now += 9.9
+    assert cache.get("k") == 1
+    clock.now += 0.2
+    assert cache.get("k") is cache_module.MISSING
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+
+def test_not_found_is_cached_for_negative_ttl(clock):
+    cache = ResponseCache(negative_ttl=5)
+    cache.set_not_found("k", NotFound("gone"))
+    with pytest.raises(NotFound, match="gone"):
+        cache.get("k")
+    clock.now += 6
+    assert cache.get("k") is cache_module.MISSING
+
+    cache = ResponseCache(negative_ttl=0)
+    cache.set_not_found("k", NotFound("gone"))
+    assert "k" not in cache
+
+
+def test_keys_ignore_param_order_and_host_case():
+    assert ResponseCache.make_key("HTTP://Api.Example/a/?x=1", {"y": 2, "z": None}) == ResponseCache.make_key("http://api.example/a", {"y": "2", "x": "1"})
+
+
+def test_client_answers_repeated_lookups_from_the_cache():
+    client, transport = _client(ResponseCache())
+    first = client.fetch_ayah("2:255")
+    first.data["text"] = "changed"
+    second = client.fetch_ayah("2:255")
+    assert second.text == "en.test ayah 2 255"
+    assert len(transport.calls) == 1
+
+
+def test_client_caches_not_found():
+    client, transport = _client(ResponseCache())
+    for _ in range(2):
+        with pytest.raises(NotFound):
+            client.fetch_ayah("4:1")
+    assert len(transport.calls) == 1
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from holybooks import Client, LocalTransport, NotFound, SingleFlight
+from _quran import QuranApi
+
+
+def _waiting(flights):
+    calls = list(flights._calls.values())
+    return calls[0].waiters if calls else -1
+
+
+def _concurrently(count, target, flights, release):
+    # Runs target on count threads and lets the leader finish once the others wait on its call.
+    results = [None] * count
+
+    def run(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while _waiting(flights) < count - 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def _leader(release, calls, result):
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return fn
+
+
+def test_threads_share_one_call_and_get_copies():
+    flights = SingleFlight()
+    release, calls = threading.Event(), []
+    fn = _leader(release, calls, {"data": [1, 2]})
+    results = _concurrently(8, lambda: flights.do("k", fn), flights, release)
+
+    assert len(calls) == 1
+    assert flights.shared == 7
+    assert all(result == {"data": [1, 2]} for result in results)
+    assert len({id(result) for result in results}) == 8
+    assert len(flights) == 0
+
+
+def test_threads_share_the_error():
+    flights = SingleFlight()
+    release, calls = threading.Event(), []
+    fn = _leader(release, calls, NotFound("gone"))
+    results = _concurrently(4, lambda: flights.do("k", fn), flights, release)
+
+    assert len(calls) == 1
+    assert all(isinstance(result, NotFound) for result in results)
+
+
+def test_a_finished_call_is_not_reused():
+    flights = SingleFlight()
+    assert flights.do("k", lambda: 1) == 1
+    assert flights.do("k", lambda: 2) == 2
+    assert flights.shared == 0
+
+
+def test_tasks_share_one_call():
+    async def main():
+        flights = SingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"data": [1]}
+
+        results = await asyncio.gather(*(flights.do_async("k", fn) for _ in range(5)))
+        return flights, calls, results
+
+    flights, calls, results = asyncio.run(main())
+    assert len(calls) == 1
+    assert flights.shared == 4
+    assert all(result == {"data": [1]} for result in results)
+    assert len({id(result) for result in results}) == 5
+
+
+def test_a_cancelled_task_does_not_cancel_the_others():
+    async def main():
+        flights = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.05)
+            return 1
+
+        first = asyncio.ensure_future(flights.do_async("k", fn))
+        second = asyncio.ensure_future(flights.do_async("k", fn))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == 1
+
+
+def test_client_coalesces_identical_lookups():
+    api = QuranApi()
+    release = threading.Event()
+
+    def slow(method, url, params):
+        release.wait(5)
+        return api(method, url, params)
+
+    transport = LocalTransport(fallback=slow)
+    client = Client(transport=transport, quran_translation="en.test")
+    ayahs = _concurrently(4, lambda: client.fetch_ayah("2:255"), client.http_client.flights, release)
+
+    assert [ayah.number for ayah in ayahs] == [262] * 4
+    assert len(transport.calls) == 1
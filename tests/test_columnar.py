@@ -0,0 +1,61 @@
+import pytest
+
+from holybooks import Client, LocalTransport, QURAN_STRUCTURE
+from holybooks.models import columnar
+from holybooks.models.columnar import QuranColumns
+from _quran import QuranApi, quran_payload
+
+
+@pytest.fixture
+def columns():
+    payload = quran_payload()
+    ayahs = payload["data"]["surahs"][1]["ayahs"]
+    ayahs[9]["sajda"] = {"id": 1, "recommended": True, "obligatory": False}
+    ayahs[10]["audio"] = "https://cdn.example/18.mp3"
+    return QuranColumns(payload)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar, "_numpy", lambda: None)
+    return request.param
+
+
+def test_select_matches_the_structure(columns, backend):
+    assert columns.select(juz=1) == [number - 1 for number in QURAN_STRUCTURE.span("juz", 1)]
+    assert columns.select(surah=2, number_in_surah=(1, 3)) == [7, 8, 9]
+    assert columns.select(surah=2, number_in_surah=range(1, 3)) == [7, 8]
+    assert columns.select(sajda=True) == [16]
+    assert columns.select(surah=4) == []
+
+
+def test_ayahs_round_trip(columns):
+    ayah = columns.ayah(17)
+    assert (ayah.surah.number, ayah.number_in_surah, ayah.number) == (2, 11, 18)
+    assert ayah.text == "en.test ayah 2 11"
+    assert ayah.audio == "https://cdn.example/18.mp3"
+    assert ayah.juz == QURAN_STRUCTURE.division("juz", "2:11")
+    assert columns.ayah(16).sajda.recommended is True
+    assert columns[-1].number == 493
+    assert [ayah.number for ayah in columns.ayahs(columns.select(surah=1))] == list(range(1, 8))
+    assert columns.texts([0, 1]) == ["en.test ayah 1 1", "en.test ayah 1 2"]
+
+
+def test_numpy_arrays_are_read_only(columns):
+    pytest.importorskip("numpy")
+    arrays = columns.to_numpy()
+    assert arrays["juz"][0] == 1
+    with pytest.raises(ValueError):
+        arrays["juz"][0] = 9
+    assert columns.to_numpy()["juz"] is arrays["juz"]
+    assert columns.ayah(0).juz == 1
+
+
+def test_quran_to_columns():
+    client = Client(transport=LocalTransport(fallback=QuranApi()), quran_translation="en.test")
+    columns = client.fetch_quran().to_columns()
+    assert len(columns) == 493
+    assert columns.translation.id == "en.test"
@@ -0,0 +1,106 @@
+import json
+import threading
+import time
+
+import pytest
+
+from holybooks import Client, LocalTransport, QuranCorpus, NotFound, InvalidReference, QURAN_STRUCTURE
+from _quran import QuranApi, quran_payload
+
+
+@pytest.fixture
+def corpus():
+    payload = quran_payload()
+    payload["data"]["surahs"][1]["ayahs"][9]["sajda"] = {"id": 1, "recommended": True, "obligatory": False}
+    corpus = QuranCorpus()
+    corpus.store(payload)
+    return corpus
+
+
+def _numbers(ayahs):
+    return [ayah["number"] for ayah in ayahs]
+
+
+def test_selectors_return_ayahs_in_order(corpus):
+    assert _numbers(corpus.fetch_chapter_verse(translation="en.test", juz=1)) == list(QURAN_STRUCTURE.span("juz", 1))
+    assert _numbers(corpus.fetch_chapter_verse(translation="en.test", page=3)) == list(QURAN_STRUCTURE.span("page", 3))
+    assert _numbers(corpus.fetch_chapter_verse(translation="en.test", ruku=2)) == list(QURAN_STRUCTURE.span("ruku", 2))
+    assert _numbers(corpus.fetch_chapter_verse(translation="en.test", sajda=True)) == [17]
+
+
+def test_offset_and_limit_page_through_a_selector(corpus):
+    juz = list(QURAN_STRUCTURE.span("juz", 2))
+    assert _numbers(corpus.fetch_chapter_verse(translation="en.test", juz=2, offset=10, limit=5)) == juz[10:15]
+    assert _numbers(corpus.fetch_chapter_verse(translation="en.test", juz=2, offset=len(juz) - 2)) == juz[-2:]
+    with pytest.raises(NotFound):
+        corpus.fetch_chapter_verse(translation="en.test", juz=2, offset=len(juz))
+
+
+def test_citations_and_global_numbers(corpus):
+    ayah = corpus.fetch_chapter_verse(citation="2:255", translation="en.test")["data"]
+    assert ayah["number"] == 262
+    assert ayah["surah"]["number"] == 2
+    assert ayah["edition"]["identifier"] == "en.test"
+    assert corpus.fetch_chapter_verse(citation="262", translation="en.test")["data"]["text"] == ayah["text"]
+    with pytest.raises(NotFound):
+        corpus.fetch_chapter_verse(citation="4:1", translation="en.test")
+
+
+def test_malformed_references_raise_invalid_reference(corpus):
+    with pytest.raises(InvalidReference):
+        corpus.fetch_book_chapter("abc", translation="en.test")
+    with pytest.raises(InvalidReference):
+        corpus.fetch_chapter_verse(translation="en.test", juz="x")
+    with pytest.raises(NotFound):
+        corpus.fetch_book_chapter(1, translation="en.other")
+
+
+def test_surahs_and_books_round_trip(corpus, tmp_path):
+    surah = corpus.fetch_book_chapter(3, translation="en.test")["data"]
+    assert len(surah["ayahs"]) == 200
+    assert surah["ayahs"][0]["translation"]["identifier"] == "en.test"
+
+    filename = tmp_path / "quran.json"
+    filename.write_text(json.dumps(quran_payload("en.file", surahs=1)), encoding="utf-8")
+    book = QuranCorpus.from_file(str(filename)).fetch_book(translation="en.file")["data"]
+    assert [len(surah["ayahs"]) for surah in book["surahs"]] == [7]
+
+
+def test_client_reads_mirrored_editions_locally():
+    transport = LocalTransport(fallback=QuranApi())
+    client = Client(transport=transport, quran_translation="en.test")
+    client.mirror_quran()
+    calls = len(transport.calls)
+
+    assert client.fetch_ayah("2:255").number == 262
+    assert client.fetch_surah(1).number_of_ayats == 7
+    assert len(client.fetch_ayah(juz=1)) == len(QURAN_STRUCTURE.span("juz", 1))
+    assert len(transport.calls) == calls
+
+
+def test_offline_client_does_not_fall_back_to_the_network():
+    transport = LocalTransport(fallback=QuranApi("en.test", "en.other"))
+    client = Client(transport=transport, quran_translation="en.test", corpus=QuranCorpus(), offline=True)
+    with pytest.raises(NotFound):
+        client.fetch_ayah("1:1")
+    with pytest.raises(NotFound):
+        client.fetch_surah(1, "en.other")
+    assert transport.calls == []
+
+
+def test_concurrent_mirrors_fetch_the_edition_once():
+    api = QuranApi()
+
+    def slow(method, url, params):
+        time.sleep(0.05)
+        return api(method, url, params)
+
+    transport = LocalTransport(fallback=slow)
+    client = Client(transport=transport, quran_translation="en.test", coalesce=False)
+    threads = [threading.Thread(target=client.build_search_index) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(transport.calls) == 1
+    assert client.has_edition("en.test")
@@ -0,0 +1,80 @@
+import io
+import json
+
+import pytest
+
+from holybooks import Client, LocalTransport, QuranCorpus, NotFound, QURAN_COLUMNS, BIBLE_COLUMNS, export_quran, export_bible
+from _quran import QuranApi
+
+
+def _client(**kwargs):
+    transport = LocalTransport(fallback=QuranApi())
+    return Client(transport=transport, quran_translation="en.test", **kwargs), transport
+
+
+def _jsonl(f):
+    return [json.loads(line) for line in f.getvalue().splitlines()]
+
+
+def test_streamed_and_mirrored_exports_match():
+    client, transport = _client()
+    streamed = io.StringIO()
+    assert export_quran(client, streamed, format="jsonl", batch_size=100) == 493
+
+    client.mirror_quran()
+    calls = len(transport.calls)
+    mirrored = io.StringIO()
+    assert export_quran(client, mirrored, format="jsonl") == 493
+    assert len(transport.calls) == calls
+
+    rows = _jsonl(streamed)
+    assert rows == _jsonl(mirrored)
+    assert list(rows[0]) == list(QURAN_COLUMNS)
+    assert rows[261]["edition"] == "en.test"
+    assert (rows[261]["surah"], rows[261]["number_in_surah"], rows[261]["text"]) == (2, 255, "en.test ayah 2 255")
+
+
+def test_offline_export_of_an_unmirrored_edition_raises():
+    client, transport = _client(corpus=QuranCorpus(), offline=True)
+    with pytest.raises(NotFound):
+        export_quran(client, io.StringIO(), format="jsonl")
+    assert transport.calls == []
+
+
+@pytest.mark.parametrize("extension", ["parquet", "arrow"])
+def test_arrow_formats_follow_the_extension(tmp_path, extension):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    client, _ = _client()
+    path = str(tmp_path / f"quran.{extension}")
+    assert export_quran(client, path, batch_size=64) == 493
+    table = pyarrow.parquet.read_table(path) if extension == "parquet" else pyarrow.ipc.open_file(path).read_all()
+    assert table.num_rows == 493
+    assert table.schema.names == list(QURAN_COLUMNS)
+    assert str(table.schema.field("juz").type) == "int8"
+    assert table.column("text")[0].as_py() == "en.test ayah 1 1"
+
+
+def test_unknown_formats_are_rejected():
+    client, _ = _client()
+    with pytest.raises(ValueError):
+        export_quran(client, "quran.csv")
+
+
+def test_bible_books_are_exported_in_order():
+    chapter = {
+        "reference": "Jude 1",
+        "verses": [{"book_id": "JUD", "book_name": "Jude", "chapter": 1, "verse": verse, "text": f" verse {verse}\n"} for verse in (1, 2)],
+        "text": "",
+        "translation_id": "kjv",
+        "translation_name": "King James Version",
+        "translation_note": "Public Domain",
+    }
+    transport = LocalTransport({"https://bible-api.com/jude1": (200, json.dumps(chapter))})
+    f = io.StringIO()
+    assert export_bible(Client(transport=transport), ["Jude"], f, format="jsonl") == 2
+    rows = _jsonl(f)
+    assert list(rows[0]) == list(BIBLE_COLUMNS)
+    assert [(row["book"], row["chapter"], row["verse"], row["text"]) for row in rows] == [("Jude", 1, 1, "verse 1"), ("Jude", 1, 2, "verse 2")]
@@ -0,0 +1,67 @@
+import pytest
+
+from holybooks import Client, LocalTransport, NotFound, QURAN_STRUCTURE
+from _quran import QuranApi
+
+
+def _client(**kwargs):
+    transport = LocalTransport(fallback=QuranApi())
+    return Client(transport=transport, quran_translation="en.test", coalesce=False, **kwargs), transport
+
+
+def _pages(transport):
+    return [(params or {}).get("offset", 0) for _, _, params in transport.calls]
+
+
+def test_pages_cover_the_selection_in_order():
+    client, transport = _client()
+    numbers = [ayah.number for ayah in client.iter_ayahs(juz=1, page_size=50)]
+    assert numbers == list(QURAN_STRUCTURE.span("juz", 1))
+    # 148 ayahs: the short third page is the last one.
+    assert _pages(transport) == [0, 50, 100]
+    assert all(params["limit"] == 50 for _, _, params in transport.calls)
+
+
+def test_a_known_size_saves_the_request_after_a_full_last_page():
+    client, transport = _client()
+    assert len(list(client.iter_ayahs(juz=1, page_size=74))) == 148
+    assert _pages(transport) == [0, 74]
+
+
+def test_without_validation_an_empty_page_ends_the_iteration():
+    client, transport = _client(validate_references=False)
+    assert len(list(client.iter_ayahs(juz=1, page_size=74))) == 148
+    assert _pages(transport) == [0, 74, 148]
+
+
+def test_stopping_early_fetches_at_most_one_page_ahead():
+    client, transport = _client()
+    for ayah in client.iter_ayahs(juz=2, page_size=10):
+        if ayah.number == QURAN_STRUCTURE.span("juz", 2)[0]:
+            break
+    assert len(transport.calls) <= 2
+
+
+def test_a_missing_first_page_raises():
+    client, _ = _client()
+    with pytest.raises(NotFound):
+        list(client.iter_ayahs("en.missing", juz=1))
+
+
+def test_bad_arguments_fail_before_any_request():
+    client, transport = _client()
+    with pytest.raises(ValueError):
+        list(client.iter_ayahs())
+    with pytest.raises(ValueError):
+        list(client.iter_ayahs(juz=1, page_size=0))
+    with pytest.raises(NotFound):
+        list(client.iter_ayahs(juz=31))
+    assert transport.calls == []
+
+
+def test_mirrored_editions_are_paged_from_the_corpus():
+    client, transport = _client()
+    client.mirror_quran()
+    calls = len(transport.calls)
+    assert [ayah.number for ayah in client.iter_ayahs(page=3, page_size=2)] == list(QURAN_STRUCTURE.span("page", 3))
+    assert len(transport.calls) == calls
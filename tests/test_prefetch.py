@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+import pytest
+
+from holybooks import Client, AsyncClient, LocalTransport, Prefetcher, ResponseCache
+from _quran import QuranApi
+
+
+def _settle(prefetcher):
+    deadline = time.monotonic() + 5
+    while prefetcher._pending and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def _client(prefetcher):
+    transport = LocalTransport(fallback=QuranApi())
+    return Client(transport=transport, quran_translation="en.test", cache=ResponseCache(), prefetcher=prefetcher), transport
+
+
+def test_a_prefetcher_needs_a_cache():
+    with pytest.raises(ValueError):
+        Client(transport=LocalTransport(), prefetcher=Prefetcher())
+
+
+def test_neighbours_are_read_from_the_cache():
+    prefetcher = Prefetcher(radius=1)
+    client, transport = _client(prefetcher)
+    with client:
+        client.fetch_surah(2)
+        _settle(prefetcher)
+        assert prefetcher.issued == 2
+        assert client.fetch_surah(3).number == 3
+        assert client.fetch_surah(1).number == 1
+        # Each neighbour was requested once, by the prefetcher.
+        urls = [url for _, url, _ in transport.calls]
+        assert urls.count(urls[0].replace("/2/", "/3/")) == 1
+        assert urls.count(urls[0].replace("/2/", "/1/")) == 1
+        assert prefetcher.used == 2
+
+
+def test_reading_on_prefetches_ahead():
+    prefetcher = Prefetcher(radius=0)
+    client, transport = _client(prefetcher)
+    with client:
+        client.fetch_ayah("1:1")
+        client.fetch_ayah("1:2")
+        _settle(prefetcher)
+        # The second read in one direction doubles the window to two ayahs.
+        assert prefetcher.issued == 2
+        assert sorted(url.split("/")[-2] for _, url, _ in transport.calls[2:]) == ["1:3", "1:4"]
+    assert prefetcher._executor is None
+
+
+def test_out_of_range_reads_prefetch_nothing():
+    prefetcher = Prefetcher()
+    client, transport = _client(prefetcher)
+    with client:
+        client.fetch_surah(1)
+        _settle(prefetcher)
+        assert prefetcher.issued == 2
+        assert all("/surah/0" not in url for _, url, _ in transport.calls)
+
+
+def test_async_client_needs_async_with():
+    async def main():
+        client = AsyncClient()
+        with pytest.raises(TypeError, match="async with"):
+            with client:
+                pass
+        async with client as entered:
+            assert entered is client
+
+    asyncio.run(main())
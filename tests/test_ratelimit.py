@@ -0,0 +1,88 @@
+import json
+import time
+
+from email.utils import formatdate
+
+import pytest
+
+from holybooks import HTTPClient, LocalTransport, RateLimiter, TokenBucket, TooManyRequests
+from holybooks import http as http_module
+from _quran import QuranApi
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(http_module.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def _limited(responses):
+    # Answers with the given (status, headers) in turn, then with the API.
+    api = QuranApi()
+    responses = list(responses)
+
+    def handler(method, url, params):
+        if responses:
+            status, headers = responses.pop(0)
+            return status, json.dumps({"code": status, "data": "slow down"}), headers
+        return api(method, url, params)
+    return handler
+
+
+def _http(handler, rate_limiter=None):
+    transport = LocalTransport(fallback=handler)
+    return HTTPClient(transport=transport, quran_translation="en.test", rate_limiter=rate_limiter, coalesce=False), transport
+
+
+def test_retry_after_seconds_and_dates():
+    limiter = RateLimiter(buckets={})
+    assert limiter.backoff("http://x", 0, "3") == 3.0
+    assert 8 <= limiter.backoff("http://x", 0, formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert 0 <= limiter.backoff("http://x", 3, None) <= limiter.backoff_base * 2 ** 3
+
+
+def test_retry_after_is_capped_at_backoff_max():
+    limiter = RateLimiter(buckets={}, backoff_max=5)
+    assert limiter.backoff("http://x", 0, "3600") == 5
+
+
+def test_retries_run_out():
+    limiter = RateLimiter(buckets={}, max_retries=2)
+    assert limiter.backoff("http://x", 2, "1") is None
+
+
+def test_backoff_pauses_the_host_bucket():
+    bucket = TokenBucket(100, 100)
+    limiter = RateLimiter(buckets={"api.alquran.cloud": bucket})
+    limiter.backoff("http://api.alquran.cloud/v1/ayah/1", 0, "2")
+    assert 1.9 < bucket.reserve() <= 2
+
+
+def test_token_bucket_spaces_requests_out():
+    bucket = TokenBucket(10, 2)
+    assert bucket.reserve() == 0 and bucket.reserve() == 0
+    assert 0.09 < bucket.reserve() <= 0.1
+
+
+def test_429_is_retried_after_the_advertised_delay(sleeps):
+    http, transport = _http(_limited([(429, {"Retry-After": "2"}), (429, {})]), RateLimiter(buckets={}))
+    ayah = http.fetch_chapter_verse(citation="1:1")
+    assert ayah["data"]["number"] == 1
+    assert len(transport.calls) == 3
+    assert sleeps[0] == 2 and len(sleeps) == 2
+
+
+def test_429_without_a_rate_limiter_raises(sleeps):
+    http, transport = _http(_limited([(429, {"Retry-After": "2"})]))
+    with pytest.raises(TooManyRequests):
+        http.fetch_chapter_verse(citation="1:1")
+    assert sleeps == []
+
+
+def test_429_raises_once_retries_are_exhausted(sleeps):
+    http, transport = _http(_limited([(429, {"Retry-After": "1"})] * 3), RateLimiter(buckets={}, max_retries=2))
+    with pytest.raises(TooManyRequests):
+        http.fetch_chapter_verse(citation="1:1")
+    assert sleeps == [1, 1]
+    assert len(transport.calls) == 3
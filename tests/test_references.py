@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from holybooks import HTTPClient, InvalidReference, LocalTransport, parse_reference
+
+
+def _verses(*keys):
+    # A bible-api.com response holding the given (chapter, verse) pairs of 3 John.
+    return {
+        "reference": "3 John",
+        "verses": [
+            {"book_id": "3JN", "book_name": "3 John", "chapter": chapter, "verse": verse, "text": f"{chapter}:{verse}"}
+            for chapter, verse in keys
+        ],
+        "text": "",
+        "translation_id": "web",
+        "translation_name": "World English Bible",
+        "translation_note": "Public Domain",
+    }
+
+
+def _client(response, **kwargs):
+    transport = LocalTransport(fallback=lambda method, url, params: (200, json.dumps(response)))
+    return HTTPClient(transport=transport, coalesce=False, **kwargs), transport
+
+
+def test_kjv_counts_are_checked():
+    with pytest.raises(InvalidReference):
+        parse_reference("3 John", "1:15")
+    with pytest.raises(InvalidReference):
+        parse_reference("Revelation", "12:18")
+
+
+def test_counts_can_be_skipped():
+    assert parse_reference("3 John", "1:15", counts=False).citation() == "1:15"
+    assert parse_reference("Revelation", "12:18", counts=False).citation() == "12:18"
+    with pytest.raises(InvalidReference):
+        parse_reference("3 John", "1:0", counts=False)
+    with pytest.raises(InvalidReference):
+        parse_reference("Nowhere", "1:1", counts=False)
+
+
+def test_kjv_client_rejects_verses_past_the_table():
+    http, transport = _client(_verses((1, 15)))
+    with pytest.raises(InvalidReference):
+        http.fetch_chapter_verse("3 John", citation="1:15")
+    assert transport.calls == []
+
+
+def test_other_translations_are_left_to_the_api():
+    http, transport = _client(_verses((1, 15)), bible_translation="web")
+    verse = http.fetch_chapter_verse("3 John", citation="1:15")
+    assert verse["verse"] == 15
+    assert transport.calls[0][1] == "https://bible-api.com/3%20john1:15?translation=web"
+
+    http, transport = _client(_verses((1, 15)))
+    assert http.fetch_chapter_verse("3 John", citation="1:15", translation="web")["verse"] == 15
+
+
+def test_other_translations_still_check_the_book_and_syntax():
+    http, transport = _client(_verses((1, 15)), bible_translation="web")
+    with pytest.raises(InvalidReference):
+        http.fetch_chapter_verse("Nowhere", citation="1:15")
+    with pytest.raises(InvalidReference):
+        http.fetch_chapter_verse("3 John", citation="1:x")
+    assert transport.calls == []
+
+
+def test_passages_in_other_translations_are_sent_as_written():
+    chapter = json.dumps(_verses(*((1, verse) for verse in range(1, 16))))
+    transport = LocalTransport({
+        "https://bible-api.com/3%20john1?translation=web": (200, chapter),
+        "https://bible-api.com/3%20john1:15?translation=web": (200, json.dumps(_verses((1, 15)))),
+    })
+    http = HTTPClient(transport=transport, coalesce=False, bible_translation="web")
+    passages = http.fetch_passages([("3 John", "1"), ("3 John", "1:15")])
+    assert [verse["verse"] for verse in passages[0]] == list(range(1, 16))
+    assert [verse["verse"] for verse in passages[1]] == [15]
+    assert [url for _, url, _ in transport.calls] == [
+        "https://bible-api.com/3%20john1?translation=web",
+        "https://bible-api.com/3%20john1:15?translation=web",
+    ]
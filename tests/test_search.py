@@ -0,0 +1,98 @@
+import pytest
+
+from holybooks import Client, LocalTransport, SearchIndex
+from _quran import QuranApi
+
+
+def _ayah(number, text, surah=1):
+    return {"number": number, "text": text, "surah": {"number": surah}}
+
+
+@pytest.fixture
+def index():
+    return SearchIndex([
+        _ayah(1, "the mercy of god"),
+        _ayah(2, "mercy mercy mercy"),
+        _ayah(3, "god is merciful and mercy is his"),
+        _ayah(4, "mercy of the lord", surah=2),
+        _ayah(5, "لِلَّهِ رَبِّ الْعَالَمِينَ", surah=2),
+    ])
+
+
+def _numbers(ayahs):
+    return [ayah["number"] for ayah in ayahs]
+
+
+def test_results_are_ranked_by_bm25(index):
+    # Most occurrences first, the longest ayah last, equal scores in index order.
+    assert _numbers(index.search("mercy")) == [2, 1, 4, 3]
+    assert _numbers(index.search("mercy", sort="mushaf")) == [1, 2, 3, 4]
+
+
+def test_every_term_must_match(index):
+    assert _numbers(index.search("mercy god", sort="mushaf")) == [1, 3]
+    assert index.search("mercy nothing") == []
+
+
+def test_quoted_phrases_match_in_order(index):
+    assert _numbers(index.search('"mercy of"', sort="mushaf")) == [1, 4]
+    assert index.search('"of mercy"') == []
+
+
+def test_prefix_terms(index):
+    assert _numbers(index.search("merci*")) == [3]
+    assert _numbers(index.search("merc*", sort="mushaf")) == [1, 2, 3, 4]
+
+
+def test_chapter_filter_and_limit(index):
+    assert _numbers(index.search("mercy", 2)) == [4]
+    assert len(index.search("mercy", limit=2)) == 2
+
+
+def test_arabic_is_searched_without_diacritics(index):
+    assert _numbers(index.search("العالمين")) == [5]
+
+
+def test_results_are_copies(index):
+    result = index.search("lord")[0]
+    result["text"] = "changed"
+    result["surah"]["number"] = 9
+    assert index.search("lord") == [_ayah(4, "mercy of the lord", surah=2)]
+
+
+def test_unknown_sort_is_rejected(index):
+    with pytest.raises(ValueError):
+        index.search("mercy", sort="random")
+
+
+def _client():
+    transport = LocalTransport(fallback=QuranApi())
+    return Client(transport=transport, quran_translation="en.test"), transport
+
+
+def test_client_searches_locally_once_indexed():
+    client, transport = _client()
+    client.build_search_index()
+    calls = len(transport.calls)
+    ayahs = client.search("ayah 2 255")
+    assert ayahs[0].number == 262
+    assert len(transport.calls) == calls
+
+
+def test_client_sort_without_a_local_index():
+    client, transport = _client()
+    assert [ayah.number for ayah in client.search("ayah 3 20", sort="mushaf")] == [313, 493]
+    with pytest.raises(ValueError):
+        client.search("ayah", sort="relevance")
+    with pytest.raises(ValueError):
+        client.search("ayah", sort="random")
+    assert len(transport.calls) == 1
+
+
+def test_mirroring_again_drops_the_index():
+    client, _ = _client()
+    index = client.build_search_index()
+    client.mirror_quran()
+    assert "en.test" not in client.search_indexes
+    client.search("ayah")
+    assert client.search_indexes["en.test"] is not index
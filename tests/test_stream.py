@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from holybooks import Client, HTTPClient, LocalTransport, Hooks, RateLimiter, NotFound
+from holybooks.decoder import ArrayStream
+from _quran import QuranApi, quran_payload
+
+DOCUMENT = {
+    "code": 200,
+    "data": {
+        "surahs": [
+            {"name": "ٱلْفَاتِحَة", "text": 'brackets ] [ } { and "quotes" \\ inside', "ayahs": [[1, 2], {"a": []}]},
+            {"name": "second", "ayahs": []},
+            {"name": "third", "nested": {"surahs": [1]}},
+        ],
+        "edition": {"identifier": "en.test"},
+    },
+    "status": "OK",
+}
+
+
+def _feed(body, size):
+    parser = ArrayStream("surahs")
+    items = []
+    for start in range(0, len(body), size):
+        items.extend(parser.feed(body[start:start + size]))
+    items.extend(parser.close())
+    return parser, items
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10 ** 6])
+def test_array_stream_survives_any_chunk_boundary(size):
+    body = json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8")
+    parser, items = _feed(body, size)
+    assert items == DOCUMENT["data"]["surahs"]
+    assert parser.document == {**DOCUMENT, "data": {**DOCUMENT["data"], "surahs": []}}
+
+
+def test_array_stream_yields_items_before_the_body_ends():
+    body = json.dumps(DOCUMENT).encode("utf-8")
+    parser = ArrayStream("surahs")
+    cut = body.index(b'"second"')
+    assert [item["ayahs"] for item in parser.feed(body[:cut])] == [[[1, 2], {"a": []}]]
+
+
+def test_array_stream_keeps_documents_without_the_array():
+    parser, items = _feed(b'{"code": 404, "data": "Not found."}', 5)
+    assert items == []
+    assert parser.document == {"code": 404, "data": "Not found."}
+
+
+def test_array_stream_raises_on_a_truncated_body():
+    body = json.dumps(DOCUMENT).encode("utf-8")
+    parser = ArrayStream("surahs")
+    parser.feed(body[:body.index(b'"second"') + 12])
+    with pytest.raises(json.JSONDecodeError):
+        parser.close()
+
+
+def _http(**kwargs):
+    transport = LocalTransport(fallback=QuranApi())
+    return HTTPClient(transport=transport, quran_translation="en.test", **kwargs)
+
+
+def test_stream_quran_matches_fetch_quran():
+    transport = LocalTransport(fallback=QuranApi())
+    client = Client(transport=transport, quran_translation="en.test")
+    surahs = list(client.stream_quran(chunk_size=1000))
+    assert [surah.number for surah in surahs] == [1, 2, 3]
+    assert [len(surah.ayats) for surah in surahs] == [len(surah.ayats) for surah in client.fetch_quran().surahs]
+    # One translation for every surah, completed from the edition that arrives after them.
+    assert all(surah.translation is surahs[0].translation for surah in surahs)
+    assert surahs[0].translation.language == "en"
+
+
+def test_stream_book_raises_not_found():
+    with pytest.raises(NotFound):
+        list(_http().stream_book(translation="en.missing"))
+
+
+def test_stopping_early_is_not_reported_as_a_failure():
+    ends = []
+    hooks = Hooks()
+    hooks.on("request_end", lambda **event: ends.append((event["status"], event["error"])))
+    stream = _http(hooks=hooks).stream_book(chunk_size=100)
+    next(stream)
+    stream.close()
+    assert ends == [(200, None)]
+
+
+def test_the_rate_limiter_slot_is_released_once_streaming_starts():
+    limiter = RateLimiter(buckets={}, max_in_flight=1)
+    stream = _http(rate_limiter=limiter).stream_book(chunk_size=100)
+    next(stream)
+    assert limiter._semaphore.acquire(blocking=False)
+    limiter._semaphore.release()
+    assert len(list(stream)) == 2
+
+
+def test_streamed_surahs_match_the_payload():
+    expected = quran_payload()["data"]["surahs"]
+    surahs = list(_http().stream_book(chunk_size=333))
+    assert [surah["ayahs"] for surah in surahs] == [surah["ayahs"] for surah in expected]
+    assert surahs[0]["translation"]["identifier"] == "en.test"